@@ -5,7 +5,8 @@ a = Analysis(
     ['blogger_gui\\main.py'],
     pathex=[],
     binaries=[],
-    datas=[('blogger_gui', 'blogger_gui')],
+    # The Blogger discovery document the API client builds its service from
+    datas=[('blogger_gui', 'blogger_gui'), ('blogger_gui\\api\\blogger.v3.json', 'blogger_gui\\api')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -4,14 +4,276 @@ Blogger API Client Module
 This module handles authentication and API requests to the Blogger API.
 """
 
+import json
 import os
 import pickle
+import sqlite3
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple
 
-from google.auth.transport.requests import Request
+import requests
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build, Resource
+from googleapiclient.discovery import build_from_document, Resource
+from googleapiclient.http import build_http
+
+
+def _timestamp(value: Optional[str]) -> float:
+    """
+    Convert an RFC 3339 timestamp of the API to seconds since the epoch
+    
+    Args:
+        value: A timestamp such as '2025-06-23T10:00:00.000-07:00'
+        
+    Returns:
+        Seconds since the epoch, 0 if value is empty
+    """
+    if not value:
+        return 0.0
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value).timestamp()
+
+
+class _CredentialSavingHttp(AuthorizedHttp):
+    """
+    Authorized HTTP connection that writes refreshed credentials back to the token file
+    
+    An expired access token is refreshed by the first request (or batch call) that needs it;
+    saving the new token spares the next start the same refresh.
+    """
+    
+    def __init__(self, credentials, save: Callable[[Any], None]):
+        """
+        Initialize the connection
+        
+        Args:
+            credentials: The OAuth2 credentials requests are authorized with
+            save: Called with the credentials whenever their access token changed
+        """
+        super().__init__(credentials, http=build_http())
+        self._save = save
+        self._saved_token = credentials.token
+        
+    def request(self, *args, **kwargs):
+        """Send a request, saving the credentials if it (or a batch call before it) refreshed them"""
+        try:
+            return super().request(*args, **kwargs)
+        finally:
+            if self.credentials.token != self._saved_token:
+                self._saved_token = self.credentials.token
+                self._save(self.credentials)
+
+
+class PostCache:
+    """
+    Local SQLite store of blogs, post and page summaries, and full posts and pages
+    
+    Summaries are the rows the lists show. Full posts are stored with their 'updated'
+    timestamp, so a post that did not change since it was last opened loads without a request.
+    Posts and pages share the tables and are told apart by kind ('post' or 'page').
+    The listings table records, per blog and kind, whether a listing went through every page
+    and the revalidation watermark: the newest 'updated' time a completed listing or
+    revalidation saw. Storing a single post never moves the watermark.
+    """
+    
+    SCHEMA_VERSION = 2
+    SUMMARY_FIELDS = ('id', 'title', 'url', 'published', 'updated', 'labels', 'status')
+    
+    def __init__(self, path: str):
+        """
+        Open the cache, creating it if needed
+        
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Written from the API worker thread and read from the UI thread
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        # IDs returned by listings that started at the first page, by (blog_id, kind)
+        self._listings: Dict[Tuple[str, str], set] = {}
+        # Newest 'updated' time those listings returned so far
+        self._listing_updates: Dict[Tuple[str, str], Optional[float]] = {}
+        self._create_schema()
+        
+    def _create_schema(self):
+        """Create the tables, dropping a cache written with another schema version"""
+        with self._lock, self._connection as db:
+            if db.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                for table in ('blogs', 'summaries', 'items', 'listings'):
+                    db.execute(f'DROP TABLE IF EXISTS {table}')
+                db.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+            db.execute('CREATE TABLE IF NOT EXISTS blogs (position INTEGER, id TEXT PRIMARY KEY, data TEXT)')
+            db.execute('CREATE TABLE IF NOT EXISTS summaries (blog_id TEXT, kind TEXT, id TEXT, published REAL, '
+                       'updated REAL, data TEXT, PRIMARY KEY (blog_id, kind, id))')
+            db.execute('CREATE TABLE IF NOT EXISTS items (blog_id TEXT, kind TEXT, id TEXT, updated TEXT, data TEXT, '
+                       'PRIMARY KEY (blog_id, kind, id))')
+            db.execute('CREATE TABLE IF NOT EXISTS listings (blog_id TEXT, kind TEXT, complete INTEGER, '
+                       'watermark REAL, PRIMARY KEY (blog_id, kind))')
+            
+    def close(self):
+        """Close the database"""
+        self._connection.close()
+        
+    def get_blogs(self) -> List[Dict[str, Any]]:
+        """Get the cached blogs in the order the API returned them"""
+        with self._lock:
+            rows = self._connection.execute('SELECT data FROM blogs ORDER BY position').fetchall()
+        return [json.loads(data) for data, in rows]
+        
+    def put_blogs(self, blogs: List[Dict[str, Any]]):
+        """Replace the cached blogs"""
+        with self._lock, self._connection as db:
+            db.execute('DELETE FROM blogs')
+            db.executemany('INSERT OR REPLACE INTO blogs VALUES (?, ?, ?)',
+                           [(position, blog.get('id'), json.dumps(blog)) for position, blog in enumerate(blogs)])
+            
+    def get_summaries(self, blog_id: str, kind: str) -> List[Dict[str, Any]]:
+        """
+        Get the cached summaries of a blog, newest first
+        
+        Args:
+            blog_id: The ID of the blog
+            kind: 'post' or 'page'
+            
+        Returns:
+            List of summary dictionaries
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT data FROM summaries WHERE blog_id = ? AND kind = ? ORDER BY published DESC, id',
+                (blog_id, kind)
+            ).fetchall()
+        return [json.loads(data) for data, in rows]
+        
+    def put_summaries(self, blog_id: str, kind: str, items: Iterable[Dict[str, Any]]):
+        """Store summaries of posts or pages, replacing older versions"""
+        rows = []
+        for item in items:
+            summary = {field: item[field] for field in self.SUMMARY_FIELDS if field in item}
+            rows.append((blog_id, kind, item.get('id'), _timestamp(item.get('published')),
+                         _timestamp(item.get('updated')), json.dumps(summary)))
+        with self._lock, self._connection as db:
+            db.executemany('INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?, ?)', rows)
+            
+    def add_listing_page(self, blog_id: str, kind: str, items: List[Dict[str, Any]],
+                         first: bool, last: bool):
+        """
+        Store a page of a list call
+        
+        When a listing that started at the first page reaches the last one, summaries it
+        did not return are dropped, the blog's listing is marked complete and the watermark
+        advances to the newest 'updated' time the listing returned.
+        
+        Args:
+            blog_id: The ID of the blog
+            kind: 'post' or 'page'
+            items: The items of the page
+            first: Whether this is the first page
+            last: Whether this is the last page
+        """
+        self.put_summaries(blog_id, kind, items)
+        key = (blog_id, kind)
+        if first:
+            self._listings[key] = set()
+            self._listing_updates[key] = None
+        seen = self._listings.get(key)
+        if seen is None:
+            return
+        seen.update(item.get('id') for item in items)
+        self._listing_updates[key] = self._newest(items, self._listing_updates[key])
+        if not last:
+            return
+        del self._listings[key]
+        latest = self._listing_updates.pop(key)
+        with self._lock, self._connection as db:
+            cached = [row[0] for row in db.execute(
+                'SELECT id FROM summaries WHERE blog_id = ? AND kind = ?', key)]
+            self._delete(db, blog_id, kind, [item_id for item_id in cached if item_id not in seen])
+            self._advance(db, blog_id, kind, latest, complete=True)
+            
+    def advance_watermark(self, blog_id: str, kind: str, items: Iterable[Dict[str, Any]]):
+        """
+        Move the watermark to the newest 'updated' time of items a completed revalidation returned
+        
+        Args:
+            blog_id: The ID of the blog
+            kind: 'post' or 'page'
+            items: Summaries of every item the revalidation found changed
+        """
+        latest = self._newest(items)
+        if latest is None:
+            return
+        with self._lock, self._connection as db:
+            self._advance(db, blog_id, kind, latest, complete=False)
+            
+    @staticmethod
+    def _newest(items: Iterable[Dict[str, Any]], latest: Optional[float] = None) -> Optional[float]:
+        """Get the newest 'updated' time of items, starting from latest"""
+        for item in items:
+            if item.get('updated'):
+                latest = max(latest or 0.0, _timestamp(item['updated']))
+        return latest
+        
+    @staticmethod
+    def _advance(db, blog_id: str, kind: str, latest: Optional[float], complete: bool):
+        """Raise the watermark to latest, and mark the listing complete if it is, within a transaction"""
+        db.execute('INSERT INTO listings VALUES (?, ?, ?, ?) ON CONFLICT (blog_id, kind) DO UPDATE SET '
+                   'complete = MAX(complete, excluded.complete), '
+                   'watermark = MAX(COALESCE(watermark, excluded.watermark), COALESCE(excluded.watermark, watermark))',
+                   (blog_id, kind, int(complete), latest))
+            
+    def is_complete(self, blog_id: str, kind: str) -> bool:
+        """Check whether the summaries hold every post or page of a blog"""
+        with self._lock:
+            return self._connection.execute(
+                'SELECT 1 FROM listings WHERE blog_id = ? AND kind = ? AND complete', (blog_id, kind)
+            ).fetchone() is not None
+            
+    def watermark(self, blog_id: str, kind: str) -> Optional[float]:
+        """
+        Get the time revalidation fetches changes from, in seconds since the epoch
+        
+        Returns:
+            The newest 'updated' time a completed listing or revalidation saw, None before the first
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT watermark FROM listings WHERE blog_id = ? AND kind = ?', (blog_id, kind)
+            ).fetchone()
+        return row[0] if row else None
+            
+    def get_item(self, blog_id: str, kind: str, item_id: str) -> Optional[Dict[str, Any]]:
+        """Get a cached full post or page, or None"""
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT data FROM items WHERE blog_id = ? AND kind = ? AND id = ?', (blog_id, kind, item_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+        
+    def put_item(self, blog_id: str, kind: str, item: Dict[str, Any]):
+        """Store a full post or page and its summary, leaving the watermark where it is"""
+        with self._lock, self._connection as db:
+            db.execute('INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?)',
+                       (blog_id, kind, item.get('id'), item.get('updated'), json.dumps(item)))
+        self.put_summaries(blog_id, kind, [item])
+        
+    def remove(self, blog_id: str, kind: str, item_ids: List[str]):
+        """Drop posts or pages that were deleted"""
+        with self._lock, self._connection as db:
+            self._delete(db, blog_id, kind, item_ids)
+            
+    @staticmethod
+    def _delete(db, blog_id: str, kind: str, item_ids: List[str]):
+        """Delete summaries and full items within a transaction"""
+        rows = [(blog_id, kind, item_id) for item_id in item_ids]
+        db.executemany('DELETE FROM summaries WHERE blog_id = ? AND kind = ? AND id = ?', rows)
+        db.executemany('DELETE FROM items WHERE blog_id = ? AND kind = ? AND id = ?', rows)
 
 
 class BloggerApiClient:
@@ -21,49 +283,141 @@ class BloggerApiClient:
     SCOPES = ['https://www.googleapis.com/auth/blogger']
     API_SERVICE_NAME = 'blogger'
     API_VERSION = 'v3'
+    TOKEN_FILE = 'token.pickle'
+    
+    # The service is built from a local discovery document: the copy shipped with the
+    # package, or a newer revision saved by refresh_discovery_document
+    BUNDLED_DISCOVERY_PATH = str(Path(__file__).with_name(f'{API_SERVICE_NAME}.{API_VERSION}.json'))
+    DISCOVERY_CACHE_PATH = str(Path.home() / '.blogger_gui' / f'{API_SERVICE_NAME}.{API_VERSION}.json')
+    DISCOVERY_URL = f'https://{API_SERVICE_NAME}.googleapis.com/$discovery/rest?version={API_VERSION}'
+    DISCOVERY_MAX_AGE = 7 * 24 * 3600
+    
+    # Requests sent in one batch call by the bulk methods
+    BATCH_LIMIT = 50
+    
+    # Partial-response projections for list calls; 'full' returns whole resources
+    FIELD_PRESETS = {
+        'ids-only': 'nextPageToken,items(id)',
+        'listing': 'nextPageToken,items(id,title,url,published,updated,labels,status)',
+        'full': None,
+    }
+    
+    # Where the GUI keeps its local cache
+    DEFAULT_CACHE_PATH = str(Path.home() / '.blogger_gui' / 'cache.sqlite3')
     
-    def __init__(self, credentials_file: str = 'credentials.json'):
+    def __init__(self, credentials_file: str = 'credentials.json', cache_path: Optional[str] = None):
         """
         Initialize the Blogger API client
         
         Args:
             credentials_file: Path to the credentials JSON file from Google Developer Console
+            cache_path: Path of the local SQLite cache, or None to work without one
         """
         self.credentials_file = credentials_file
         self.service = None
+        self.cache = PostCache(cache_path) if cache_path else None
+        self.discovery_cache_path = self.DISCOVERY_CACHE_PATH
+        
+    def has_saved_credentials(self) -> bool:
+        """
+        Check whether credentials of an earlier login are stored
+        
+        Returns:
+            bool: True if authenticate() can work without the login flow
+        """
+        return Path(self.TOKEN_FILE).exists()
         
     def authenticate(self) -> bool:
         """
         Authenticate with the Blogger API using OAuth2
         
+        Saved credentials are used as they are: an expired access token is refreshed
+        by the first API request rather than here, so building the service needs no network.
+        Refreshed credentials are written back to the token file.
+        
         Returns:
             bool: True if authentication was successful
         """
         creds = None
         
         # The file token.pickle stores the user's access and refresh tokens
-        token_path = Path('token.pickle')
+        token_path = Path(self.TOKEN_FILE)
         if token_path.exists():
             with open(token_path, 'rb') as token:
                 creds = pickle.load(token)
                 
-        # If there are no (valid) credentials available, let the user log in
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                if not Path(self.credentials_file).exists():
-                    return False
-                
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_file, self.SCOPES)
-                creds = flow.run_local_server(port=0)
-                
+        # If there are no usable credentials available, let the user log in
+        if not creds or not (creds.valid or creds.refresh_token):
+            if not Path(self.credentials_file).exists():
+                return False
+            
+            flow = InstalledAppFlow.from_client_secrets_file(
+                self.credentials_file, self.SCOPES)
+            creds = flow.run_local_server(port=0)
+            
             # Save the credentials for the next run
-            with open(token_path, 'wb') as token:
-                pickle.dump(creds, token)
+            self._save_credentials(creds)
                 
-        self.service = build(self.API_SERVICE_NAME, self.API_VERSION, credentials=creds)
+        self.service = build_from_document(self._discovery_document(),
+                                           http=_CredentialSavingHttp(creds, self._save_credentials))
+        return True
+        
+    def _save_credentials(self, creds):
+        """
+        Write credentials to the token file for the next run
+        
+        Args:
+            creds: The OAuth2 credentials
+        """
+        token_path = Path(self.TOKEN_FILE)
+        tmp_path = token_path.with_name(token_path.name + '.part')
+        with open(tmp_path, 'wb') as token:
+            pickle.dump(creds, token)
+        os.replace(tmp_path, token_path)
+        
+    def _discovery_document(self) -> Dict[str, Any]:
+        """
+        Load the discovery document the service is built from
+        
+        Returns:
+            The newest revision of the bundled and the cached document
+        """
+        documents = []
+        for path in (self.discovery_cache_path, self.BUNDLED_DISCOVERY_PATH):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    documents.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return max(documents, key=lambda document: document.get('revision', ''))
+        
+    def refresh_discovery_document(self, max_age: Optional[float] = None) -> bool:
+        """
+        Download the current discovery document for the next start, if the cached one is old
+        
+        Args:
+            max_age: Age in seconds after which the cached document is downloaded again;
+                defaults to DISCOVERY_MAX_AGE
+            
+        Returns:
+            bool: True if a document was downloaded
+        """
+        max_age = self.DISCOVERY_MAX_AGE if max_age is None else max_age
+        cache_path = Path(self.discovery_cache_path)
+        if cache_path.exists() and time.time() - cache_path.stat().st_mtime < max_age:
+            return False
+        
+        response = requests.get(self.DISCOVERY_URL, timeout=30)
+        response.raise_for_status()
+        document = response.json()
+        if document.get('name') != self.API_SERVICE_NAME or document.get('version') != self.API_VERSION:
+            return False
+        
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + '.part')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+        os.replace(tmp_path, cache_path)
         return True
         
     def get_blogs(self) -> List[Dict[str, Any]]:
@@ -78,15 +432,53 @@ class BloggerApiClient:
                 return []
             
         blogs = self.service.blogs().listByUser(userId='self').execute()
-        return blogs.get('items', [])
+        items = blogs.get('items', [])
+        if self.cache:
+            self.cache.put_blogs(items)
+        return items
+        
+    def get_cached_blogs(self) -> List[Dict[str, Any]]:
+        """
+        Get the blogs stored by the last get_blogs call, without a request
+        
+        Returns:
+            List of blog information dictionaries, empty without a cache
+        """
+        return self.cache.get_blogs() if self.cache else []
+        
+    def _projection(self, fields: Optional[str]) -> Dict[str, Any]:
+        """
+        Build the keyword arguments applying a field projection to a list call
+        
+        Args:
+            fields: A FIELD_PRESETS name, a raw fields expression, or None for full resources
+            
+        Returns:
+            Keyword arguments with 'fields' and 'fetchBodies' where applicable
+        """
+        expression = self.FIELD_PRESETS.get(fields, fields)
+        if not expression:
+            return {}
+        kwargs = {'fields': expression}
+        if 'content' not in expression:
+            kwargs['fetchBodies'] = False
+        return kwargs
+        
+    def _caches_listing(self, fields: Optional[str]) -> bool:
+        """Check whether list results with a projection hold the summaries the cache keeps"""
+        expression = self.FIELD_PRESETS.get(fields, fields)
+        return bool(self.cache) and expression in (None, self.FIELD_PRESETS['listing'])
         
-    def get_posts(self, blog_id: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    def get_posts(self, blog_id: str, max_results: int = 10,
+                  fields: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get posts from a specific blog
         
         Args:
             blog_id: The ID of the blog to get posts from
             max_results: Maximum number of posts to return
+            fields: Field projection, a FIELD_PRESETS name or a raw fields expression.
+                Projections without 'content' skip fetching the post bodies.
             
         Returns:
             List of post information dictionaries
@@ -97,11 +489,141 @@ class BloggerApiClient:
             
         posts = self.service.posts().list(
             blogId=blog_id,
-            maxResults=max_results
+            maxResults=max_results,
+            **self._projection(fields)
         ).execute()
         
         return posts.get('items', [])
         
+    def get_posts_page(self, blog_id: str, page_token: Optional[str] = None, max_results: int = 20,
+                       fields: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of posts from a specific blog
+        
+        Args:
+            blog_id: The ID of the blog to get posts from
+            page_token: The nextPageToken of the previous page, or None for the first page
+            max_results: Maximum number of posts in the page
+            fields: Field projection, a FIELD_PRESETS name or a raw fields expression
+            
+        Returns:
+            The posts of the page and the token of the next page (None after the last page)
+        """
+        if not self.service:
+            if not self.authenticate():
+                return [], None
+            
+        kwargs = {'blogId': blog_id, 'maxResults': max_results, **self._projection(fields)}
+        if page_token:
+            kwargs['pageToken'] = page_token
+        response = self.service.posts().list(**kwargs).execute()
+        
+        items, next_token = response.get('items', []), response.get('nextPageToken')
+        if self._caches_listing(fields):
+            self.cache.add_listing_page(blog_id, 'post', items, first=not page_token, last=not next_token)
+        return items, next_token
+        
+    def get_cached_posts(self, blog_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the post summaries stored for a blog, without a request
+        
+        Args:
+            blog_id: The ID of the blog
+            
+        Returns:
+            List of post summaries, newest first; empty without a cache
+        """
+        return self.cache.get_summaries(blog_id, 'post') if self.cache else []
+        
+    def has_all_posts_cached(self, blog_id: str) -> bool:
+        """
+        Check whether the cache holds every post of a blog, as of its last revalidation
+        
+        Args:
+            blog_id: The ID of the blog
+            
+        Returns:
+            True once a listing of the blog went through all pages
+        """
+        return bool(self.cache) and self.cache.is_complete(blog_id, 'post')
+        
+    def revalidate_posts(self, blog_id: str, max_results: int = 50) -> List[Dict[str, Any]]:
+        """
+        Fetch the posts that changed since the cached ones
+        
+        Posts are listed by their 'updated' time, newest first, until the first post that is
+        older than the cache's watermark. Only those summaries are stored, and the watermark
+        advances once the listing got that far.
+        Posts deleted on the server are not detected; a full listing drops them.
+        
+        Args:
+            blog_id: The ID of the blog
+            max_results: Maximum number of posts per request
+            
+        Returns:
+            Summaries of the new and updated posts
+        """
+        if not self.service:
+            if not self.authenticate():
+                return []
+            
+        since = self.cache.watermark(blog_id, 'post') if self.cache else None
+        changed = []
+        page_token = None
+        while True:
+            kwargs = {'blogId': blog_id, 'maxResults': max_results, 'orderBy': 'UPDATED',
+                      **self._projection('listing')}
+            if page_token:
+                kwargs['pageToken'] = page_token
+            response = self.service.posts().list(**kwargs).execute()
+            
+            # Posts updated in the same second as the watermark are fetched again
+            items = response.get('items', [])
+            newer = [item for item in items if since is None or _timestamp(item.get('updated')) >= since]
+            changed.extend(newer)
+            page_token = response.get('nextPageToken')
+            if len(newer) < len(items) or not page_token:
+                break
+            
+        if self.cache:
+            self.cache.put_summaries(blog_id, 'post', changed)
+            self.cache.advance_watermark(blog_id, 'post', changed)
+        return changed
+        
+    def get_post(self, blog_id: str, post_id: str, updated: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get a specific post
+        
+        Args:
+            blog_id: The ID of the blog containing the post
+            post_id: The ID of the post to retrieve
+            updated: The 'updated' time of the post's summary; a cached post
+                with the same time is returned without a request
+            
+        Returns:
+            The post information dictionary
+        """
+        if self.cache and updated:
+            post = self.cache.get_item(blog_id, 'post', post_id)
+            if post and post.get('updated') == updated:
+                return post
+            
+        if not self.service:
+            if not self.authenticate():
+                return {}
+            
+        try:
+            post = self.service.posts().get(
+                blogId=blog_id,
+                postId=post_id
+            ).execute()
+        except Exception:
+            return {}
+        
+        if self.cache:
+            self.cache.put_item(blog_id, 'post', post)
+        return post
+        
     def create_post(self, blog_id: str, title: str, content: str, 
                     labels: Optional[List[str]] = None, is_draft: bool = True,
                     publish_date: Optional[str] = None, url: Optional[str] = None,
@@ -154,6 +676,8 @@ class BloggerApiClient:
             body=post_body
         ).execute()
         
+        if self.cache:
+            self.cache.put_item(blog_id, 'post', post)
         return post
         
     def update_post(self, blog_id: str, post_id: str, title: str, 
@@ -206,6 +730,8 @@ class BloggerApiClient:
             body=post_body
         ).execute()
         
+        if self.cache:
+            self.cache.put_item(blog_id, 'post', post)
         return post
         
     def delete_post(self, blog_id: str, post_id: str) -> bool:
@@ -225,17 +751,150 @@ class BloggerApiClient:
             
         try:
             self.service.posts().delete(blogId=blog_id, postId=post_id).execute()
-            return True
         except Exception:
             return False
         
-    def get_pages(self, blog_id: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        if self.cache:
+            self.cache.remove(blog_id, 'post', [post_id])
+        return True
+        
+    def _execute_batch(self, requests_by_id: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Execute requests in batch calls of at most BATCH_LIMIT requests
+        
+        Args:
+            requests_by_id: Unexecuted API requests by the ID of the item they are for
+            
+        Returns:
+            The responses of the successful requests and the error messages of the failed ones, by ID;
+            every ID is in exactly one of them
+        """
+        responses, errors = {}, {}
+        
+        def collect(request_id, response, exception):
+            if exception is not None:
+                # HttpError carries the API's message as its reason
+                responses.pop(request_id, None)
+                errors[request_id] = getattr(exception, 'reason', None) or str(exception)
+            else:
+                errors.pop(request_id, None)
+                responses[request_id] = response
+            
+        items = list(requests_by_id.items())
+        for start in range(0, len(items), self.BATCH_LIMIT):
+            batch = self.service.new_batch_http_request(callback=collect)
+            for request_id, request in items[start:start + self.BATCH_LIMIT]:
+                batch.add(request, request_id=request_id)
+            try:
+                batch.execute()
+            except Exception as e:
+                # The batch call failed, e.g. offline, or stopped partway through its responses;
+                # requests that already reported back keep their outcome
+                for request_id, _ in items[start:start + self.BATCH_LIMIT]:
+                    if request_id not in responses:
+                        errors.setdefault(request_id, str(e))
+                    
+        return responses, errors
+        
+    def bulk_get_posts(self, blog_id: str, post_ids: List[str]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Get several posts with batch requests
+        
+        Args:
+            blog_id: The ID of the blog containing the posts
+            post_ids: The IDs of the posts to retrieve
+            
+        Returns:
+            The post information dictionaries and the error messages of the failed posts, by post ID
+        """
+        if not self.service:
+            if not self.authenticate():
+                return {}, {post_id: "Not authenticated" for post_id in post_ids}
+            
+        posts, errors = self._execute_batch({
+            post_id: self.service.posts().get(blogId=blog_id, postId=post_id)
+            for post_id in post_ids
+        })
+        
+        if self.cache:
+            for post in posts.values():
+                self.cache.put_item(blog_id, 'post', post)
+        return posts, errors
+        
+    def bulk_update_labels(self, blog_id: str, posts: List[Dict[str, Any]],
+                           add: Optional[List[str]] = None,
+                           remove: Optional[List[str]] = None) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Add and remove labels of several posts with batch requests
+        
+        Args:
+            blog_id: The ID of the blog containing the posts
+            posts: The posts to update, with their current 'labels' (summaries will do)
+            add: Labels to add to every post
+            remove: Labels to remove from every post
+            
+        Returns:
+            The updated post information dictionaries and the error messages of the failed posts, by post ID.
+            Posts whose labels would not change are left out.
+        """
+        add, remove = add or [], set(remove or [])
+        if not self.service:
+            if not self.authenticate():
+                return {}, {post.get('id'): "Not authenticated" for post in posts}
+            
+        patches = {}
+        for post in posts:
+            labels = post.get('labels', [])
+            new_labels = [label for label in labels if label not in remove]
+            new_labels += [label for label in add if label not in new_labels and label not in remove]
+            if new_labels != labels:
+                patches[post.get('id')] = self.service.posts().patch(
+                    blogId=blog_id,
+                    postId=post.get('id'),
+                    body={'labels': new_labels}
+                )
+                
+        updated, errors = self._execute_batch(patches)
+        
+        if self.cache:
+            for post in updated.values():
+                self.cache.put_item(blog_id, 'post', post)
+        return updated, errors
+        
+    def bulk_delete_posts(self, blog_id: str, post_ids: List[str]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Delete several posts with batch requests
+        
+        Args:
+            blog_id: The ID of the blog containing the posts
+            post_ids: The IDs of the posts to delete
+            
+        Returns:
+            The IDs of the deleted posts and the error messages of the failed posts, by post ID
+        """
+        if not self.service:
+            if not self.authenticate():
+                return [], {post_id: "Not authenticated" for post_id in post_ids}
+            
+        deleted, errors = self._execute_batch({
+            post_id: self.service.posts().delete(blogId=blog_id, postId=post_id)
+            for post_id in post_ids
+        })
+        
+        if self.cache:
+            self.cache.remove(blog_id, 'post', list(deleted))
+        return list(deleted), errors
+        
+    def get_pages(self, blog_id: str, max_results: int = 10,
+                  fields: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get pages from a specific blog
         
         Args:
             blog_id: The ID of the blog to get pages from
             max_results: Maximum number of pages to return
+            fields: Field projection, a FIELD_PRESETS name or a raw fields expression.
+                Projections without 'content' skip fetching the page bodies.
             
         Returns:
             List of page information dictionaries
@@ -246,22 +905,70 @@ class BloggerApiClient:
             
         pages = self.service.pages().list(
             blogId=blog_id,
-            maxResults=max_results
+            maxResults=max_results,
+            **self._projection(fields)
         ).execute()
         
         return pages.get('items', [])
         
-    def get_page(self, blog_id: str, page_id: str) -> Dict[str, Any]:
+    def get_pages_page(self, blog_id: str, page_token: Optional[str] = None, max_results: int = 20,
+                       fields: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of pages from a specific blog
+        
+        Args:
+            blog_id: The ID of the blog to get pages from
+            page_token: The nextPageToken of the previous page, or None for the first page
+            max_results: Maximum number of pages in the page
+            fields: Field projection, a FIELD_PRESETS name or a raw fields expression
+            
+        Returns:
+            The pages of the page and the token of the next page (None after the last page)
+        """
+        if not self.service:
+            if not self.authenticate():
+                return [], None
+            
+        kwargs = {'blogId': blog_id, 'maxResults': max_results, **self._projection(fields)}
+        if page_token:
+            kwargs['pageToken'] = page_token
+        response = self.service.pages().list(**kwargs).execute()
+        
+        items, next_token = response.get('items', []), response.get('nextPageToken')
+        if self._caches_listing(fields):
+            self.cache.add_listing_page(blog_id, 'page', items, first=not page_token, last=not next_token)
+        return items, next_token
+        
+    def get_cached_pages(self, blog_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the page summaries stored for a blog, without a request
+        
+        Args:
+            blog_id: The ID of the blog
+            
+        Returns:
+            List of page summaries, newest first; empty without a cache
+        """
+        return self.cache.get_summaries(blog_id, 'page') if self.cache else []
+        
+    def get_page(self, blog_id: str, page_id: str, updated: Optional[str] = None) -> Dict[str, Any]:
         """
         Get a specific page
         
         Args:
             blog_id: The ID of the blog containing the page
             page_id: The ID of the page to retrieve
+            updated: The 'updated' time of the page's summary; a cached page
+                with the same time is returned without a request
             
         Returns:
             The page information dictionary
         """
+        if self.cache and updated:
+            page = self.cache.get_item(blog_id, 'page', page_id)
+            if page and page.get('updated') == updated:
+                return page
+            
         if not self.service:
             if not self.authenticate():
                 return {}
@@ -271,10 +978,13 @@ class BloggerApiClient:
                 blogId=blog_id,
                 pageId=page_id
             ).execute()
-            return page
         except Exception:
             return {}
         
+        if self.cache:
+            self.cache.put_item(blog_id, 'page', page)
+        return page
+        
     def create_page(self, blog_id: str, title: str, content: str, 
                    is_draft: bool = True) -> Dict[str, Any]:
         """
@@ -307,6 +1017,8 @@ class BloggerApiClient:
             body=page_body
         ).execute()
         
+        if self.cache:
+            self.cache.put_item(blog_id, 'page', page)
         return page
         
     def update_page(self, blog_id: str, page_id: str, title: str, 
@@ -339,6 +1051,8 @@ class BloggerApiClient:
             body=page_body
         ).execute()
         
+        if self.cache:
+            self.cache.put_item(blog_id, 'page', page)
         return page
         
     def delete_page(self, blog_id: str, page_id: str) -> bool:
@@ -358,6 +1072,33 @@ class BloggerApiClient:
             
         try:
             self.service.pages().delete(blogId=blog_id, pageId=page_id).execute()
-            return True
         except Exception:
             return False
+        
+        if self.cache:
+            self.cache.remove(blog_id, 'page', [page_id])
+        return True
+        
+    def bulk_delete_pages(self, blog_id: str, page_ids: List[str]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Delete several pages with batch requests
+        
+        Args:
+            blog_id: The ID of the blog containing the pages
+            page_ids: The IDs of the pages to delete
+            
+        Returns:
+            The IDs of the deleted pages and the error messages of the failed pages, by page ID
+        """
+        if not self.service:
+            if not self.authenticate():
+                return [], {page_id: "Not authenticated" for page_id in page_ids}
+            
+        deleted, errors = self._execute_batch({
+            page_id: self.service.pages().delete(blogId=blog_id, pageId=page_id)
+            for page_id in page_ids
+        })
+        
+        if self.cache:
+            self.cache.remove(blog_id, 'page', list(deleted))
+        return list(deleted), errors
@@ -0,0 +1,62 @@
+"""
+Labels Dialog Module
+
+This module defines the dialog for adding and removing labels of several posts.
+"""
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QFormLayout, QLabel, QLineEdit, QDialogButtonBox
+)
+from PyQt6.QtCore import QSize
+from typing import List
+
+
+class LabelsDialog(QDialog):
+    """Dialog for choosing labels to add to and remove from the selected posts"""
+    
+    def __init__(self, parent=None, post_count=0):
+        super().__init__(parent)
+        
+        self.setWindowTitle("Edit Labels")
+        self.setMinimumSize(QSize(400, 150))
+        
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"Change the labels of {post_count} selected posts."))
+        
+        form = QFormLayout()
+        self.add_edit = QLineEdit()
+        self.add_edit.setPlaceholderText("label1, label2")
+        form.addRow("Add labels:", self.add_edit)
+        self.remove_edit = QLineEdit()
+        self.remove_edit.setPlaceholderText("label3")
+        form.addRow("Remove labels:", self.remove_edit)
+        layout.addLayout(form)
+        
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+    
+    @staticmethod
+    def _parse_labels(text: str) -> List[str]:
+        """Parse labels from comma-separated text input"""
+        return [label.strip() for label in text.split(',') if label.strip()]
+    
+    @property
+    def add_labels(self) -> List[str]:
+        """Labels to add"""
+        return self._parse_labels(self.add_edit.text())
+    
+    @property
+    def remove_labels(self) -> List[str]:
+        """Labels to remove"""
+        return self._parse_labels(self.remove_edit.text())
+    
+    def accept(self):
+        """Override accept to require a change"""
+        if not self.add_labels and not self.remove_labels:
+            return
+        
+        super().accept()
@@ -15,6 +15,7 @@ from blogger_gui.api.blogger_api import BloggerApiClient
 from blogger_gui.ui.auth_dialog import AuthDialog
 from blogger_gui.ui.posts_widget import PostsWidget
 from blogger_gui.ui.pages_widget import PagesWidget
+from blogger_gui.ui.workers import RequestRunner, background_thread_pool
 
 
 class MainWindow(QMainWindow):
@@ -23,9 +24,12 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        self.api_client = BloggerApiClient()
+        self.api_client = BloggerApiClient(cache_path=BloggerApiClient.DEFAULT_CACHE_PATH)
         self.current_blog_id = None
         self.blogs = []
+        self.runner = RequestRunner(self)
+        # The discovery refresh does not use the API service, so it must not wait in its queue
+        self.background_runner = RequestRunner(self, pool=background_thread_pool())
         
         self.setWindowTitle("Blogger Client")
         self.setMinimumSize(QSize(800, 600))
@@ -35,8 +39,18 @@ class MainWindow(QMainWindow):
         self._create_status_bar()
         self._create_central_widget()
         
-        # Try to authenticate on startup
-        self._authenticate()
+        # Blogs seen before show at once; they are revalidated after authentication
+        self._on_blogs_loaded(self.api_client.get_cached_blogs())
+        
+        # With a saved login the credentials load with the first request;
+        # otherwise try to authenticate on startup
+        if self.api_client.has_saved_credentials():
+            self._load_blogs()
+        else:
+            self._authenticate()
+        
+        # Keep the discovery document current for the next start; failures (offline) are ignored
+        self.background_runner.run('discovery', self.api_client.refresh_discovery_document)
     
     def _create_actions(self):
         """Create actions for menus"""
@@ -109,35 +123,69 @@ class MainWindow(QMainWindow):
         if auth_dialog.exec() == QDialog.DialogCode.Accepted:
             self.api_client.credentials_file = auth_dialog.credentials_path
             
-            if self.api_client.authenticate():
-                self.statusBar().showMessage("Authentication successful")
-                self._load_blogs()
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Authentication Failed",
-                    "Failed to authenticate with the Blogger API. Please check your credentials file."
-                )
+            self.statusBar().showMessage("Authenticating...")
+            self.runner.run(
+                'auth',
+                self.api_client.authenticate,
+                on_result=self._on_authenticated,
+                on_error=lambda message: self._on_authenticated(False)
+            )
+    
+    def _on_authenticated(self, authenticated):
+        """Load the blogs once authentication finished"""
+        if authenticated:
+            self.statusBar().showMessage("Authentication successful")
+            self._load_blogs()
+        else:
+            QMessageBox.critical(
+                self,
+                "Authentication Failed",
+                "Failed to authenticate with the Blogger API. Please check your credentials file."
+            )
     
     def _load_blogs(self):
-        """Load the user's blogs from the API"""
-        self.blog_list.clear()
-        
-        # Reset the current blog ID and update the widgets
-        self.current_blog_id = None
-        self.posts_widget.set_blog_id(None)
-        self.pages_widget.set_blog_id(None)
-        
-        self.blogs = self.api_client.get_blogs()
-        
-        if not self.blogs:
-            self.statusBar().showMessage("No blogs found")
+        """Load the user's blogs from the API in the background"""
+        # The list shown (cached or loaded before) stays usable while it is revalidated
+        self.statusBar().showMessage("Loading blogs...")
+        self.runner.run(
+            'blogs',
+            self.api_client.get_blogs,
+            on_result=self._on_blogs_loaded,
+            on_error=self._on_blogs_failed
+        )
+    
+    def _on_blogs_loaded(self, blogs):
+        """Fill the blog list with the loaded blogs, keeping the selected one"""
+        if blogs == self.blogs:
+            if blogs:
+                self.statusBar().showMessage(f"Loaded {len(self.blogs)} blogs")
             return
         
+        self.blogs = blogs
+        select_blog_id = self.current_blog_id
+        
+        # Refill without selection signals; the blog is selected again below
+        self.blog_list.blockSignals(True)
+        self.blog_list.clear()
         for blog in self.blogs:
             self.blog_list.addItem(blog.get('name', 'Unnamed Blog'))
+        self.blog_list.blockSignals(False)
         
-        self.statusBar().showMessage(f"Loaded {len(self.blogs)} blogs")
+        if not self.blogs:
+            self.statusBar().showMessage("No blogs found")
+        else:
+            self.statusBar().showMessage(f"Loaded {len(self.blogs)} blogs")
+        
+        for index, blog in enumerate(self.blogs):
+            if select_blog_id and blog.get('id') == select_blog_id:
+                self.blog_list.setCurrentRow(index)
+                break
+        else:
+            self._on_blog_selected(-1)
+    
+    def _on_blogs_failed(self, message):
+        """Report a failed blog list request"""
+        self.statusBar().showMessage(f"Failed to load blogs: {message}")
     
     def _on_blog_selected(self, index):
         """Handle blog selection"""
@@ -147,6 +195,7 @@ class MainWindow(QMainWindow):
             self.pages_widget.set_blog_id(None)
             return
         
+        # Switching blogs cancels the loads still running for the previous one
         self.current_blog_id = self.blogs[index].get('id')
         self.posts_widget.set_blog_id(self.current_blog_id)
         self.pages_widget.set_blog_id(self.current_blog_id)
@@ -156,8 +205,5 @@ class MainWindow(QMainWindow):
     def _refresh_data(self):
         """Refresh the blogs and posts data"""
         self._load_blogs()
-        
-        # If a blog is selected after reloading, refresh the content widgets
-        if self.current_blog_id:
-            self.posts_widget.refresh()
-            self.pages_widget.refresh()
+        self.posts_widget.refresh()
+        self.pages_widget.refresh()
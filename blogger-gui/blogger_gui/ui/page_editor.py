@@ -12,6 +12,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import QSize
 from typing import Dict, Any, Optional
 
+from blogger_gui.ui.workers import RequestRunner
+
 
 class PageEditor(QDialog):
     """Dialog for creating and editing blog pages"""
@@ -23,6 +25,8 @@ class PageEditor(QDialog):
         self.blog_id = blog_id
         self.page = page
         self.edit_mode = page is not None
+        self.runner = RequestRunner(self)
+        self.runner.busy_changed.connect(self._set_saving)
         
         self.setWindowTitle("Page Editor" if not self.edit_mode else "Edit Page")
         self.setMinimumSize(QSize(700, 500))
@@ -62,7 +66,11 @@ class PageEditor(QDialog):
         )
         buttons.accepted.connect(self._save_page)
         buttons.rejected.connect(self.reject)
+        self.saving_label = QLabel("Saving...")
+        self.saving_label.setVisible(False)
+        layout.addWidget(self.saving_label)
         layout.addWidget(buttons)
+        self.buttons = buttons
     
     def _populate_page_data(self):
         """Populate the form with existing page data"""
@@ -85,31 +93,49 @@ class PageEditor(QDialog):
             QMessageBox.warning(self, "Missing Information", "Please enter content for the page.")
             return
         
-        try:
-            if self.edit_mode:
-                # Update existing page
-                self.api_client.update_page(
-                    self.blog_id,
-                    self.page.get('id'),
-                    title,
-                    content
-                )
-                QMessageBox.information(self, "Success", "Page updated successfully.")
-            else:
-                # Create new page
-                is_draft = self.draft_checkbox.isChecked()
-                self.api_client.create_page(
-                    self.blog_id,
-                    title,
-                    content,
-                    is_draft
-                )
-                QMessageBox.information(
-                    self, 
-                    "Success", 
-                    f"Page {'drafted' if is_draft else 'published'} successfully."
-                )
-            
-            self.accept()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save page: {str(e)}")
+        if self.edit_mode:
+            # Update existing page
+            self.runner.run(
+                'save',
+                self.api_client.update_page,
+                self.blog_id,
+                self.page.get('id'),
+                title,
+                content,
+                on_result=lambda page: self._on_saved("Page updated successfully."),
+                on_error=self._on_save_failed
+            )
+        else:
+            # Create new page
+            is_draft = self.draft_checkbox.isChecked()
+            self.runner.run(
+                'save',
+                self.api_client.create_page,
+                self.blog_id,
+                title,
+                content,
+                is_draft,
+                on_result=lambda page: self._on_saved(
+                    f"Page {'drafted' if is_draft else 'published'} successfully."),
+                on_error=self._on_save_failed
+            )
+    
+    def _on_saved(self, message):
+        """Close the dialog once the page is saved"""
+        QMessageBox.information(self, "Success", message)
+        self.accept()
+    
+    def _on_save_failed(self, message):
+        """Report a failed save and keep the dialog open"""
+        QMessageBox.critical(self, "Error", f"Failed to save page: {message}")
+    
+    def _set_saving(self, saving):
+        """Disable the form while the page is being saved"""
+        self.saving_label.setVisible(saving)
+        self.buttons.setEnabled(not saving)
+    
+    def reject(self):
+        """Keep the dialog open while a save is in flight"""
+        if self.runner.is_busy():
+            return
+        super().reject()
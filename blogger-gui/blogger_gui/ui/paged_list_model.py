@@ -0,0 +1,207 @@
+"""
+Paged List Model Module
+
+This module defines a list model that pages through a Blogger list call as the view scrolls.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+
+from blogger_gui.ui.workers import RequestRunner
+
+
+# Fetches one page: page token -> (items, next page token)
+PageFetcher = Callable[[Optional[str]], Tuple[List[Dict[str, Any]], Optional[str]]]
+
+
+class PagedListModel(QAbstractListModel):
+    """
+    List model of posts or pages loaded page by page with nextPageToken
+    
+    Views ask for more rows through canFetchMore/fetchMore when they scroll near the end;
+    each page is fetched in the background and appended. Rows are plain resource
+    dictionaries, so the view renders only the visible rows and no widget item is built per row.
+    
+    The model can start from cached rows. Fetched pages are then merged into them by ID:
+    changed rows are updated in place, new ones are inserted where the page has them,
+    and rows no page returned are dropped once the last page is in.
+    """
+    
+    ItemRole = Qt.ItemDataRole.UserRole
+    
+    loading_changed = pyqtSignal(bool)
+    load_failed = pyqtSignal(str)
+    all_loaded = pyqtSignal(int)
+    
+    def __init__(self, untitled: str = 'Untitled', parent=None):
+        """
+        Initialize the model
+        
+        Args:
+            untitled: Text shown for items without a title
+            parent: The owning QObject
+        """
+        super().__init__(parent)
+        self.untitled = untitled
+        self._items: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+        self._seen = set()
+        self._cursor = 0
+        self._fetch_page: Optional[PageFetcher] = None
+        self._next_token = None
+        self._exhausted = True
+        self.runner = RequestRunner(self)
+        self.runner.busy_changed.connect(self.loading_changed)
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of rows loaded so far"""
+        if parent.isValid():
+            return 0
+        return len(self._items)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Title for display, the resource dictionary for ItemRole"""
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+        item = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item.get('title') or self.untitled
+        if role == self.ItemRole:
+            return item
+        return None
+    
+    def item(self, row: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the resource of a row
+        
+        Args:
+            row: The row number
+        
+        Returns:
+            The resource dictionary, or None if the row does not exist
+        """
+        return self._items[row] if 0 <= row < len(self._items) else None
+    
+    def items(self) -> List[Dict[str, Any]]:
+        """Get the resources loaded so far"""
+        return list(self._items)
+    
+    def reset(self, fetch_page: Optional[PageFetcher], cached: Optional[List[Dict[str, Any]]] = None):
+        """
+        Drop the loaded rows and start over with a new source
+        
+        Args:
+            fetch_page: Fetches a page for a token, or None to only show the cached rows
+            cached: Rows to show until the pages are in
+        """
+        self.runner.cancel_all()
+        self.beginResetModel()
+        self._items = list(cached or [])
+        self._reindex()
+        self._seen = set()
+        self._cursor = 0
+        self._fetch_page = fetch_page
+        self._next_token = None
+        self._exhausted = fetch_page is None
+        self.endResetModel()
+        if self.canFetchMore():
+            self.fetchMore()
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        """Whether more pages exist and none is being fetched"""
+        if parent.isValid():
+            return False
+        return not self._exhausted and not self.runner.is_busy()
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Fetch the next page in the background"""
+        if not self.canFetchMore(parent):
+            return
+        self.runner.run(
+            'page',
+            self._fetch_page, self._next_token,
+            on_result=self._append_page,
+            on_error=self._on_page_failed
+        )
+    
+    def merge(self, items: List[Dict[str, Any]]):
+        """
+        Apply changed items fetched outside the paging
+        
+        Args:
+            items: Items to update in place, or to insert first if they are new
+        """
+        new = [item for item in items if item.get('id') not in self._rows]
+        new_ids = {item.get('id') for item in new}
+        self._apply(new, 0)
+        self._apply([item for item in items if item.get('id') not in new_ids], 0)
+    
+    def _on_page_failed(self, message):
+        """Stop paging after a failed page; reset() starts over"""
+        self._exhausted = True
+        self.load_failed.emit(message)
+    
+    def _append_page(self, page):
+        """Merge a fetched page into the rows"""
+        items, next_token = page
+        self._next_token = next_token
+        self._exhausted = not next_token
+        self._seen.update(item.get('id') for item in items)
+        self._cursor = self._apply(items, self._cursor)
+        if self._exhausted:
+            self._drop_unseen()
+            self.all_loaded.emit(len(self._items))
+        elif len(self._seen) < len(self._items):
+            # Cached rows no page has returned yet are still shown; keep revalidating them
+            self.fetchMore()
+    
+    def _apply(self, items: List[Dict[str, Any]], position: int) -> int:
+        """
+        Update known items in place and insert new ones at a position
+        
+        Args:
+            items: Items in list order
+            position: Row to insert new items at
+        
+        Returns:
+            The row after the last item applied
+        """
+        pending = []
+        
+        def insert_pending():
+            nonlocal position
+            if pending:
+                self.beginInsertRows(QModelIndex(), position, position + len(pending) - 1)
+                self._items[position:position] = pending
+                self.endInsertRows()
+                position += len(pending)
+                pending.clear()
+                self._reindex()
+        
+        for item in items:
+            if item.get('id') not in self._rows:
+                pending.append(item)
+                continue
+            insert_pending()
+            row = self._rows[item.get('id')]
+            if self._items[row] != item:
+                self._items[row] = item
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+            position = max(position, row + 1)
+        insert_pending()
+        return position
+    
+    def _drop_unseen(self):
+        """Remove the rows no page returned, i.e. items deleted since they were cached"""
+        for row in reversed(range(len(self._items))):
+            if self._items[row].get('id') not in self._seen:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._items[row]
+                self.endRemoveRows()
+        self._reindex()
+    
+    def _reindex(self):
+        """Rebuild the row lookup by ID"""
+        self._rows = {item.get('id'): row for row, item in enumerate(self._items)}
@@ -6,22 +6,30 @@ This module defines the widget for managing blog pages.
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QListWidget, QMessageBox, QDialog, QLabel
+    QListView, QMessageBox, QDialog, QLabel, QAbstractItemView
 )
 from PyQt6.QtCore import Qt
 
 from blogger_gui.ui.page_editor import PageEditor
+from blogger_gui.ui.paged_list_model import PagedListModel
+from blogger_gui.ui.workers import RequestRunner
 
 
 class PagesWidget(QWidget):
     """Widget for managing blog pages"""
     
+    # Pages fetched per request while scrolling
+    PAGE_SIZE = 50
+    
     def __init__(self, parent=None, api_client=None):
         super().__init__(parent)
         
         self.api_client = api_client
         self.current_blog_id = None
-        self.pages = []
+        
+        # API calls run in the background; a new load cancels the previous one
+        self.runner = RequestRunner(self)
+        self.runner.busy_changed.connect(self._on_busy_changed)
         
         self._create_ui()
     
@@ -29,12 +37,26 @@ class PagesWidget(QWidget):
         """Create the widget UI elements"""
         layout = QVBoxLayout(self)
         
-        # Pages list
-        self.page_list = QListWidget()
-        self.page_list.currentRowChanged.connect(self._on_page_selected)
+        # Pages list; the model fetches further pages as the view scrolls to the end
+        self.page_model = PagedListModel(untitled='Untitled Page', parent=self)
+        self.page_model.loading_changed.connect(self._on_busy_changed)
+        self.page_model.load_failed.connect(
+            lambda message: self._show_status(f"Failed to load pages: {message}"))
+        self.page_model.rowsInserted.connect(self._on_pages_loaded)
+        self.page_model.all_loaded.connect(self._on_all_pages_loaded)
+        self.page_list = QListView()
+        self.page_list.setUniformItemSizes(True)
+        self.page_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.page_list.setModel(self.page_model)
+        self.page_list.selectionModel().selectionChanged.connect(self._on_page_selected)
         layout.addWidget(QLabel("Pages:"))
         layout.addWidget(self.page_list)
         
+        # Loading state
+        self.loading_label = QLabel("Loading pages...")
+        self.loading_label.setVisible(False)
+        layout.addWidget(self.loading_label)
+        
         # Page actions
         page_actions_layout = QHBoxLayout()
         self.new_page_button = QPushButton("New Page")
@@ -55,43 +77,74 @@ class PagesWidget(QWidget):
     def set_blog_id(self, blog_id):
         """Set the current blog ID and load pages"""
         self.current_blog_id = blog_id
+        # Requests for the previous blog are stale now
+        self.runner.cancel_all()
         if blog_id:
             self._load_pages()
         else:
-            self.page_list.clear()
-            self.pages = []
+            self.page_model.reset(None)
         
         self._update_button_states()
     
     def _load_pages(self):
-        """Load pages for the selected blog"""
-        if not self.current_blog_id:
-            return
-        
-        self.page_list.clear()
-        self.pages = self.api_client.get_pages(self.current_blog_id, max_results=20)
+        """
+        Load pages for the selected blog, page by page as the list scrolls
         
-        if not self.pages:
-            self.parent().statusBar().showMessage("No pages found for this blog")
+        Cached pages show at once; the listing revalidates them in the background.
+        """
+        if not self.current_blog_id:
             return
         
-        for page in self.pages:
-            self.page_list.addItem(page.get('title', 'Untitled Page'))
-        
-        # self.parent().statusBar().showMessage(f"Loaded {len(self.pages)} pages")
+        blog_id = self.current_blog_id
+        cached = self.api_client.get_cached_pages(blog_id)
+        self.loading_label.setText("Updating pages..." if cached else "Loading pages...")
+        self.page_model.reset(
+            lambda page_token: self.api_client.get_pages_page(
+                blog_id, page_token, max_results=self.PAGE_SIZE, fields='listing'),
+            cached
+        )
+        if cached:
+            self._show_status(f"Loaded {len(cached)} cached pages")
+    
+    def _on_pages_loaded(self, parent, first, last):
+        """Report how many pages are loaded"""
+        self._show_status(f"Loaded {self.page_model.rowCount()} pages")
+    
+    def _on_all_pages_loaded(self, count):
+        """Report a blog without pages"""
+        if not count:
+            self._show_status("No pages found for this blog")
+    
+    def _selected_pages(self):
+        """Get the summaries of the selected pages, in list order"""
+        rows = sorted(index.row() for index in self.page_list.selectionModel().selectedRows())
+        return [self.page_model.item(row) for row in rows]
+    
+    def _show_status(self, message):
+        """Show a message in the main window's status bar"""
+        window = self.window()
+        if hasattr(window, 'statusBar'):
+            window.statusBar().showMessage(message)
     
-    def _on_page_selected(self, index):
+    def _on_busy_changed(self, busy):
+        """Show the loading state while requests are running"""
+        self.loading_label.setVisible(self.runner.is_busy() or self.page_model.runner.is_busy())
+        self._update_button_states()
+    
+    def _on_page_selected(self, selected, deselected):
         """Handle page selection"""
         self._update_button_states()
     
     def _update_button_states(self):
         """Update button states based on selections"""
         has_blog = self.current_blog_id is not None
-        has_page = self.page_list.currentRow() >= 0 and len(self.pages) > 0
+        selected_count = len(self.page_list.selectionModel().selectedRows())
+        idle = not self.runner.is_busy()
         
         self.new_page_button.setEnabled(has_blog)
-        self.edit_page_button.setEnabled(has_blog and has_page)
-        self.delete_page_button.setEnabled(has_blog and has_page)
+        self.edit_page_button.setEnabled(has_blog and selected_count == 1 and idle)
+        self.delete_page_button.setEnabled(has_blog and selected_count > 0 and idle)
+        self.delete_page_button.setText("Delete Pages" if selected_count > 1 else "Delete Page")
     
     def _create_new_page(self):
         """Create a new page"""
@@ -104,41 +157,82 @@ class PagesWidget(QWidget):
     
     def _edit_page(self):
         """Edit the selected page"""
-        index = self.page_list.currentRow()
-        if index < 0 or index >= len(self.pages):
+        selected = self._selected_pages()
+        if len(selected) != 1:
+            return
+        
+        summary = selected[0]
+        # The list only holds summaries; load the full page for editing
+        self.loading_label.setText("Loading page...")
+        self.runner.run(
+            'open',
+            self.api_client.get_page, self.current_blog_id, summary.get('id'), summary.get('updated'),
+            on_result=self._open_editor,
+            on_error=lambda message: self._open_editor({})
+        )
+    
+    def _open_editor(self, page):
+        """Open the page editor once the full page is loaded"""
+        if not page:
+            QMessageBox.critical(self, "Load Failed", "Failed to load the page. Please try again.")
             return
         
-        page = self.pages[index]
         editor = PageEditor(self, self.api_client, self.current_blog_id, page)
         if editor.exec() == QDialog.DialogCode.Accepted:
             self._load_pages()
     
     def _delete_page(self):
-        """Delete the selected page"""
-        index = self.page_list.currentRow()
-        if index < 0 or index >= len(self.pages):
+        """Delete the selected pages"""
+        pages = self._selected_pages()
+        if not pages:
             return
         
-        page = self.pages[index]
-        
+        if len(pages) == 1:
+            question = f"Are you sure you want to delete the page '{pages[0].get('title')}'?"
+        else:
+            question = f"Are you sure you want to delete {len(pages)} pages?"
         reply = QMessageBox.question(
             self,
             "Confirm Delete",
-            f"Are you sure you want to delete the page '{page.get('title')}'?",
+            question,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            if self.api_client.delete_page(self.current_blog_id, page.get('id')):
-                self.parent().statusBar().showMessage("Page deleted successfully")
-                self._load_pages()
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Delete Failed",
-                    "Failed to delete the page. Please try again."
-                )
+            self.loading_label.setText("Deleting page..." if len(pages) == 1 else f"Deleting {len(pages)} pages...")
+            self.runner.run(
+                'delete',
+                self.api_client.bulk_delete_pages, self.current_blog_id, [page.get('id') for page in pages],
+                on_result=self._on_pages_deleted,
+                on_error=lambda message: self._report_failures("Delete Failed", {'': message})
+            )
+    
+    def _on_pages_deleted(self, result):
+        """Report the pages a deletion failed for and reload the list"""
+        deleted, errors = result
+        self._report_failures("Delete Failed", errors)
+        if deleted:
+            self._show_status("Page deleted successfully" if len(deleted) == 1 else f"Deleted {len(deleted)} pages")
+            self._load_pages()
+    
+    def _report_failures(self, title, errors):
+        """
+        Show the pages a bulk action failed for
+        
+        Args:
+            title: Title of the message box
+            errors: Error messages by page ID; '' for a failure of the whole action
+        """
+        if not errors:
+            return
+        
+        titles = {page.get('id'): page.get('title') for page in self.page_model.items()}
+        lines = [f"{titles.get(page_id) or page_id}: {message}" if page_id else message
+                 for page_id, message in list(errors.items())[:10]]
+        if len(errors) > 10:
+            lines.append(f"... and {len(errors) - 10} more")
+        QMessageBox.critical(self, title, "The action failed. Please try again.\n\n" + "\n".join(lines))
     
     def refresh(self):
         """Refresh the pages data"""
@@ -13,6 +13,8 @@ from PyQt6.QtCore import QSize, QDateTime, Qt
 from typing import Dict, Any, Optional, List
 import datetime
 
+from blogger_gui.ui.workers import RequestRunner
+
 
 class PostEditor(QDialog):
     """Dialog for creating and editing blog posts"""
@@ -24,6 +26,8 @@ class PostEditor(QDialog):
         self.blog_id = blog_id
         self.post = post
         self.edit_mode = post is not None
+        self.runner = RequestRunner(self)
+        self.runner.busy_changed.connect(self._set_saving)
         
         self.setWindowTitle("Post Editor" if not self.edit_mode else "Edit Post")
         self.setMinimumSize(QSize(700, 500))
@@ -101,7 +105,11 @@ class PostEditor(QDialog):
         )
         buttons.accepted.connect(self._save_post)
         buttons.rejected.connect(self.reject)
+        self.saving_label = QLabel("Saving...")
+        self.saving_label.setVisible(False)
+        layout.addWidget(self.saving_label)
         layout.addWidget(buttons)
+        self.buttons = buttons
         
         # Initially disable publish date since custom date is unchecked by default
         self.publish_date_edit.setEnabled(False)
@@ -201,39 +209,57 @@ class PostEditor(QDialog):
             QMessageBox.warning(self, "Missing Information", "Please enter content for the post.")
             return
         
-        try:
-            if self.edit_mode:
-                # Update existing post
-                self.api_client.update_post(
-                    self.blog_id,
-                    self.post.get('id'),
-                    title,
-                    content,
-                    labels,
-                    publish_date,
-                    permalink if permalink else None,
-                    allow_comments
-                )
-                QMessageBox.information(self, "Success", "Post updated successfully.")
-            else:
-                # Create new post
-                is_draft = self.draft_checkbox.isChecked()
-                self.api_client.create_post(
-                    self.blog_id,
-                    title,
-                    content,
-                    labels,
-                    is_draft,
-                    publish_date,
-                    permalink if permalink else None,
-                    allow_comments
-                )
-                QMessageBox.information(
-                    self, 
-                    "Success", 
-                    f"Post {'drafted' if is_draft else 'published'} successfully."
-                )
-            
-            self.accept()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save post: {str(e)}")
+        if self.edit_mode:
+            # Update existing post
+            self.runner.run(
+                'save',
+                self.api_client.update_post,
+                self.blog_id,
+                self.post.get('id'),
+                title,
+                content,
+                labels,
+                publish_date,
+                permalink if permalink else None,
+                allow_comments,
+                on_result=lambda post: self._on_saved("Post updated successfully."),
+                on_error=self._on_save_failed
+            )
+        else:
+            # Create new post
+            is_draft = self.draft_checkbox.isChecked()
+            self.runner.run(
+                'save',
+                self.api_client.create_post,
+                self.blog_id,
+                title,
+                content,
+                labels,
+                is_draft,
+                publish_date,
+                permalink if permalink else None,
+                allow_comments,
+                on_result=lambda post: self._on_saved(
+                    f"Post {'drafted' if is_draft else 'published'} successfully."),
+                on_error=self._on_save_failed
+            )
+    
+    def _on_saved(self, message):
+        """Close the dialog once the post is saved"""
+        QMessageBox.information(self, "Success", message)
+        self.accept()
+    
+    def _on_save_failed(self, message):
+        """Report a failed save and keep the dialog open"""
+        QMessageBox.critical(self, "Error", f"Failed to save post: {message}")
+    
+    def _set_saving(self, saving):
+        """Disable the form while the post is being saved"""
+        self.saving_label.setVisible(saving)
+        self.buttons.setEnabled(not saving)
+    
+    def reject(self):
+        """Keep the dialog open while a save is in flight"""
+        if self.runner.is_busy():
+            return
+        super().reject()
@@ -6,22 +6,31 @@ This module defines the widget for managing blog posts.
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QListWidget, QMessageBox, QDialog, QLabel, QSplitter
+    QListView, QMessageBox, QDialog, QLabel, QSplitter, QAbstractItemView
 )
 from PyQt6.QtCore import Qt
 
+from blogger_gui.ui.labels_dialog import LabelsDialog
 from blogger_gui.ui.post_editor import PostEditor
+from blogger_gui.ui.paged_list_model import PagedListModel
+from blogger_gui.ui.workers import RequestRunner
 
 
 class PostsWidget(QWidget):
     """Widget for managing blog posts"""
     
+    # Posts fetched per request while scrolling
+    PAGE_SIZE = 50
+    
     def __init__(self, parent=None, api_client=None):
         super().__init__(parent)
         
         self.api_client = api_client
         self.current_blog_id = None
-        self.posts = []
+        
+        # API calls run in the background; a new load cancels the previous one
+        self.runner = RequestRunner(self)
+        self.runner.busy_changed.connect(self._on_busy_changed)
         
         self._create_ui()
     
@@ -29,23 +38,40 @@ class PostsWidget(QWidget):
         """Create the widget UI elements"""
         layout = QVBoxLayout(self)
         
-        # Posts list
-        self.post_list = QListWidget()
-        self.post_list.currentRowChanged.connect(self._on_post_selected)
+        # Posts list; the model fetches further pages as the view scrolls to the end
+        self.post_model = PagedListModel(untitled='Untitled Post', parent=self)
+        self.post_model.loading_changed.connect(self._on_busy_changed)
+        self.post_model.load_failed.connect(
+            lambda message: self._show_status(f"Failed to load posts: {message}"))
+        self.post_model.rowsInserted.connect(self._on_posts_loaded)
+        self.post_model.all_loaded.connect(self._on_all_posts_loaded)
+        self.post_list = QListView()
+        self.post_list.setUniformItemSizes(True)
+        self.post_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.post_list.setModel(self.post_model)
+        self.post_list.selectionModel().selectionChanged.connect(self._on_post_selected)
         layout.addWidget(QLabel("Posts:"))
         layout.addWidget(self.post_list)
         
+        # Loading state
+        self.loading_label = QLabel("Loading posts...")
+        self.loading_label.setVisible(False)
+        layout.addWidget(self.loading_label)
+        
         # Post actions
         post_actions_layout = QHBoxLayout()
         self.new_post_button = QPushButton("New Post")
         self.new_post_button.clicked.connect(self._create_new_post)
         self.edit_post_button = QPushButton("Edit Post")
         self.edit_post_button.clicked.connect(self._edit_post)
+        self.labels_button = QPushButton("Edit Labels...")
+        self.labels_button.clicked.connect(self._edit_labels)
         self.delete_post_button = QPushButton("Delete Post")
         self.delete_post_button.clicked.connect(self._delete_post)
         
         post_actions_layout.addWidget(self.new_post_button)
         post_actions_layout.addWidget(self.edit_post_button)
+        post_actions_layout.addWidget(self.labels_button)
         post_actions_layout.addWidget(self.delete_post_button)
         layout.addLayout(post_actions_layout)
         
@@ -55,43 +81,95 @@ class PostsWidget(QWidget):
     def set_blog_id(self, blog_id):
         """Set the current blog ID and load posts"""
         self.current_blog_id = blog_id
+        # Requests for the previous blog are stale now
+        self.runner.cancel_all()
         if blog_id:
             self._load_posts()
         else:
-            self.post_list.clear()
-            self.posts = []
+            self.post_model.reset(None)
         
         self._update_button_states()
     
-    def _load_posts(self):
-        """Load posts for the selected blog"""
-        if not self.current_blog_id:
-            return
+    def _load_posts(self, full=False):
+        """
+        Load posts for the selected blog, page by page as the list scrolls
         
-        self.post_list.clear()
-        self.posts = self.api_client.get_posts(self.current_blog_id, max_results=20)
+        Cached posts show at once. When every post of the blog is cached, only the posts
+        updated since are fetched; otherwise the pages are listed again and merged into
+        the cached rows.
         
-        if not self.posts:
-            self.parent().statusBar().showMessage("No posts found for this blog")
+        Args:
+            full: List the pages again even if every post is cached, which also drops
+                posts deleted elsewhere
+        """
+        if not self.current_blog_id:
             return
         
-        for post in self.posts:
-            self.post_list.addItem(post.get('title', 'Untitled Post'))
-        
-        # self.parent().statusBar().showMessage(f"Loaded {len(self.posts)} posts")
+        blog_id = self.current_blog_id
+        cached = self.api_client.get_cached_posts(blog_id)
+        self.loading_label.setText("Updating posts..." if cached else "Loading posts...")
+        if cached and not full and self.api_client.has_all_posts_cached(blog_id):
+            self.post_model.reset(None, cached)
+            self.runner.run(
+                'revalidate',
+                self.api_client.revalidate_posts, blog_id,
+                on_result=self._on_posts_revalidated,
+                on_error=lambda message: self._show_status(f"Failed to update posts: {message}")
+            )
+        else:
+            self.post_model.reset(
+                lambda page_token: self.api_client.get_posts_page(
+                    blog_id, page_token, max_results=self.PAGE_SIZE, fields='listing'),
+                cached
+            )
+        if cached:
+            self._show_status(f"Loaded {len(cached)} cached posts")
+    
+    def _on_posts_revalidated(self, changed):
+        """Apply the posts updated since the cached ones"""
+        self.post_model.merge(changed)
+        self._show_status(f"Loaded {self.post_model.rowCount()} posts")
     
-    def _on_post_selected(self, index):
+    def _on_posts_loaded(self, parent, first, last):
+        """Report how many posts are loaded"""
+        self._show_status(f"Loaded {self.post_model.rowCount()} posts")
+    
+    def _on_all_posts_loaded(self, count):
+        """Report a blog without posts"""
+        if not count:
+            self._show_status("No posts found for this blog")
+    
+    def _selected_posts(self):
+        """Get the summaries of the selected posts, in list order"""
+        rows = sorted(index.row() for index in self.post_list.selectionModel().selectedRows())
+        return [self.post_model.item(row) for row in rows]
+    
+    def _show_status(self, message):
+        """Show a message in the main window's status bar"""
+        window = self.window()
+        if hasattr(window, 'statusBar'):
+            window.statusBar().showMessage(message)
+    
+    def _on_busy_changed(self, busy):
+        """Show the loading state while requests are running"""
+        self.loading_label.setVisible(self.runner.is_busy() or self.post_model.runner.is_busy())
+        self._update_button_states()
+    
+    def _on_post_selected(self, selected, deselected):
         """Handle post selection"""
         self._update_button_states()
     
     def _update_button_states(self):
         """Update button states based on selections"""
         has_blog = self.current_blog_id is not None
-        has_post = self.post_list.currentRow() >= 0
+        selected_count = len(self.post_list.selectionModel().selectedRows())
+        idle = not self.runner.is_busy()
         
         self.new_post_button.setEnabled(has_blog)
-        self.edit_post_button.setEnabled(has_blog and has_post)
-        self.delete_post_button.setEnabled(has_blog and has_post)
+        self.edit_post_button.setEnabled(has_blog and selected_count == 1 and idle)
+        self.labels_button.setEnabled(has_blog and selected_count > 0 and idle)
+        self.delete_post_button.setEnabled(has_blog and selected_count > 0 and idle)
+        self.delete_post_button.setText("Delete Posts" if selected_count > 1 else "Delete Post")
     
     def _create_new_post(self):
         """Open the post editor to create a new post"""
@@ -104,43 +182,109 @@ class PostsWidget(QWidget):
     
     def _edit_post(self):
         """Open the post editor to edit the selected post"""
-        index = self.post_list.currentRow()
-        if index < 0 or index >= len(self.posts):
+        selected = self._selected_posts()
+        if len(selected) != 1:
+            return
+        
+        summary = selected[0]
+        # The list only holds summaries; load the full post for editing
+        self.loading_label.setText("Loading post...")
+        self.runner.run(
+            'open',
+            self.api_client.get_post, self.current_blog_id, summary.get('id'), summary.get('updated'),
+            on_result=self._open_editor,
+            on_error=lambda message: self._open_editor({})
+        )
+    
+    def _open_editor(self, post):
+        """Open the post editor once the full post is loaded"""
+        if not post:
+            QMessageBox.critical(self, "Load Failed", "Failed to load the post. Please try again.")
             return
         
-        post = self.posts[index]
         editor = PostEditor(self, self.api_client, self.current_blog_id, post)
         if editor.exec() == QDialog.DialogCode.Accepted:
             self._load_posts()
     
-    def _delete_post(self):
-        """Delete the selected post"""
-        index = self.post_list.currentRow()
-        if index < 0 or index >= len(self.posts):
+    def _edit_labels(self):
+        """Add and remove labels of the selected posts"""
+        posts = self._selected_posts()
+        if not posts:
             return
         
-        post = self.posts[index]
+        dialog = LabelsDialog(self, len(posts))
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.loading_label.setText(f"Updating labels of {len(posts)} posts...")
+            self.runner.run(
+                'labels',
+                self.api_client.bulk_update_labels, self.current_blog_id, posts,
+                dialog.add_labels, dialog.remove_labels,
+                on_result=self._on_labels_updated,
+                on_error=lambda message: self._report_failures("Label Update Failed", {'': message})
+            )
+    
+    def _on_labels_updated(self, result):
+        """Report the posts a label update failed for and reload the list"""
+        updated, errors = result
+        self._report_failures("Label Update Failed", errors)
+        self._show_status(f"Updated the labels of {len(updated)} posts")
+        if updated:
+            self._load_posts()
+    
+    def _delete_post(self):
+        """Delete the selected posts"""
+        posts = self._selected_posts()
+        if not posts:
+            return
         
+        if len(posts) == 1:
+            question = f"Are you sure you want to delete the post '{posts[0].get('title')}'?"
+        else:
+            question = f"Are you sure you want to delete {len(posts)} posts?"
         reply = QMessageBox.question(
             self,
             "Confirm Delete",
-            f"Are you sure you want to delete the post '{post.get('title')}'?",
+            question,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            if self.api_client.delete_post(self.current_blog_id, post.get('id')):
-                self.parent().statusBar().showMessage("Post deleted successfully")
-                self._load_posts()
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Delete Failed",
-                    "Failed to delete the post. Please try again."
-                )
+            self.loading_label.setText("Deleting post..." if len(posts) == 1 else f"Deleting {len(posts)} posts...")
+            self.runner.run(
+                'delete',
+                self.api_client.bulk_delete_posts, self.current_blog_id, [post.get('id') for post in posts],
+                on_result=self._on_posts_deleted,
+                on_error=lambda message: self._report_failures("Delete Failed", {'': message})
+            )
+    
+    def _on_posts_deleted(self, result):
+        """Report the posts a deletion failed for and reload the list"""
+        deleted, errors = result
+        self._report_failures("Delete Failed", errors)
+        if deleted:
+            self._show_status("Post deleted successfully" if len(deleted) == 1 else f"Deleted {len(deleted)} posts")
+            self._load_posts()
+    
+    def _report_failures(self, title, errors):
+        """
+        Show the posts a bulk action failed for
+        
+        Args:
+            title: Title of the message box
+            errors: Error messages by post ID; '' for a failure of the whole action
+        """
+        if not errors:
+            return
+        
+        titles = {post.get('id'): post.get('title') for post in self.post_model.items()}
+        lines = [f"{titles.get(post_id) or post_id}: {message}" if post_id else message
+                 for post_id, message in list(errors.items())[:10]]
+        if len(errors) > 10:
+            lines.append(f"... and {len(errors) - 10} more")
+        QMessageBox.critical(self, title, "The action failed. Please try again.\n\n" + "\n".join(lines))
     
     def refresh(self):
         """Refresh the posts data"""
         if self.current_blog_id:
-            self._load_posts()
+            self._load_posts(full=True)
@@ -0,0 +1,200 @@
+"""
+Workers Module
+
+This module runs Blogger API calls off the UI thread and hands their results back to it.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+
+
+_api_thread_pool = None
+_background_thread_pool = None
+
+
+def api_thread_pool() -> QThreadPool:
+    """
+    Get the thread pool API calls run on
+    
+    The googleapiclient service shares one HTTP connection that is not thread-safe,
+    so requests run one at a time; queued requests can still be cancelled before they start.
+    
+    Returns:
+        The shared QThreadPool
+    """
+    global _api_thread_pool
+    if _api_thread_pool is None:
+        _api_thread_pool = QThreadPool()
+        _api_thread_pool.setMaxThreadCount(1)
+    return _api_thread_pool
+
+
+def background_thread_pool() -> QThreadPool:
+    """
+    Get the thread pool for background work that does not use the API service
+    
+    Work such as refreshing the discovery document runs here at low priority,
+    so it never queues in front of the requests on api_thread_pool().
+    
+    Returns:
+        The shared QThreadPool
+    """
+    global _background_thread_pool
+    if _background_thread_pool is None:
+        _background_thread_pool = QThreadPool()
+        _background_thread_pool.setMaxThreadCount(1)
+        _background_thread_pool.setThreadPriority(QThread.Priority.LowestPriority)
+    return _background_thread_pool
+
+
+class WorkerSignals(QObject):
+    """Signals of an ApiWorker, delivered on the thread that created the worker"""
+    
+    succeeded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    done = pyqtSignal()
+
+
+class ApiWorker(QRunnable):
+    """A single API call run on the thread pool"""
+    
+    def __init__(self, fn: Callable, *args, **kwargs):
+        """
+        Initialize the worker
+        
+        Args:
+            fn: The function to call, typically a BloggerApiClient method
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        super().__init__()
+        # The RequestRunner keeps the worker alive until it is done
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self.cancelled = False
+    
+    def run(self):
+        """Call the function and emit its result or error"""
+        try:
+            if self.cancelled:
+                return
+            try:
+                result = self.fn(*self.args, **self.kwargs)
+            except Exception as e:
+                self.signals.failed.emit(str(e))
+                return
+            self.signals.succeeded.emit(result)
+        finally:
+            self.signals.done.emit()
+
+
+class RequestRunner(QObject):
+    """
+    Runs API calls in the background, one request per key
+    
+    Starting a request under a key that already has one running makes the older request stale:
+    it is taken off the queue if it has not started, and its result is discarded otherwise.
+    """
+    
+    busy_changed = pyqtSignal(bool)
+    
+    def __init__(self, parent: Optional[QObject] = None, pool: Optional[QThreadPool] = None):
+        """
+        Initialize the runner
+        
+        Args:
+            parent: The owning QObject
+            pool: Thread pool to run requests on; defaults to api_thread_pool()
+        """
+        super().__init__(parent)
+        self.pool = pool or api_thread_pool()
+        self._active: Dict[str, ApiWorker] = {}
+        self._workers = set()
+    
+    def run(self, key: str, fn: Callable, *args,
+            on_result: Optional[Callable[[Any], None]] = None,
+            on_error: Optional[Callable[[str], None]] = None, **kwargs) -> ApiWorker:
+        """
+        Run fn(*args, **kwargs) in the background
+        
+        Args:
+            key: Identifies the request; a newer request with the same key cancels this one
+            fn: The function to call
+            on_result: Called on the UI thread with the result
+            on_error: Called on the UI thread with the error message
+        
+        Returns:
+            The started worker
+        """
+        was_busy = self.is_busy()
+        self.cancel(key, notify=False)
+        
+        worker = ApiWorker(fn, *args, **kwargs)
+        worker.signals.succeeded.connect(lambda result: self._deliver(key, worker, on_result, result))
+        worker.signals.failed.connect(lambda message: self._deliver(key, worker, on_error, message))
+        worker.signals.done.connect(lambda: self._finish(key, worker))
+        self._active[key] = worker
+        self._workers.add(worker)
+        self.pool.start(worker)
+        
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return worker
+    
+    def cancel(self, key: str, notify: bool = True):
+        """
+        Cancel the request running under a key, if any
+        
+        Args:
+            key: The request key
+            notify: Whether to emit busy_changed when nothing is left running
+        """
+        worker = self._active.pop(key, None)
+        if worker is None:
+            return
+        worker.cancelled = True
+        if self.pool.tryTake(worker):
+            # Never started, so it will not emit done
+            self._workers.discard(worker)
+        if notify and not self._active:
+            self.busy_changed.emit(False)
+    
+    def cancel_all(self):
+        """Cancel every request of this runner"""
+        for key in list(self._active):
+            self.cancel(key)
+    
+    def is_busy(self, key: Optional[str] = None) -> bool:
+        """
+        Check whether requests are running
+        
+        Args:
+            key: Only check this key; any key if None
+        
+        Returns:
+            True if a request is running
+        """
+        return key in self._active if key is not None else bool(self._active)
+    
+    def _deliver(self, key: str, worker: ApiWorker, callback: Optional[Callable], value: Any):
+        """Pass a result to its callback unless the request went stale"""
+        if worker.cancelled or self._active.get(key) is not worker:
+            return
+        del self._active[key]
+        if not self._active:
+            self.busy_changed.emit(False)
+        if callback is not None:
+            callback(value)
+    
+    def _finish(self, key: str, worker: ApiWorker):
+        """Release a worker once it has run"""
+        self._workers.discard(worker)
+        if self._active.get(key) is worker:
+            # Finished without delivering (cancelled before the call)
+            del self._active[key]
+            if not self._active:
+                self.busy_changed.emit(False)
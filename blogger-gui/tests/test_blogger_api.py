@@ -2,10 +2,15 @@
 Tests for the Blogger API client
 """
 
+import datetime
+import json
 import os
+import pickle
 import pytest
 from unittest.mock import MagicMock, patch
-from blogger_gui.api.blogger_api import BloggerApiClient
+from google.oauth2.credentials import Credentials
+from googleapiclient.http import HttpMockSequence
+from blogger_gui.api.blogger_api import BloggerApiClient, PostCache
 
 
 class TestBloggerApiClient:
@@ -17,7 +22,7 @@ class TestBloggerApiClient:
         assert client.credentials_file == 'credentials.json'
         assert client.service is None
     
-    @patch('blogger_gui.api.blogger_api.build')
+    @patch('blogger_gui.api.blogger_api.build_from_document')
     @patch('blogger_gui.api.blogger_api.InstalledAppFlow')
     @patch('blogger_gui.api.blogger_api.Path.exists')
     def test_authenticate_new_creds(self, mock_exists, mock_flow, mock_build):
@@ -37,10 +42,10 @@ class TestBloggerApiClient:
         assert result is True
         mock_flow.from_client_secrets_file.assert_called_once_with(
             client.credentials_file, client.SCOPES)
-        mock_build.assert_called_once_with(
-            client.API_SERVICE_NAME, client.API_VERSION, credentials=mock_creds)
+        mock_build.assert_called_once()
+        assert mock_build.call_args.kwargs['http'].credentials is mock_creds
     
-    @patch('blogger_gui.api.blogger_api.build')
+    @patch('blogger_gui.api.blogger_api.build_from_document')
     def test_get_blogs(self, mock_build):
         """Test getting blogs"""
         # Setup mocks
@@ -64,7 +69,7 @@ class TestBloggerApiClient:
         assert blogs[0]['name'] == 'Test Blog'
         mock_blogs.listByUser.assert_called_once_with(userId='self')
     
-    @patch('blogger_gui.api.blogger_api.build')
+    @patch('blogger_gui.api.blogger_api.build_from_document')
     def test_get_posts(self, mock_build):
         """Test getting posts"""
         # Setup mocks
@@ -89,3 +94,418 @@ class TestBloggerApiClient:
         assert posts[0]['id'] == 'post1'
         assert posts[0]['title'] == 'Test Post'
         mock_posts.list.assert_called_once_with(blogId='blog123', maxResults=5)
+    
+    def test_get_posts_with_listing_projection(self):
+        """Test that a listing projection skips post bodies"""
+        # Setup mocks
+        mock_service = MagicMock()
+        mock_posts = MagicMock()
+        mock_posts.list.return_value.execute.return_value = {
+            'items': [{'id': 'post1', 'title': 'Test Post'}]
+        }
+        mock_service.posts.return_value = mock_posts
+        
+        client = BloggerApiClient()
+        client.service = mock_service
+        
+        # Get posts
+        posts = client.get_posts('blog123', max_results=5, fields='listing')
+        
+        # Assertions
+        assert posts == [{'id': 'post1', 'title': 'Test Post'}]
+        mock_posts.list.assert_called_once_with(
+            blogId='blog123',
+            maxResults=5,
+            fields=BloggerApiClient.FIELD_PRESETS['listing'],
+            fetchBodies=False
+        )
+    
+    def test_get_pages_with_raw_fields_including_content(self):
+        """Test that a raw projection with content still fetches bodies"""
+        # Setup mocks
+        mock_service = MagicMock()
+        mock_pages = MagicMock()
+        mock_pages.list.return_value.execute.return_value = {'items': []}
+        mock_service.pages.return_value = mock_pages
+        
+        client = BloggerApiClient()
+        client.service = mock_service
+        
+        # Get pages
+        client.get_pages('blog123', fields='items(id,content)')
+        
+        # Assertions
+        mock_pages.list.assert_called_once_with(
+            blogId='blog123', maxResults=10, fields='items(id,content)')
+    
+    def test_get_post(self):
+        """Test getting a single full post"""
+        # Setup mocks
+        mock_service = MagicMock()
+        mock_posts = MagicMock()
+        mock_posts.get.return_value.execute.return_value = {'id': 'post1', 'content': '<p>Body</p>'}
+        mock_service.posts.return_value = mock_posts
+        
+        client = BloggerApiClient()
+        client.service = mock_service
+        
+        # Get post
+        post = client.get_post('blog123', 'post1')
+        
+        # Assertions
+        assert post['content'] == '<p>Body</p>'
+        mock_posts.get.assert_called_once_with(blogId='blog123', postId='post1')
+    
+    def test_get_posts_page(self):
+        """Test fetching a page of posts with a page token"""
+        # Setup mocks
+        mock_service = MagicMock()
+        mock_posts = MagicMock()
+        mock_posts.list.return_value.execute.return_value = {
+            'items': [{'id': 'post2'}], 'nextPageToken': 'token3'
+        }
+        mock_service.posts.return_value = mock_posts
+        
+        client = BloggerApiClient()
+        client.service = mock_service
+        
+        # Get the second page
+        items, next_token = client.get_posts_page('blog123', 'token2', max_results=50, fields='ids-only')
+        
+        # Assertions
+        assert items == [{'id': 'post2'}]
+        assert next_token == 'token3'
+        mock_posts.list.assert_called_once_with(
+            blogId='blog123',
+            maxResults=50,
+            fields=BloggerApiClient.FIELD_PRESETS['ids-only'],
+            fetchBodies=False,
+            pageToken='token2'
+        )
+
+
+class TestDiscoveryDocument:
+    """Test class for building the service from a local discovery document"""
+    
+    def test_authenticate_offline_with_saved_token(self, tmp_path, monkeypatch):
+        """Test that saved credentials build the service without a network request"""
+        monkeypatch.chdir(tmp_path)
+        creds = Credentials(token='expired', refresh_token='refresh', token_uri='https://oauth2.googleapis.com/token',
+                            client_id='id', client_secret='secret')
+        with open('token.pickle', 'wb') as token:
+            pickle.dump(creds, token)
+        
+        client = BloggerApiClient()
+        client.discovery_cache_path = str(tmp_path / 'missing.json')
+        with patch('google.oauth2.credentials.Credentials.refresh') as mock_refresh:
+            assert client.has_saved_credentials()
+            assert client.authenticate() is True
+        
+        mock_refresh.assert_not_called()
+        assert client.service.posts().list(blogId='blog123').uri.startswith('https://blogger.googleapis.com/')
+    
+    def test_refreshed_credentials_saved(self, tmp_path, monkeypatch):
+        """Test that a token refreshed by the first request is written back to the token file"""
+        monkeypatch.chdir(tmp_path)
+        creds = Credentials(token='expired', refresh_token='refresh', token_uri='https://oauth2.googleapis.com/token',
+                            client_id='id', client_secret='secret', expiry=datetime.datetime(2000, 1, 1))
+        with open('token.pickle', 'wb') as token:
+            pickle.dump(creds, token)
+        
+        def refresh(self, request):
+            self.token = 'fresh'
+            self.expiry = None
+        
+        client = BloggerApiClient()
+        responses = [({'status': '200'}, '{"items": []}')] * 2
+        with patch('blogger_gui.api.blogger_api.build_http', return_value=HttpMockSequence(responses)), \
+                patch.object(Credentials, 'refresh', autospec=True, side_effect=refresh) as mock_refresh:
+            assert client.authenticate() is True
+            client.service.blogs().listByUser(userId='self').execute()
+            
+            with open('token.pickle', 'rb') as token:
+                assert pickle.load(token).token == 'fresh'
+            
+            # A request with the same token does not write the file again
+            os.remove('token.pickle')
+            client.service.blogs().listByUser(userId='self').execute()
+        
+        assert mock_refresh.call_count == 1
+        assert not os.path.exists('token.pickle')
+    
+    def test_newest_revision_wins(self, tmp_path):
+        """Test that a cached document replaces an older bundled one"""
+        client = BloggerApiClient()
+        client.discovery_cache_path = str(tmp_path / 'blogger.v3.json')
+        bundled = client._discovery_document()
+        
+        with open(client.discovery_cache_path, 'w') as f:
+            json.dump(dict(bundled, revision='99990101'), f)
+        assert client._discovery_document()['revision'] == '99990101'
+        
+        with open(client.discovery_cache_path, 'w') as f:
+            json.dump(dict(bundled, revision='20000101'), f)
+        assert client._discovery_document()['revision'] == bundled['revision']
+    
+    @patch('blogger_gui.api.blogger_api.requests.get')
+    def test_refresh_only_when_stale(self, mock_get, tmp_path):
+        """Test that the document is downloaded again only after it aged"""
+        client = BloggerApiClient()
+        client.discovery_cache_path = str(tmp_path / 'blogger.v3.json')
+        mock_get.return_value.json.return_value = {'name': 'blogger', 'version': 'v3', 'revision': '99990101'}
+        
+        assert client.refresh_discovery_document() is True
+        assert client._discovery_document()['revision'] == '99990101'
+        assert client.refresh_discovery_document() is False
+        assert mock_get.call_count == 1
+        assert client.refresh_discovery_document(max_age=0) is True
+
+
+def epoch(timestamp):
+    """Seconds since the epoch of an RFC 3339 timestamp"""
+    return datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+
+
+def make_post(post_id, updated, title=None):
+    """A post summary as the API returns it"""
+    return {'id': post_id, 'title': title or f'Post {post_id}', 'published': updated, 'updated': updated}
+
+
+class TestPostCache:
+    """Test class for the local cache"""
+    
+    def test_listing_pages_complete_the_cache(self, tmp_path):
+        """Test that a listing from the first to the last page drops deleted posts"""
+        cache = PostCache(str(tmp_path / 'cache.sqlite3'))
+        cache.put_summaries('blog1', 'post', [make_post('gone', '2024-01-01T00:00:00Z')])
+        
+        cache.add_listing_page('blog1', 'post', [make_post('2', '2024-03-01T00:00:00Z')], first=True, last=False)
+        assert not cache.is_complete('blog1', 'post')
+        cache.add_listing_page('blog1', 'post', [make_post('1', '2024-02-01T00:00:00Z')], first=False, last=True)
+        
+        assert cache.is_complete('blog1', 'post')
+        assert [post['id'] for post in cache.get_summaries('blog1', 'post')] == ['2', '1']
+    
+    def test_watermark_only_moved_by_listings(self, tmp_path):
+        """Test that stored posts leave the watermark alone and an unfinished listing does not move it"""
+        cache = PostCache(str(tmp_path / 'cache.sqlite3'))
+        cache.put_item('blog1', 'post', make_post('1', '2024-05-01T00:00:00Z'))
+        cache.put_summaries('blog1', 'post', [make_post('2', '2024-06-01T00:00:00Z')])
+        assert cache.watermark('blog1', 'post') is None
+        
+        cache.add_listing_page('blog1', 'post', [make_post('3', '2024-07-01T00:00:00Z')], first=True, last=False)
+        assert cache.watermark('blog1', 'post') is None
+        cache.add_listing_page('blog1', 'post', [make_post('1', '2024-02-01T00:00:00Z')], first=False, last=True)
+        listed = cache.watermark('blog1', 'post')
+        
+        # Older revalidation results never move it back
+        cache.advance_watermark('blog1', 'post', [make_post('1', '2024-01-01T00:00:00Z')])
+        cache.advance_watermark('blog1', 'post', [])
+        
+        assert listed == epoch('2024-07-01T00:00:00Z')
+        assert cache.watermark('blog1', 'post') == listed
+        assert cache.watermark('blog1', 'page') is None
+        assert cache.is_complete('blog1', 'post')
+    
+    def test_persists_between_sessions(self, tmp_path):
+        """Test that a new cache on the same file sees the stored data"""
+        path = str(tmp_path / 'cache.sqlite3')
+        cache = PostCache(path)
+        cache.put_blogs([{'id': 'blog1', 'name': 'Blog'}])
+        cache.put_item('blog1', 'post', dict(make_post('1', '2024-02-01T00:00:00Z'), content='<p>Body</p>'))
+        cache.close()
+        
+        cache = PostCache(path)
+        assert cache.get_blogs() == [{'id': 'blog1', 'name': 'Blog'}]
+        assert cache.get_item('blog1', 'post', '1')['content'] == '<p>Body</p>'
+        # Summaries do not keep the body
+        assert 'content' not in cache.get_summaries('blog1', 'post')[0]
+
+
+class TestBloggerApiClientCache:
+    """Test class for BloggerApiClient with a local cache"""
+    
+    def test_revalidate_posts_stops_at_cached(self, tmp_path):
+        """Test that revalidation only fetches posts updated since the cached ones"""
+        client = BloggerApiClient(cache_path=str(tmp_path / 'cache.sqlite3'))
+        client.cache.add_listing_page('blog123', 'post', [make_post('1', '2024-02-01T00:00:00Z')],
+                                      first=True, last=True)
+        mock_service = MagicMock()
+        mock_service.posts.return_value.list.return_value.execute.return_value = {
+            'items': [make_post('2', '2024-03-01T00:00:00Z'), make_post('1', '2024-02-01T00:00:00Z'),
+                      make_post('0', '2024-01-01T00:00:00Z')],
+            'nextPageToken': 'token2'
+        }
+        client.service = mock_service
+        
+        changed = client.revalidate_posts('blog123')
+        
+        # The post updated in the same second as the newest cached one is fetched again
+        assert [post['id'] for post in changed] == ['2', '1']
+        assert mock_service.posts.return_value.list.call_count == 1
+        assert mock_service.posts.return_value.list.call_args.kwargs['orderBy'] == 'UPDATED'
+        assert [post['id'] for post in client.get_cached_posts('blog123')] == ['2', '1']
+        assert client.cache.watermark('blog123', 'post') == epoch('2024-03-01T00:00:00Z')
+    
+    def test_revalidate_after_local_save(self, tmp_path):
+        """Test that saving a post locally does not hide posts other clients changed before the save"""
+        client = BloggerApiClient(cache_path=str(tmp_path / 'cache.sqlite3'))
+        client.cache.add_listing_page('blog123', 'post', [make_post('2', '2024-02-02T00:00:00Z'),
+                                                          make_post('1', '2024-02-01T00:00:00Z')],
+                                      first=True, last=True)
+        watermark = client.cache.watermark('blog123', 'post')
+        # This client saves post 1 after another client changed post 2
+        client.cache.put_item('blog123', 'post', dict(make_post('1', '2024-03-10T00:00:00Z'), content='<p>Local</p>'))
+        assert client.cache.watermark('blog123', 'post') == watermark
+        mock_service = MagicMock()
+        mock_service.posts.return_value.list.return_value.execute.return_value = {
+            'items': [make_post('1', '2024-03-10T00:00:00Z'), make_post('2', '2024-03-05T00:00:00Z', 'Remote edit'),
+                      make_post('0', '2024-01-01T00:00:00Z')],
+            'nextPageToken': 'token2'
+        }
+        client.service = mock_service
+        
+        changed = client.revalidate_posts('blog123')
+        
+        assert [post['id'] for post in changed] == ['1', '2']
+        assert {post['id']: post['title'] for post in client.get_cached_posts('blog123')}['2'] == 'Remote edit'
+        assert client.cache.watermark('blog123', 'post') == epoch('2024-03-10T00:00:00Z')
+    
+    def test_get_post_from_cache(self, tmp_path):
+        """Test that an unchanged post is returned without a request"""
+        client = BloggerApiClient(cache_path=str(tmp_path / 'cache.sqlite3'))
+        post = dict(make_post('post1', '2024-02-01T00:00:00Z'), content='<p>Body</p>')
+        client.cache.put_item('blog123', 'post', post)
+        client.service = MagicMock()
+        
+        assert client.get_post('blog123', 'post1', updated='2024-02-01T00:00:00Z') == post
+        client.service.posts.assert_not_called()
+        
+        # A newer summary means the cached post is stale
+        client.service.posts.return_value.get.return_value.execute.return_value = {'id': 'post1'}
+        assert client.get_post('blog123', 'post1', updated='2024-03-01T00:00:00Z') == {'id': 'post1'}
+    
+    def test_delete_post_removes_cached(self, tmp_path):
+        """Test that a deleted post leaves the cache"""
+        client = BloggerApiClient(cache_path=str(tmp_path / 'cache.sqlite3'))
+        client.cache.put_summaries('blog123', 'post', [make_post('post1', '2024-02-01T00:00:00Z')])
+        client.service = MagicMock()
+        
+        assert client.delete_post('blog123', 'post1') is True
+        assert client.get_cached_posts('blog123') == []
+
+
+class FakeBatch:
+    """
+    Stands in for BatchHttpRequest; requests for IDs in failing report an error, and
+    a response for an ID in aborting makes execute() raise before the remaining callbacks
+    """
+    
+    def __init__(self, callback, sizes, failing, aborting=()):
+        self.callback = callback
+        self.sizes = sizes
+        self.failing = failing
+        self.aborting = aborting
+        self.requests = []
+    
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+    
+    def execute(self):
+        self.sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            if request_id in self.aborting:
+                raise ValueError("Invalid batch response")
+            if request_id in self.failing:
+                self.callback(request_id, None, Exception("Forbidden"))
+            else:
+                self.callback(request_id, request, None)
+
+
+def make_batch_service(sizes, failing=(), aborting=()):
+    """A service whose requests are their own keyword arguments"""
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback, sizes, failing, aborting)
+    service.posts.return_value.get.side_effect = lambda **kwargs: {'id': kwargs['postId']}
+    service.posts.return_value.delete.side_effect = lambda **kwargs: ''
+    service.posts.return_value.patch.side_effect = lambda **kwargs: dict(kwargs['body'], id=kwargs['postId'])
+    return service
+
+
+class TestBulkOperations:
+    """Test class for the batch bulk methods"""
+    
+    def test_bulk_get_posts_in_batches(self):
+        """Test that requests are sent in batches of at most BATCH_LIMIT"""
+        sizes = []
+        client = BloggerApiClient()
+        client.service = make_batch_service(sizes, failing={'7'})
+        
+        posts, errors = client.bulk_get_posts('blog123', [str(i) for i in range(120)])
+        
+        assert sizes == [50, 50, 20]
+        assert len(posts) == 119
+        assert posts['8'] == {'id': '8'}
+        assert errors == {'7': 'Forbidden'}
+    
+    def test_bulk_update_labels(self):
+        """Test that labels are added and removed, skipping posts that would not change"""
+        sizes = []
+        client = BloggerApiClient()
+        client.service = make_batch_service(sizes)
+        posts = [
+            {'id': '1', 'labels': ['keep', 'old']},
+            {'id': '2', 'labels': ['new']},
+            {'id': '3'},
+        ]
+        
+        updated, errors = client.bulk_update_labels('blog123', posts, add=['new'], remove=['old'])
+        
+        assert updated == {'1': {'id': '1', 'labels': ['keep', 'new']}, '3': {'id': '3', 'labels': ['new']}}
+        assert errors == {}
+        assert sizes == [2]
+    
+    def test_bulk_update_labels_mixed_outcomes(self, tmp_path):
+        """Test that each post of a partly failed batch is either updated and cached or reported, never both"""
+        client = BloggerApiClient(cache_path=str(tmp_path / 'cache.sqlite3'))
+        posts = [make_post(post_id, '2024-02-01T00:00:00Z') for post_id in '12345']
+        client.cache.put_summaries('blog123', 'post', posts)
+        client.service = make_batch_service([], failing={'2'}, aborting={'4'})
+        
+        updated, errors = client.bulk_update_labels('blog123', posts, add=['new'])
+        
+        assert sorted(updated) == ['1', '3']
+        assert errors == {'2': 'Forbidden', '4': 'Invalid batch response', '5': 'Invalid batch response'}
+        assert {post_id: client.cache.get_item('blog123', 'post', post_id) is not None for post_id in '12345'} == {
+            '1': True, '2': False, '3': True, '4': False, '5': False}
+    
+    def test_batch_outcome_reported_last_wins(self):
+        """Test that a request reported twice ends up only on the side of its last outcome"""
+        client = BloggerApiClient()
+        client.service = MagicMock()
+        
+        def execute(batch_callback):
+            batch_callback('1', None, Exception("Backend Error"))
+            batch_callback('1', {'id': '1'}, None)
+            batch_callback('2', {'id': '2'}, None)
+            batch_callback('2', None, Exception("Backend Error"))
+        
+        client.service.new_batch_http_request.side_effect = lambda callback: MagicMock(
+            execute=lambda: execute(callback))
+        
+        responses, errors = client._execute_batch({'1': MagicMock(), '2': MagicMock()})
+        
+        assert responses == {'1': {'id': '1'}}
+        assert errors == {'2': 'Backend Error'}
+    
+    def test_bulk_delete_posts_updates_cache(self, tmp_path):
+        """Test that deleted posts leave the cache and failed ones stay"""
+        client = BloggerApiClient(cache_path=str(tmp_path / 'cache.sqlite3'))
+        client.cache.put_summaries('blog123', 'post', [make_post(post_id, '2024-02-01T00:00:00Z') for post_id in '12'])
+        client.service = make_batch_service([], failing={'2'})
+        
+        deleted, errors = client.bulk_delete_posts('blog123', ['1', '2'])
+        
+        assert deleted == ['1']
+        assert errors == {'2': 'Forbidden'}
+        assert [post['id'] for post in client.get_cached_posts('blog123')] == ['2']
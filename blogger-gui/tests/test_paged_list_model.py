@@ -0,0 +1,120 @@
+"""
+Tests for the paged list model
+"""
+
+import time
+
+import pytest
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from blogger_gui.ui.paged_list_model import PagedListModel
+
+
+@pytest.fixture(scope='module')
+def app():
+    """A QApplication for the signal deliveries"""
+    return QApplication.instance() or QApplication([])
+
+
+def wait_until(condition, timeout=5.0):
+    """Process Qt events until condition() holds"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the model"
+        QApplication.processEvents()
+        time.sleep(0.005)
+
+
+def make_fetcher(total, page_size, calls):
+    """A page fetcher over total numbered posts"""
+    def fetch_page(page_token):
+        start = int(page_token or 0)
+        calls.append(page_token)
+        items = [{'id': str(i), 'title': f'Post {i}'} for i in range(start, min(start + page_size, total))]
+        next_token = str(start + page_size) if start + page_size < total else None
+        return items, next_token
+    return fetch_page
+
+
+class TestPagedListModel:
+    """Test class for PagedListModel"""
+    
+    def test_pages_through_tokens(self, app):
+        """Test that fetchMore follows nextPageToken until the last page"""
+        calls = []
+        model = PagedListModel()
+        model.reset(make_fetcher(5, 2, calls))
+        wait_until(lambda: model.rowCount() == 2 and model.canFetchMore())
+        
+        model.fetchMore()
+        wait_until(lambda: model.rowCount() == 4 and model.canFetchMore())
+        model.fetchMore()
+        wait_until(lambda: model.rowCount() == 5)
+        
+        assert calls == [None, '2', '4']
+        assert not model.canFetchMore()
+        assert model.data(model.index(4)) == 'Post 4'
+        assert model.data(model.index(4), PagedListModel.ItemRole) == {'id': '4', 'title': 'Post 4'}
+    
+    def test_untitled_items(self, app):
+        """Test the text of items without a title"""
+        model = PagedListModel(untitled='Untitled Post')
+        model.reset(lambda page_token: ([{'id': '1'}], None))
+        wait_until(lambda: model.rowCount() == 1)
+        
+        assert model.data(model.index(0), Qt.ItemDataRole.DisplayRole) == 'Untitled Post'
+    
+    def test_reset_drops_stale_page(self, app):
+        """Test that a page of the previous source is not appended after a reset"""
+        model = PagedListModel()
+        model.reset(lambda page_token: ([{'id': 'old'}], None))
+        model.reset(lambda page_token: ([{'id': 'new'}], None))
+        wait_until(lambda: model.rowCount() == 1)
+        
+        assert model.items() == [{'id': 'new'}]
+    
+    def test_failed_page_stops_paging(self, app):
+        """Test that a failed page is reported and not retried"""
+        errors = []
+        
+        def fail(page_token):
+            raise RuntimeError("quota")
+        
+        model = PagedListModel()
+        model.load_failed.connect(errors.append)
+        model.reset(fail)
+        wait_until(lambda: errors)
+        
+        assert errors == ["quota"]
+        assert not model.canFetchMore()
+    
+    def test_cached_rows_merged_with_pages(self, app):
+        """Test that pages update cached rows in place and drop deleted ones"""
+        calls = []
+        cached = [{'id': '4', 'title': 'Old title'}, {'id': 'deleted', 'title': 'Deleted'}, {'id': '3', 'title': 'Post 3'}]
+        
+        def fetch_page(page_token):
+            calls.append(page_token)
+            if page_token is None:
+                return [{'id': '5', 'title': 'Post 5'}, {'id': '4', 'title': 'Post 4'}], 'next'
+            return [{'id': '3', 'title': 'Post 3'}], None
+        
+        model = PagedListModel()
+        model.reset(fetch_page, cached)
+        # Cached rows show before any page is in
+        assert model.rowCount() == 3
+        # Pages follow on their own while cached rows are not confirmed yet
+        wait_until(lambda: calls == [None, 'next'] and not model.runner.is_busy())
+        
+        assert [item['title'] for item in model.items()] == ['Post 5', 'Post 4', 'Post 3']
+    
+    def test_merge_inserts_new_items_first(self, app):
+        """Test that merged items update known rows and put new ones first"""
+        model = PagedListModel()
+        model.reset(None, [{'id': '1', 'title': 'One'}, {'id': '2', 'title': 'Two'}])
+        
+        model.merge([{'id': '2', 'title': 'Two, edited'}, {'id': '3', 'title': 'Three'}])
+        
+        assert [item['title'] for item in model.items()] == ['Three', 'One', 'Two, edited']
+        assert not model.canFetchMore()
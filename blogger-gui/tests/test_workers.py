@@ -0,0 +1,131 @@
+"""
+Tests for the background request runner
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from blogger_gui.ui.workers import RequestRunner, background_thread_pool
+
+
+@pytest.fixture(scope='module')
+def app():
+    """A QApplication for the signal deliveries"""
+    return QApplication.instance() or QApplication([])
+
+
+def wait_until(condition, timeout=5.0):
+    """Process Qt events until condition() holds"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the worker"
+        QApplication.processEvents()
+        time.sleep(0.005)
+
+
+class TestRequestRunner:
+    """Test class for RequestRunner"""
+    
+    def test_result_delivered_on_ui_thread(self, app):
+        """Test that results come back on the thread that started the request"""
+        runner = RequestRunner(pool=QThreadPool())
+        results = []
+        worker_threads = []
+        
+        def call(value):
+            worker_threads.append(threading.current_thread())
+            return value * 2
+        
+        runner.run('load', call, 21, on_result=lambda result: results.append((result, threading.current_thread())))
+        wait_until(lambda: results)
+        
+        assert results == [(42, threading.main_thread())]
+        assert worker_threads[0] is not threading.main_thread()
+        assert not runner.is_busy()
+    
+    def test_error_delivered(self, app):
+        """Test that exceptions are reported to on_error"""
+        runner = RequestRunner(pool=QThreadPool())
+        errors = []
+        
+        def fail():
+            raise RuntimeError("boom")
+        
+        runner.run('load', fail, on_result=MagicMock(), on_error=errors.append)
+        wait_until(lambda: errors)
+        
+        assert errors == ["boom"]
+    
+    def test_newer_request_discards_stale_result(self, app):
+        """Test that a request under the same key makes the running one stale"""
+        pool = QThreadPool()
+        pool.setMaxThreadCount(1)
+        runner = RequestRunner(pool=pool)
+        release = threading.Event()
+        calls = []
+        results = []
+        
+        def slow(blog_id):
+            calls.append(blog_id)
+            release.wait(5)
+            return blog_id
+        
+        runner.run('load', slow, 'blog1', on_result=results.append)
+        wait_until(lambda: calls)
+        runner.run('load', slow, 'blog2', on_result=results.append)
+        # Queued behind the running request, so it is taken off the queue without running
+        runner.run('load', slow, 'blog3', on_result=results.append)
+        release.set()
+        wait_until(lambda: results)
+        pool.waitForDone()
+        QApplication.processEvents()
+        
+        assert calls == ['blog1', 'blog3']
+        assert results == ['blog3']
+    
+    def test_busy_changed(self, app):
+        """Test that the loading state follows the running requests"""
+        runner = RequestRunner(pool=QThreadPool())
+        states = []
+        runner.busy_changed.connect(states.append)
+        
+        runner.run('load', lambda: None)
+        runner.run('other', lambda: None)
+        wait_until(lambda: not runner.is_busy())
+        
+        assert states == [True, False]
+    
+    def test_cancel_all(self, app):
+        """Test that cancelled requests never report back"""
+        pool = QThreadPool()
+        runner = RequestRunner(pool=pool)
+        results = []
+        
+        runner.run('load', lambda: 'posts', on_result=results.append)
+        runner.cancel_all()
+        pool.waitForDone()
+        QApplication.processEvents()
+        
+        assert results == []
+        assert not runner.is_busy()
+    
+    def test_background_work_does_not_block_api_requests(self, app):
+        """Test that a slow background call does not delay requests on the API pool"""
+        release = threading.Event()
+        background = RequestRunner(pool=background_thread_pool())
+        runner = RequestRunner(pool=QThreadPool())
+        results = []
+        
+        background.run('discovery', release.wait, 5)
+        runner.run('blogs', lambda: 'blogs', on_result=results.append)
+        wait_until(lambda: results)
+        release.set()
+        background_thread_pool().waitForDone()
+        
+        assert results == ['blogs']
+        assert background_thread_pool().maxThreadCount() == 1
@@ -0,0 +1,112 @@
+"""
+Benchmark comparing the pooled BloggerTransport against one-off requests calls.
+A local stub server stands in for googleapis.com, so no API key or network is needed.
+Every new connection can be delayed to simulate the TCP+TLS handshake cost.
+
+Usage:
+    python benchmarks/bench_transport.py --requests 500 --handshake-ms 20
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blogger_api_cli.api import BloggerTransport
+
+
+def make_handler(handshake_delay, body):
+    """
+    Build a request handler class serving a fixed JSON body over keep-alive connections.
+
+    Args:
+        handshake_delay (float): Seconds to wait when a new connection is opened.
+        body (bytes): The response body returned for every GET request.
+
+    Returns:
+        type: A BaseHTTPRequestHandler subclass.
+    """
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are written separately; avoid Nagle stalls on keep-alive sockets
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            if handshake_delay:
+                time.sleep(handshake_delay)
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+
+def run_per_call(url, count):
+    """Issue requests with a fresh connection each time, like the original code path."""
+    for _ in range(count):
+        response = requests.get(url, params={'key': 'bench'}, headers={'Content-Type': 'application/json'})
+        response.json()
+
+
+def run_pooled(url, count, pool_size):
+    """Issue requests over a single pooled BloggerTransport."""
+    with BloggerTransport(pool_size=pool_size) as transport:
+        for _ in range(count):
+            response = transport.request('GET', url, params={'key': 'bench'},
+                                         headers={'Content-Type': 'application/json'})
+            response.json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-call HTTP transport")
+    parser.add_argument('--requests', type=int, default=200, help='Number of requests per run')
+    parser.add_argument('--handshake-ms', type=float, default=10.0,
+                        help='Simulated connection setup delay in milliseconds')
+    parser.add_argument('--pool-size', type=int, default=BloggerTransport.DEFAULT_POOL_SIZE,
+                        help='Connection pool size for the pooled transport')
+    args = parser.parse_args()
+
+    body = json.dumps({'kind': 'blogger#post', 'id': '1', 'title': 'Benchmark'}).encode('utf-8')
+    handler = make_handler(args.handshake_ms / 1000.0, body)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/blogger/v3/blogs/1/posts/1'
+
+    try:
+        print(f"Requests per run: {args.requests}, simulated handshake: {args.handshake_ms} ms")
+
+        start = time.perf_counter()
+        run_per_call(url, args.requests)
+        per_call = time.perf_counter() - start
+        print(f"Per-call requests: {per_call:.3f}s ({args.requests / per_call:.1f} req/s)")
+
+        start = time.perf_counter()
+        run_pooled(url, args.requests, args.pool_size)
+        pooled = time.perf_counter() - start
+        print(f"Pooled transport:  {pooled:.3f}s ({args.requests / pooled:.1f} req/s)")
+
+        print(f"Speedup: {per_call / pooled:.1f}x")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,391 @@
 import requests
 import json
 import os
-from typing import Dict, Any, Optional, Union
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Union, Tuple
+
+from blogger_api_cli.cache import ResponseCache
+from blogger_api_cli.request_log import RequestLogger
+
+
+SUPPORTED_METHODS = ('GET', 'POST', 'DELETE', 'PATCH', 'PUT')
+
+
+class ThrottleStats:
+    """
+    Counters describing how much time a transport spent on retries and rate limiting.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.backoff_time = 0.0
+        self.rate_limit_waits = 0
+        self.rate_limit_time = 0.0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.backoff_time += delay
+
+    def record_rate_limit_wait(self, delay: float) -> None:
+        with self._lock:
+            self.rate_limit_waits += 1
+            self.rate_limit_time += delay
+
+    def summary(self) -> str:
+        """
+        Returns:
+            str: A one-line human readable summary of the counters.
+        """
+        return (f"{self.requests} requests, {self.retries} retries ({self.backoff_time:.1f}s backoff), "
+                f"{self.rate_limit_waits} rate limit waits ({self.rate_limit_time:.1f}s)")
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request should be retried and how long to wait before doing so.
+    Uses exponential backoff with full jitter and honours the Retry-After header.
+    Non-idempotent requests (POST, PATCH) may already have been applied when an attempt fails,
+    so they are only retried when the server says it did not process them.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 1.0, backoff_max: float = 60.0,
+                 retry_statuses: Tuple[int, ...] = RETRY_STATUSES):
+        """
+        Args:
+            max_retries (int): Maximum number of retries after the first attempt.
+            backoff_base (float): Base delay in seconds for the first retry.
+            backoff_max (float): Upper bound in seconds for a single delay.
+            retry_statuses (tuple): HTTP status codes that are worth retrying.
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+
+    def should_retry(self, attempt: int, response: Optional[requests.Response] = None,
+                     method: str = 'GET', error: Optional[Exception] = None) -> bool:
+        """
+        Non-idempotent methods are retried on 429, on 503 with a Retry-After header and after
+        a connect timeout (the request was never sent), never after a read timeout or another
+        connection error.
+        
+        Args:
+            attempt (int): Number of retries already made.
+            response (requests.Response, optional): The response, or None after a connection error.
+            method (str): HTTP method of the request.
+            error (Exception, optional): The connection error or timeout, if there is no response.
+        
+        Returns:
+            bool: True if another attempt should be made.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if method.upper() in self.IDEMPOTENT_METHODS:
+            return response is None or response.status_code in self.retry_statuses
+        if response is None:
+            return isinstance(error, requests.exceptions.ConnectTimeout)
+        if response.status_code == 429:
+            return True
+        return response.status_code == 503 and 'Retry-After' in response.headers
+
+    def delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Compute the delay before the next attempt.
+        
+        Args:
+            attempt (int): Number of retries already made.
+            response (requests.Response, optional): The response that triggered the retry.
+        
+        Returns:
+            float: Seconds to wait.
+        """
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _retry_after(response: Optional[requests.Response]) -> Optional[float]:
+        """Parse the Retry-After header, given either in seconds or as an HTTP date."""
+        if response is None:
+            return None
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class RateLimiter:
+    """
+    A client-side token bucket limiter keeping request rates under the project quota.
+    Separate buckets enforce the per-second and per-minute limits; a limit of 0 disables it.
+    """
+
+    def __init__(self, requests_per_second: float = 0, requests_per_minute: float = 0):
+        """
+        Args:
+            requests_per_second (float): Maximum sustained requests per second (0 for unlimited).
+            requests_per_minute (float): Maximum sustained requests per minute (0 for unlimited).
+        """
+        self._buckets = []
+        if requests_per_second:
+            self._buckets.append(_TokenBucket(requests_per_second, requests_per_second))
+        if requests_per_minute:
+            self._buckets.append(_TokenBucket(requests_per_minute, requests_per_minute / 60.0))
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token from every bucket.
+        
+        Returns:
+            float: Seconds the caller must wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            return max([bucket.reserve(now) for bucket in self._buckets], default=0.0)
+
+
+class _TokenBucket:
+    """A single token bucket; tokens may go negative to queue up reservations."""
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class BloggerTransport:
+    """
+    A reusable HTTP transport for the Blogger API.
+    Keeps a persistent requests.Session with a sized connection pool, so repeated
+    calls reuse the same keep-alive TCP/TLS connections instead of opening a new
+    one per request. Responses are negotiated with gzip compression.
+    Throttled and failed requests are retried according to the retry policy,
+    and every attempt passes through the rate limiter first.
+    GET responses are revalidated against the response cache when one is configured.
+    """
+
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_TIMEOUT = 30.0
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 logger: Optional[RequestLogger] = None,
+                 cache: Optional[ResponseCache] = None):
+        """
+        Initialize the transport and its underlying session.
+        
+        Args:
+            pool_size (int): Number of connections kept alive per host.
+            timeout (float, optional): Timeout in seconds for each request. None disables it.
+            retry_policy (RetryPolicy, optional): Retry policy. Defaults to RetryPolicy().
+            rate_limiter (RateLimiter, optional): Rate limiter. Defaults to no limit.
+            logger (RequestLogger, optional): Request logger. Defaults to full text output.
+            cache (ResponseCache, optional): ETag cache for GET responses. Defaults to no caching.
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.logger = logger if logger is not None else RequestLogger()
+        self.cache = cache
+        self.stats = ThrottleStats()
+        self.session = requests.Session()
+        self._mount_adapter()
+
+        # Google APIs only serve gzip to clients that mention it in the User-Agent
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'User-Agent': 'blogger_api_cli (gzip)',
+        })
+
+    @classmethod
+    def from_config(cls, config, logger: Optional[RequestLogger] = None,
+                    cache: Optional[ResponseCache] = None) -> 'BloggerTransport':
+        """
+        Create a transport using the connection settings from a BloggerConfig.
+        
+        Args:
+            config (BloggerConfig): Configuration object with Blogger settings.
+            logger (RequestLogger, optional): Request logger. Defaults to the config's log settings.
+            cache (ResponseCache, optional): ETag cache for GET responses. Defaults to no caching.
+        
+        Returns:
+            BloggerTransport: A new transport instance.
+        """
+        retry_policy = RetryPolicy(max_retries=config.max_retries,
+                                   backoff_base=config.backoff_base,
+                                   backoff_max=config.backoff_max)
+        rate_limiter = RateLimiter(requests_per_second=config.requests_per_second,
+                                   requests_per_minute=config.requests_per_minute)
+        if logger is None:
+            logger = RequestLogger(level=config.log_level, log_format=config.log_format)
+        return cls(pool_size=config.pool_size, timeout=config.timeout,
+                   retry_policy=retry_policy, rate_limiter=rate_limiter, logger=logger, cache=cache)
+
+    def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                data: Optional[Dict[str, Any]] = None,
+                headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Send an HTTP request over the pooled session, retrying throttled or failed attempts.
+        Connection errors are re-raised once the retries are exhausted.
+        Cached GET responses are revalidated with If-None-Match and served from disk on a 304.
+        
+        Parameters:
+            method (str): HTTP method ('GET', 'POST', 'PUT', 'PATCH', 'DELETE')
+            url (str): The API endpoint URL
+            params (dict, optional): Query parameters
+            data (dict, optional): The JSON data to send in the request body
+            headers (dict, optional): Additional request headers
+        
+        Returns:
+            requests.Response: The response object.
+        """
+        if method != 'GET' or self.cache is None:
+            return self._send(method, url, params, data, headers)
+
+        entry = self.cache.get(url, params)
+        if entry is not None:
+            headers = dict(headers or {})
+            headers['If-None-Match'] = entry['etag']
+
+        response = self._send(method, url, params, data, headers)
+        if response.status_code == 304 and entry is not None:
+            return self.cache.revalidated(url, params, entry, response)
+
+        self.cache.record_miss()
+        self.cache.store(url, params, response)
+        return response
+
+    def _send(self, method: str, url: str, params: Optional[Dict[str, Any]],
+              data: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> requests.Response:
+        """Send a request, applying the rate limiter and the retry policy."""
+        attempt = 0
+        while True:
+            self.wait_for_rate_limit()
+            self.stats.record_request()
+            try:
+                response = self.session.request(method, url, params=params, json=data,
+                                                headers=headers, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not self.retry_policy.should_retry(attempt, method=method, error=e):
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                self.logger.log_retry(f"Request error ({e})", delay, attempt + 1, self.retry_policy.max_retries)
+            else:
+                if not self.retry_policy.should_retry(attempt, response, method=method):
+                    return response
+                delay = self.retry_policy.delay(attempt, response)
+                self.logger.log_retry(f"Status {response.status_code}", delay, attempt + 1,
+                                      self.retry_policy.max_retries)
+                response.close()
+
+            self.stats.record_retry(delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def _mount_adapter(self) -> None:
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def ensure_pool_size(self, pool_size: int) -> None:
+        """
+        Grow the connection pool so it keeps pool_size connections per host alive.
+        Concurrent callers need a connection each; with a smaller pool, urllib3 discards the
+        connections above its size after every request instead of reusing them.
+        
+        Args:
+            pool_size (int): Number of connections needed at once.
+        """
+        if pool_size <= self.pool_size:
+            return
+        self.pool_size = pool_size
+        self._mount_adapter()
+
+    def wait_for_rate_limit(self) -> None:
+        """Block until the rate limiter allows another request."""
+        delay = self.rate_limiter.reserve()
+        if delay > 0:
+            self.stats.record_rate_limit_wait(delay)
+            time.sleep(delay)
+
+    def close(self) -> None:
+        """Close the session and release all pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> 'BloggerTransport':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+_default_transport: Optional[BloggerTransport] = None
+
+
+def get_default_transport() -> BloggerTransport:
+    """
+    Return the shared transport used by blogger_api_request, creating it on first use.
+    
+    Returns:
+        BloggerTransport: The shared transport instance.
+    """
+    global _default_transport
+    if _default_transport is None:
+        _default_transport = BloggerTransport()
+    return _default_transport
+
+
+def set_default_transport(transport: Optional[BloggerTransport]) -> None:
+    """
+    Replace the shared transport used by blogger_api_request.
+    
+    Args:
+        transport (BloggerTransport, optional): The transport to share, or None to reset it.
+    """
+    global _default_transport
+    _default_transport = transport
 
 
 # --- Helper Function for API Calls ---
 def blogger_api_request(method: str, url: str, data: Optional[Dict[str, Any]] = None, 
                         params: Optional[Dict[str, Any]] = None, 
-                        return_json: bool = False) -> Union[requests.Response, Dict[str, Any], None]:
+                        return_json: bool = False,
+                        transport: Optional[BloggerTransport] = None) -> Union[requests.Response, Dict[str, Any], None]:
     """
-    Makes an HTTP request to the Blogger API and prints the response.
+    Makes an HTTP request to the Blogger API and logs it using the transport's logger.
     The API key is loaded from the BLOGGER_API_KEY environment variable.
     
     Parameters:
@@ -18,6 +394,8 @@ def blogger_api_request(method: str, url: str, data: Optional[Dict[str, Any]] =
         data (dict, optional): The JSON data to send in the request body
         params (dict, optional): Additional query parameters to include
         return_json (bool): Whether to return the JSON response instead of the Response object
+        transport (BloggerTransport, optional): Transport to send the request with.
+                                                Defaults to the shared transport.
     
     Returns:
         Response object, JSON dict, or None if an error occurred
@@ -32,65 +410,52 @@ def blogger_api_request(method: str, url: str, data: Optional[Dict[str, Any]] =
 
     headers = {'Content-Type': 'application/json'}
 
-    print(f"\n--- Testing {method} request ---")
-    print(f"URL: {url}")
-    print(f"Params: {full_params}")
-    if data:
-        print(f"Body: {json.dumps(data, indent=2)}")
+    if transport is None:
+        transport = get_default_transport()
+    logger = transport.logger
+
+    logger.log_request(method, url, full_params, data)
+
+    if method not in SUPPORTED_METHODS:
+        print(f"Unsupported method: {method}")
+        return None
 
     try:
-        if method == 'GET':
-            response = requests.get(url, params=full_params, headers=headers)
-        elif method == 'POST':
-            response = requests.post(url, json=data, params=full_params, headers=headers)
-        elif method == 'DELETE':
-            response = requests.delete(url, params=full_params, headers=headers)
-        elif method == 'PATCH':
-            response = requests.patch(url, json=data, params=full_params, headers=headers)
-        elif method == 'PUT':
-            response = requests.put(url, json=data, params=full_params, headers=headers)
-        else:
-            print(f"Unsupported method: {method}")
-            return None
+        start = time.perf_counter()
+        response = transport.request(method, url, params=full_params, data=data, headers=headers)
+        elapsed = time.perf_counter() - start
 
-        print(f"Status Code: {response.status_code}")
-        try:
-            json_response = response.json()
-            print(f"Response Body: {json.dumps(json_response, indent=2)}")
-        except json.JSONDecodeError:
-            print(f"Response Body (raw): {response.text}")
-            json_response = None
-
-        if response.status_code == 200:
-            print("SUCCESS: The request was successful.")
-        elif response.status_code in [401, 403] and method != 'GET':
-            print("FAILURE (Expected for API Key only): This indicates an authentication/authorization issue. "
-                  "API keys are typically for read-only access. Write operations usually require OAuth 2.0.")
-        else:
-            print(f"FAILURE: Unexpected status code. Review the error details above.")
-
-        print("-" * 30)
+        # Only decode the body when someone is going to look at it
+        json_response = None
+        if return_json or logger.wants_bodies:
+            try:
+                json_response = response.json()
+            except json.JSONDecodeError:
+                json_response = None
+
+        logger.log_response(method, url, full_params, response, elapsed, json_response)
         return json_response if return_json and json_response else response
 
     except requests.exceptions.RequestException as e:
-        print(f"An error occurred during the request: {e}")
-        print("-" * 30)
+        logger.log_error(method, url, e)
         return None
 
 
 # Convenience function for GET requests
 def get_request(url: str, params: Optional[Dict[str, Any]] = None, 
-                return_json: bool = False) -> Union[requests.Response, Dict[str, Any], None]:
+                return_json: bool = False,
+                transport: Optional[BloggerTransport] = None) -> Union[requests.Response, Dict[str, Any], None]:
     """
-    Makes an HTTP GET request to the Blogger API and prints the response.
+    Makes an HTTP GET request to the Blogger API and logs the response.
     This is a convenience wrapper around blogger_api_request.
     
     Parameters:
         url (str): The API endpoint URL
         params (dict, optional): Additional query parameters to include
         return_json (bool): Whether to return the JSON response instead of the Response object
+        transport (BloggerTransport, optional): Transport to send the request with.
     
     Returns:
         Response object, JSON dict, or None if an error occurred
     """
-    return blogger_api_request('GET', url, params=params, return_json=return_json)
+    return blogger_api_request('GET', url, params=params, return_json=return_json, transport=transport)
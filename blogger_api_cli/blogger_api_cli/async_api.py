@@ -0,0 +1,129 @@
+"""
+Asyncio counterpart to the helpers in blogger_api_cli.api.
+Requests are sent through the same BloggerTransport, so they share its connection pool,
+retry policy, rate limiter and logger. A semaphore bounds how many requests are in flight,
+which lets commands fan out work (many posts by ID, comments per post, date windows)
+without exceeding the configured concurrency.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Union
+
+import requests
+
+from blogger_api_cli.api import BloggerTransport, blogger_api_request, get_default_transport
+
+
+class AsyncBloggerClient:
+    """
+    Runs Blogger API requests concurrently with a bounded number in flight.
+    Can be used as an async context manager, which shuts down its worker threads on exit.
+    """
+
+    DEFAULT_CONCURRENCY = 4
+
+    def __init__(self, transport: Optional[BloggerTransport] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Args:
+            transport (BloggerTransport, optional): Transport to send requests with.
+                                                    Defaults to the shared transport.
+            concurrency (int): Maximum number of requests in flight at once.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1.")
+        self.transport = transport if transport is not None else get_default_transport()
+        # Every worker thread holds a pooled connection while its request is in flight
+        self.transport.ensure_pool_size(concurrency)
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='blogger-api')
+        self._semaphore = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it belongs to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def request(self, method: str, url: str, data: Optional[Dict[str, Any]] = None,
+                      params: Optional[Dict[str, Any]] = None,
+                      return_json: bool = False) -> Union[requests.Response, Dict[str, Any], None]:
+        """
+        Make an HTTP request to the Blogger API without blocking the event loop.
+        Accepts the same arguments as blogger_api_request.
+
+        Returns:
+            Response object, JSON dict, or None if an error occurred
+        """
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            call = functools.partial(blogger_api_request, method, url, data=data, params=params,
+                                     return_json=return_json, transport=self.transport)
+            return await loop.run_in_executor(self._executor, call)
+
+    async def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  return_json: bool = False) -> Union[requests.Response, Dict[str, Any], None]:
+        """
+        Make an HTTP GET request to the Blogger API without blocking the event loop.
+
+        Returns:
+            Response object, JSON dict, or None if an error occurred
+        """
+        return await self.request('GET', url, params=params, return_json=return_json)
+
+    def close(self) -> None:
+        """Shut down the worker threads. The transport is left open for its owner to close."""
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> 'AsyncBloggerClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+async def async_blogger_api_request(method: str, url: str, data: Optional[Dict[str, Any]] = None,
+                                    params: Optional[Dict[str, Any]] = None,
+                                    return_json: bool = False,
+                                    client: Optional[AsyncBloggerClient] = None
+                                    ) -> Union[requests.Response, Dict[str, Any], None]:
+    """
+    Asyncio counterpart to blogger_api_request.
+
+    Parameters:
+        method (str): HTTP method ('GET', 'POST', 'PUT', 'PATCH', 'DELETE')
+        url (str): The API endpoint URL
+        data (dict, optional): The JSON data to send in the request body
+        params (dict, optional): Additional query parameters to include
+        return_json (bool): Whether to return the JSON response instead of the Response object
+        client (AsyncBloggerClient, optional): Client bounding the concurrency.
+                                               If not provided, a single-use client is created.
+
+    Returns:
+        Response object, JSON dict, or None if an error occurred
+    """
+    if client is not None:
+        return await client.request(method, url, data=data, params=params, return_json=return_json)
+    async with AsyncBloggerClient(concurrency=1) as single_use:
+        return await single_use.request(method, url, data=data, params=params, return_json=return_json)
+
+
+async def async_get_request(url: str, params: Optional[Dict[str, Any]] = None,
+                            return_json: bool = False,
+                            client: Optional[AsyncBloggerClient] = None
+                            ) -> Union[requests.Response, Dict[str, Any], None]:
+    """
+    Asyncio counterpart to get_request.
+
+    Parameters:
+        url (str): The API endpoint URL
+        params (dict, optional): Additional query parameters to include
+        return_json (bool): Whether to return the JSON response instead of the Response object
+        client (AsyncBloggerClient, optional): Client bounding the concurrency.
+
+    Returns:
+        Response object, JSON dict, or None if an error occurred
+    """
+    return await async_blogger_api_request('GET', url, params=params, return_json=return_json, client=client)
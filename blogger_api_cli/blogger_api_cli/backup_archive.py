@@ -0,0 +1,107 @@
+"""
+Opening Blogger backups the way Google Takeout delivers them.
+The feed XML may be a plain file, compressed on its own (.gz, .bz2, .xz) or a member of a
+.zip or tar archive (.tgz, .tar.gz, ...). Everything is decompressed as a stream, so the
+backup never has to be unpacked to disk first.
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+import tarfile
+import zipfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Tuple
+
+
+TAR_SUFFIXES = ('.tar', '.tgz', '.tbz2', '.txz', '.tar.gz', '.tar.bz2', '.tar.xz')
+COMPRESSED_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+FEED_SUFFIXES = ('.atom', '.xml')
+# What reading a truncated or corrupt backup raises: EOFError for cut-off streams, OSError
+# (gzip.BadGzipFile, bz2) and LZMAError for bad compressed data, BadZipFile/TarError for
+# broken archives, ValueError when an archive has no feed
+READ_ERRORS = (ValueError, EOFError, OSError, lzma.LZMAError, zipfile.BadZipFile, tarfile.TarError)
+
+
+def is_feed_member(name: str) -> bool:
+    """
+    Returns:
+        bool: True if an archive member name looks like a Blogger feed.
+    """
+    return name.lower().endswith(FEED_SUFFIXES)
+
+
+def _is_feed_name(name: str) -> bool:
+    return os.path.splitext(os.path.basename(name))[0].lower() == 'feed'
+
+
+def pick_feed_member(members: List[Tuple[str, int]]) -> str:
+    """
+    Pick the feed among the members of an archive.
+    Takeout names the backup feed.atom (older exports: blog-*.xml); a member called 'feed'
+    is preferred, otherwise the largest XML/Atom member.
+
+    Args:
+        members (list): (name, size) of every file in the archive.
+
+    Raises:
+        ValueError: If the archive has no XML or Atom member.
+    """
+    candidates = [(name, size) for name, size in members if is_feed_member(name)]
+    if not candidates:
+        raise ValueError("No .atom or .xml feed found in the archive")
+    for name, _ in candidates:
+        if _is_feed_name(name):
+            return name
+    return max(candidates, key=lambda candidate: candidate[1])[0]
+
+
+@contextmanager
+def open_backup(path: str) -> Iterator[BinaryIO]:
+    """
+    Open a Blogger backup as a binary stream of feed XML, decompressing it on the fly.
+
+    Args:
+        path (str): Path of an .xml/.atom file, a .gz/.bz2/.xz compressed feed,
+                    or a .zip/.tar/.tgz/.tar.gz/.tar.bz2/.tar.xz archive containing it.
+
+    Yields:
+        file: A binary file object reading the feed XML.
+
+    Raises:
+        ValueError: If an archive does not contain a feed.
+    """
+    lower = path.lower()
+    if lower.endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            files = [info for info in archive.infolist() if not info.is_dir()]
+            member = pick_feed_member([(info.filename, info.file_size) for info in files])
+            print(f"Reading {member} from {path}")
+            with archive.open(member) as stream:
+                yield stream
+    elif lower.endswith(TAR_SUFFIXES):
+        # Streaming mode reads members in order. A member called 'feed' is used as soon as it is
+        # found; otherwise the archive is read a second time to open the picked member.
+        members = []
+        with tarfile.open(path, mode='r|*') as archive:
+            for member in archive:
+                if member.isfile():
+                    members.append((member.name, member.size))
+                    if is_feed_member(member.name) and _is_feed_name(member.name):
+                        print(f"Reading {member.name} from {path}")
+                        yield archive.extractfile(member)
+                        return
+        name = pick_feed_member(members)
+        with tarfile.open(path, mode='r|*') as archive:
+            for member in archive:
+                if member.name == name:
+                    print(f"Reading {member.name} from {path}")
+                    yield archive.extractfile(member)
+                    return
+    elif os.path.splitext(lower)[1] in COMPRESSED_OPENERS:
+        with COMPRESSED_OPENERS[os.path.splitext(lower)[1]](path, 'rb') as stream:
+            yield stream
+    else:
+        with open(path, 'rb') as stream:
+            yield stream
@@ -0,0 +1,217 @@
+"""
+Persistent HTTP response cache for Blogger API GET requests.
+Responses carrying an ETag are stored on disk, keyed by URL and query parameters
+(without the API key). Later requests revalidate them with If-None-Match, and a
+304 Not Modified answer is served from disk instead of downloading the body again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+def default_cache_dir() -> str:
+    """
+    Returns:
+        str: The cache directory used when none is configured.
+    """
+    return os.path.join(os.path.expanduser('~'), '.cache', 'blogger_api_cli')
+
+
+class ResponseCache:
+    """
+    An on-disk cache of API responses with a size cap and least-recently-used eviction.
+    Each entry is a JSON file; its modification time records when it was last used.
+    The directory is scanned once, into an in-memory LRU order of the entries; once the cache
+    outgrows max_bytes, the oldest entries are evicted down to LOW_WATER of it, so a full cache
+    does not evict on every store. Entries written by other processes meanwhile are picked up
+    the next time the cache is opened.
+    """
+
+    DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+    # Fraction of max_bytes an eviction brings the cache down to
+    LOW_WATER = 0.9
+    # Query parameters that must not become part of the cache key
+    IGNORED_PARAMS = ('key',)
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir (str, optional): Directory holding the cache entries.
+                                       Defaults to default_cache_dir().
+            max_bytes (int): Total size the cache may grow to before old entries are evicted.
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._total_bytes = None
+        # Entry key -> size in bytes, least recently used first; loaded on first store
+        self._lru: Optional['OrderedDict[str, int]'] = None
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            url (str): The API endpoint URL.
+            params (dict, optional): Query parameters of the request.
+
+        Returns:
+            str: A hex digest identifying the request.
+        """
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items() if k not in self.IGNORED_PARAMS)
+        raw = json.dumps([url, items], ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached entry.
+
+        Returns:
+            dict or None: The entry with 'etag', 'headers' and 'body', or None if it is not cached.
+        """
+        path = self._path(self.make_key(url, params))
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def store(self, url: str, params: Optional[Dict[str, Any]], response: requests.Response) -> None:
+        """
+        Store a successful response if it carries an ETag.
+
+        Args:
+            url (str): The API endpoint URL.
+            params (dict, optional): Query parameters of the request.
+            response (requests.Response): The response to store.
+        """
+        etag = response.headers.get('ETag')
+        if response.status_code != 200 or not etag:
+            return
+        entry = {
+            'url': url,
+            'etag': etag,
+            'headers': {'Content-Type': response.headers.get('Content-Type', 'application/json')},
+            'body': response.text,
+        }
+        data = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        key = self.make_key(url, params)
+        path = self._path(key)
+
+        with self._lock:
+            self._ensure_index()
+            self._total_bytes -= self._lru.pop(key, 0)
+            tmp_path = f'{path}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._lru[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def revalidated(self, url: str, params: Optional[Dict[str, Any]], entry: Dict[str, Any],
+                    response: requests.Response) -> requests.Response:
+        """
+        Turn a 304 Not Modified response into a 200 response with the cached body.
+
+        Args:
+            url (str): The API endpoint URL.
+            params (dict, optional): Query parameters of the request.
+            entry (dict): The cached entry that was revalidated.
+            response (requests.Response): The 304 response.
+
+        Returns:
+            requests.Response: A response carrying the cached body.
+        """
+        key = self.make_key(url, params)
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+        body = entry['body'].encode('utf-8')
+        cached = requests.Response()
+        cached.status_code = 200
+        cached.reason = 'OK'
+        cached._content = body
+        cached.encoding = 'utf-8'
+        cached.headers = CaseInsensitiveDict(response.headers)
+        cached.headers.update(entry['headers'])
+        cached.headers['ETag'] = entry['etag']
+        cached.url = response.url
+        cached.request = response.request
+        cached.elapsed = response.elapsed
+
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += len(body)
+            if self._lru is not None and key in self._lru:
+                self._lru.move_to_end(key)
+        return cached
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def _entries(self):
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.json'):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _ensure_index(self) -> None:
+        """Load the LRU order of the entries from the directory, once."""
+        if self._lru is not None:
+            return
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        self._lru = OrderedDict((os.path.basename(path)[:-len('.json')], size) for path, size, _ in entries)
+        self._total_bytes = sum(self._lru.values())
+
+    def _evict(self) -> None:
+        """Once the cache outgrows max_bytes, remove the least recently used entries down to the low-water mark."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        target = self.max_bytes * self.LOW_WATER
+        while self._lru and self._total_bytes > target:
+            key, size = self._lru.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            for path, _, _ in list(self._entries()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._lru = OrderedDict()
+            self._total_bytes = 0
+
+    def summary(self) -> str:
+        """
+        Returns:
+            str: A one-line human readable summary of the cache counters.
+        """
+        return f"{self.hits} revalidated from cache, {self.misses} downloaded, {self.bytes_saved} bytes saved"
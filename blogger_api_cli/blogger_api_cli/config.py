@@ -23,7 +23,20 @@ class BloggerConfig:
             "blog_id": "",
             "base_url": "https://www.googleapis.com/blogger/v3",
             "user_id": "self",
-            "blog_url": ""
+            "blog_url": "",
+            "pool_size": 10,
+            "timeout": 30,
+            "max_retries": 3,
+            "backoff_base": 1.0,
+            "backoff_max": 60.0,
+            "requests_per_second": 10,
+            "requests_per_minute": 0,
+            "concurrency": 4,
+            "cache_enabled": True,
+            "cache_dir": "",
+            "cache_max_bytes": 100 * 1024 * 1024,
+            "log_level": "full",
+            "log_format": "text"
         }
 
         # Determine the path to the config file
@@ -71,3 +84,55 @@ class BloggerConfig:
     @property
     def blog_url(self):
         return self._config["blog_url"]
+    
+    @property
+    def pool_size(self):
+        return self._config["pool_size"]
+    
+    @property
+    def timeout(self):
+        return self._config["timeout"]
+    
+    @property
+    def max_retries(self):
+        return self._config["max_retries"]
+    
+    @property
+    def backoff_base(self):
+        return self._config["backoff_base"]
+    
+    @property
+    def backoff_max(self):
+        return self._config["backoff_max"]
+    
+    @property
+    def requests_per_second(self):
+        return self._config["requests_per_second"]
+    
+    @property
+    def requests_per_minute(self):
+        return self._config["requests_per_minute"]
+    
+    @property
+    def log_level(self):
+        return self._config["log_level"]
+    
+    @property
+    def log_format(self):
+        return self._config["log_format"]
+    
+    @property
+    def concurrency(self):
+        return self._config["concurrency"]
+    
+    @property
+    def cache_enabled(self):
+        return self._config["cache_enabled"]
+    
+    @property
+    def cache_dir(self):
+        return self._config["cache_dir"]
+    
+    @property
+    def cache_max_bytes(self):
+        return self._config["cache_max_bytes"]
@@ -0,0 +1,236 @@
+"""
+Date index of exported posts.
+Groups posts into year -> month archive buckets with counts, and keeps the published
+timestamps of all posts as a sorted array aligned with their IDs, so a date-range query is
+two binary searches instead of a sort of every post.
+The index is written next to an export, like the label index.
+"""
+
+import json
+import os
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from blogger_api_cli.entities import parse_timestamp
+
+
+INDEX_VERSION = 1
+
+
+def date_index_path(output_path: str) -> str:
+    """
+    Returns:
+        str: The date index path belonging to an export file, e.g. posts.json -> posts.dates.json.
+    """
+    return f'{os.path.splitext(output_path)[0]}.dates.json'
+
+
+def to_epoch(value: str) -> int:
+    """
+    Returns:
+        int: Seconds since the epoch of an RFC 3339 timestamp, e.g. '2025-06-23T10:00:00.000-07:00'.
+    """
+    return int(parse_timestamp(value).timestamp())
+
+
+def parse_date_bound(value: str, end: bool = False) -> int:
+    """
+    Parse the bound of a date-range query. Partial dates cover the whole period, so
+    '2024' as an end bound means the last second of 2024. Bounds without an offset are UTC.
+
+    Args:
+        value (str): 'YYYY', 'YYYY-MM', 'YYYY-MM-DD' or a full RFC 3339 timestamp.
+        end (bool): Whether the value is the (inclusive) end of the range.
+
+    Returns:
+        int: Seconds since the epoch.
+
+    Raises:
+        ValueError: If the value is not a date.
+    """
+    parts = value.split('-')
+    if len(value) in (4, 7, 10) and all(part.isdigit() for part in parts):
+        year = int(parts[0])
+        month = int(parts[1]) if len(parts) > 1 else 1
+        day = int(parts[2]) if len(parts) > 2 else 1
+        start = datetime(year, month, day, tzinfo=timezone.utc)
+        if not end:
+            return int(start.timestamp())
+        if len(parts) == 1:
+            following = start.replace(year=year + 1)
+        elif len(parts) == 2:
+            following = start.replace(year=year + month // 12, month=month % 12 + 1)
+        else:
+            following = start + timedelta(days=1)
+        return int(following.timestamp()) - 1
+    moment = parse_timestamp(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+class DateIndex:
+    """
+    Published-date index. Archive buckets follow the local date of the 'published' timestamp
+    (the blog's time zone), as Blogger's own archive does; the timestamp array is in UTC seconds.
+    """
+
+    def __init__(self):
+        self._entries = []
+        self._sorted = True
+        self._timestamps = None
+
+    @property
+    def count(self) -> int:
+        return len(self._entries)
+
+    def add(self, post: Dict[str, Any]) -> None:
+        """
+        Record the published date of a post; posts without one are skipped.
+
+        Args:
+            post (dict): An API post or an XML-converted post.
+        """
+        published = post.get('published')
+        if not published or not post.get('id'):
+            return
+        entry = (to_epoch(published), post['id'], int(published[:4]), int(published[5:7]))
+        if self._entries and entry < self._entries[-1]:
+            self._sorted = False
+        self._entries.append(entry)
+        self._timestamps = None
+
+    @classmethod
+    def build(cls, posts: Iterable[Dict[str, Any]]) -> 'DateIndex':
+        index = cls()
+        for post in posts:
+            index.add(post)
+        return index
+
+    def _sorted_entries(self) -> List[Tuple[int, str, int, int]]:
+        if not self._sorted:
+            self._entries.sort()
+            self._sorted = True
+        return self._entries
+
+    def between(self, start: Optional[int] = None, end: Optional[int] = None) -> List[str]:
+        """
+        Args:
+            start (int, optional): First second of the range (epoch), unbounded if None.
+            end (int, optional): Last second of the range (epoch, inclusive), unbounded if None.
+
+        Returns:
+            list: IDs of the posts published in the range, oldest first.
+        """
+        entries = self._sorted_entries()
+        if self._timestamps is None:
+            self._timestamps = [entry[0] for entry in entries]
+        timestamps = self._timestamps
+        lo = bisect_left(timestamps, start) if start is not None else 0
+        hi = bisect_right(timestamps, end) if end is not None else len(timestamps)
+        return [entry[1] for entry in entries[lo:hi]]
+
+    def archive(self) -> List[Dict[str, Any]]:
+        """
+        Returns:
+            list: Year buckets, oldest first: {"year", "count", "months": [{"month", "count", "posts"}]}.
+        """
+        years = {}
+        for _, post_id, year, month in self._sorted_entries():
+            years.setdefault(year, {}).setdefault(month, []).append(post_id)
+        return [
+            {'year': year, 'count': sum(len(posts) for posts in months.values()),
+             'months': [{'month': month, 'count': len(months[month]), 'posts': months[month]}
+                        for month in sorted(months)]}
+            for year, months in sorted(years.items())
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        entries = self._sorted_entries()
+        return {
+            'version': INDEX_VERSION,
+            'count': len(entries),
+            'years': self.archive(),
+            'published': [entry[0] for entry in entries],
+            'ids': [entry[1] for entry in entries],
+        }
+
+    def dumps(self, ensure_ascii: bool = True) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=ensure_ascii, separators=(',', ':'))
+
+    def save(self, path: str, ensure_ascii: bool = True) -> None:
+        """Write the index to a JSON file atomically."""
+        tmp_path = f'{path}.part'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.dumps(ensure_ascii))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['DateIndex']:
+        """
+        Returns:
+            DateIndex or None: The index stored at path, or None if there is none.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        buckets = {}
+        for year in data.get('years', []):
+            for month in year['months']:
+                for post_id in month['posts']:
+                    buckets[post_id] = (year['year'], month['month'])
+        index = cls()
+        index._entries = [(timestamp, post_id) + buckets[post_id]
+                          for timestamp, post_id in zip(data.get('published', []), data.get('ids', []))]
+        return index
+
+
+def find_date_index(posts_path: str) -> str:
+    """
+    Returns:
+        str: The date index of a posts export; split exports keep it inside their directory.
+    """
+    if os.path.isdir(posts_path):
+        return os.path.join(posts_path, 'dates.json')
+    return date_index_path(posts_path)
+
+
+def show_archive(posts_path: str, since: Optional[str] = None, until: Optional[str] = None) -> bool:
+    """
+    Print the archive of a posts export, or the posts published in a date range.
+
+    Args:
+        posts_path (str): The posts export (file or split directory) the index belongs to.
+        since (str, optional): Start of the range, e.g. '2024', '2024-03' or '2024-03-15'.
+        until (str, optional): End of the range (inclusive), in the same forms.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    index_path = find_date_index(posts_path)
+    index = DateIndex.load(index_path)
+    if index is None:
+        print(f"Date index not found: {index_path}. Export the posts first.")
+        return False
+
+    if since is None and until is None:
+        for year in reversed(index.archive()):
+            print(f"{year['year']} ({year['count']})")
+            for month in reversed(year['months']):
+                print(f"  {year['year']}-{month['month']:02d} ({month['count']})")
+        return True
+
+    try:
+        start = parse_date_bound(since) if since else None
+        end = parse_date_bound(until, end=True) if until else None
+    except ValueError as e:
+        print(f"Invalid date: {e}")
+        return False
+    post_ids = index.between(start, end)
+    print(f"{len(post_ids)} posts published between {since or 'the start'} and {until or 'now'}:")
+    for post_id in post_ids:
+        print(post_id)
+    return True
@@ -0,0 +1,62 @@
+"""
+Accessors for fields that API resources and XML-converted entries store differently.
+API posts carry 'url' and 'labels'; entries converted from an XML backup carry 'links'
+and 'categories' instead, and their ids are Atom tags rather than numeric IDs.
+Both carry RFC 3339 timestamps, parsed by parse_timestamp.
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+ENTRY_ID_RE = re.compile(r'\.(?:post|page|comment)-(\d+)$')
+
+
+def post_url(post: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns:
+        str or None: The public URL of an API post or an XML-converted post.
+    """
+    if post.get('url'):
+        return post['url']
+    for link in post.get('links') or []:
+        if link.get('rel') == 'alternate':
+            return link.get('href')
+    return None
+
+
+def post_labels(post: Dict[str, Any]) -> List[str]:
+    """
+    Returns:
+        list: The labels of an API post, or the category terms of an XML-converted post.
+    """
+    if 'labels' in post:
+        return list(post.get('labels') or [])
+    return [category['term'] for category in post.get('categories') or [] if category.get('term')]
+
+
+def numeric_id(post: Dict[str, Any]) -> str:
+    """
+    Returns:
+        str: The numeric ID of a post, page or comment; for XML entries it is taken from the Atom id
+             (tag:blogger.com,1999:blog-1.post-123 -> 123).
+    """
+    entity_id = post.get('id') or ''
+    match = ENTRY_ID_RE.search(entity_id)
+    return match.group(1) if match else entity_id
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an RFC 3339 timestamp as returned by the Blogger API.
+
+    Args:
+        value (str): e.g. '2025-06-23T10:00:00.123-07:00' or '2025-06-23T17:00:00Z'
+
+    Returns:
+        datetime: A timezone-aware datetime.
+    """
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
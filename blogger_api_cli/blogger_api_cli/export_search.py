@@ -4,36 +4,153 @@ This module provides functions to export blog posts and pages via API,
 search for posts within a blog, and retrieve blog information by ID or URL.
 """
 
+import asyncio
 import json
 import os
-from typing import Optional, Dict, Any, Union
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Union, List, Tuple, Iterator, Callable, AsyncIterator
 from blogger_api_cli.api import get_request
+from blogger_api_cli.async_api import AsyncBloggerClient
 from blogger_api_cli.config import BloggerConfig
+from blogger_api_cli.export_writers import ExportProgress, JsonLinesWriter, detect_format, open_export_writer
+from blogger_api_cli.incremental import ExportState, merge_export, parse_timestamp, read_export_items
+from blogger_api_cli.date_index import DateIndex, date_index_path
+from blogger_api_cli.label_index import LabelIndex, label_index_path
 
 
-def export_posts(config: BloggerConfig, output_path: Optional[str] = None) -> bool:
+# Partial-response projections for the listing endpoints (posts.list, posts.search, pages.list)
+FIELD_PRESETS = {
+    'ids-only': 'nextPageToken,items(id)',
+    'listing': 'nextPageToken,items(id,title,url,published,updated,labels,status)',
+    'full': None,
+}
+
+
+def resolve_fields(fields: Optional[str]) -> Tuple[Optional[str], bool]:
     """
-    Export all posts from a blog via the Blogger API and save them to a JSON file.
+    Resolve a --fields value into the 'fields' query parameter and the 'fetchBodies' flag.
     
     Args:
-        config (BloggerConfig): Configuration object with Blogger settings.
-        output_path (str, optional): Path to save the posts JSON file.
-                                    If not provided, it will use a default path.
+        fields (str, optional): A preset name from FIELD_PRESETS or a raw fields expression.
+                                None means the full resource.
     
     Returns:
-        bool: True if successful, False otherwise.
+        tuple: (fields expression or None, whether post/page bodies are needed)
     """
-    blog_id = config.blog_id
-    base_url = config.base_url
+    if fields is None:
+        return None, True
+    if fields in FIELD_PRESETS:
+        expression = FIELD_PRESETS[fields]
+    else:
+        expression = fields
+    fetch_bodies = expression is None or 'content' in expression
+    return expression, fetch_bodies
+
+
+def projection_params(fields: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the query parameters applying a field projection to a listing request.
     
-    if not blog_id:
-        print("\nError: BLOG_ID is not configured.")
-        return False
+    Args:
+        fields (str, optional): A preset name from FIELD_PRESETS or a raw fields expression.
     
+    Returns:
+        dict: Query parameters to merge into the request.
+    """
+    expression, fetch_bodies = resolve_fields(fields)
+    params = {}
+    if expression:
+        params['fields'] = expression
+    if not fetch_bodies:
+        params['fetchBodies'] = 'false'
+    return params
+
+
+class ExportError(Exception):
+    """Raised when a page of a paginated export cannot be fetched."""
+
+
+def iter_list_pages(url: str, params: Optional[Dict[str, Any]] = None,
+                    page_size: int = 500) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every page of a paginated list endpoint, following nextPageToken.
+    
+    Args:
+        url (str): The list endpoint URL.
+        params (dict, optional): Query parameters applied to every page.
+        page_size (int): Number of items requested per page.
+    
+    Yields:
+        dict: The decoded list response of each page.
+    
+    Raises:
+        ExportError: If a page cannot be fetched.
+    """
+    params = _paged_params(params, page_size)
+    page_token = None
+    while True:
+        if page_token:
+            params['pageToken'] = page_token
+        response = get_request(url, params=params)
+        if not response or response.status_code != 200:
+            raise ExportError(f"Failed to fetch {url} (page token: {page_token or 'first page'})")
+        data = response.json()
+        yield data
+        page_token = data.get('nextPageToken')
+        if not page_token:
+            return
+
+
+async def aiter_list_pages(client: AsyncBloggerClient, url: str, params: Optional[Dict[str, Any]] = None,
+                           page_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Asyncio counterpart to iter_list_pages, sending requests through an AsyncBloggerClient.
+    
+    Raises:
+        ExportError: If a page cannot be fetched.
+    """
+    params = _paged_params(params, page_size)
+    page_token = None
+    while True:
+        if page_token:
+            params['pageToken'] = page_token
+        response = await client.get(url, params=dict(params))
+        if not response or response.status_code != 200:
+            raise ExportError(f"Failed to fetch {url} (page token: {page_token or 'first page'})")
+        data = response.json()
+        yield data
+        page_token = data.get('nextPageToken')
+        if not page_token:
+            return
+
+
+def _paged_params(params: Optional[Dict[str, Any]], page_size: int) -> Dict[str, Any]:
+    """Copy list parameters, setting the page size and keeping the page token in projections."""
+    params = dict(params or {})
+    params['maxResults'] = page_size
+    # A projection must keep the page token, or pagination stops after the first page
+    fields = params.get('fields')
+    if fields and 'nextPageToken' not in fields:
+        params['fields'] = f'nextPageToken,{fields}'
+    return params
+
+
+def _resolve_output_path(output_path: Optional[str], default_name: str) -> str:
+    """
+    Resolve the output path of an export and make sure its directory exists.
+    
+    Args:
+        output_path (str, optional): Requested output path.
+        default_name (str): File name used in the default data directory.
+    
+    Returns:
+        str: The path to write to.
+    """
     # Set default output path if not provided
     if output_path is None:
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        output_path = os.path.join(base_dir, "data", "posts.json")
+        output_path = os.path.join(base_dir, "data", default_name)
     
     # Create directory if it doesn't exist
     dir_path = os.path.dirname(output_path)
@@ -43,37 +160,356 @@ def export_posts(config: BloggerConfig, output_path: Optional[str] = None) -> bo
         # Use current directory if no directory specified
         output_path = os.path.join(os.getcwd(), os.path.basename(output_path))
         print(f"No directory specified, using current directory: {os.getcwd()}")
+    return output_path
+
+
+def stream_list_export(url: str, params: Dict[str, Any], output_path: str, output_format: str,
+                       kind: str, label: str,
+                       on_item: Optional[Callable[[Dict[str, Any]], None]] = None,
+                       chunk_size: Optional[int] = None) -> int:
+    """
+    Page through a list endpoint and stream every item to the output file as it arrives.
     
-    print(f"\nExporting posts from blog ID: {blog_id}")
-    print(f"Output will be saved to: {output_path}")
+    Args:
+        url (str): The list endpoint URL.
+        params (dict): Query parameters applied to every page.
+        output_path (str): Path of the output file.
+        output_format (str): One of EXPORT_FORMATS.
+        kind (str): API list kind wrapping JSON output, e.g. 'blogger#postList'.
+        label (str): What the items are called in progress messages.
+        on_item (callable, optional): Called with every item after it is written.
+        chunk_size (int, optional): Summaries per listing chunk of a split export.
     
-    # Get all posts from the blog
-    response = get_request(f'{base_url}/blogs/{blog_id}/posts', params={'maxResults': 500})
+    Returns:
+        int: Number of items written.
     
-    if response and response.status_code == 200:
-        # Process and save the response
-        data = response.json()
+    Raises:
+        ExportError: If a page cannot be fetched. The previous output file is left untouched.
+    """
+    progress = ExportProgress(label)
+    with open_export_writer(output_path, output_format, kind=kind, chunk_size=chunk_size) as writer:
+        for data in iter_list_pages(url, params):
+            items = data.get('items', [])
+            for item in items:
+                writer.write(item)
+                if on_item:
+                    on_item(item)
+            progress.update(len(items))
+    progress.finish()
+    return writer.count
+
+
+def date_windows(start: datetime, end: datetime, days: int) -> List[Tuple[datetime, datetime]]:
+    """
+    Split a time range into consecutive windows, newest first.
+    
+    Args:
+        start (datetime): Beginning of the range.
+        end (datetime): End of the range.
+        days (int): Length of each window in days.
+    
+    Returns:
+        list: (window start, window end) tuples covering the range.
+    
+    Raises:
+        ValueError: If days is less than 1.
+    """
+    if days < 1:
+        raise ValueError("Window length must be at least 1 day.")
+    windows = []
+    window_end = end
+    while window_end > start:
+        window_start = max(start, window_end - timedelta(days=days))
+        windows.append((window_start, window_end))
+        window_end = window_start
+    return windows
+
+
+def _rfc3339(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _item_sort_key(item: Dict[str, Any]) -> Tuple[float, str]:
+    published = item.get('published')
+    timestamp = parse_timestamp(published).timestamp() if published else 0.0
+    return timestamp, item.get('id', '')
+
+
+def sharded_list_export(url: str, params: Dict[str, Any], output_path: str, output_format: str,
+                        kind: str, label: str, start: datetime, end: datetime,
+                        shard_days: int, workers: int,
+                        on_item: Optional[Callable[[Dict[str, Any]], None]] = None,
+                        chunk_size: Optional[int] = None) -> int:
+    """
+    Export a list endpoint by splitting it into published-date windows fetched concurrently.
+    Each window follows its own page tokens and is spooled to a temporary file. The windows
+    are then merged newest first, sorted by (published, id) and de-duplicated by ID, so the
+    output does not depend on which window finished first.
+    
+    Args:
+        url (str): The list endpoint URL.
+        params (dict): Query parameters applied to every page.
+        output_path (str): Path of the output file.
+        output_format (str): One of EXPORT_FORMATS.
+        kind (str): API list kind wrapping JSON output, e.g. 'blogger#postList'.
+        label (str): What the items are called in progress messages.
+        start (datetime): Earliest publication date to cover.
+        end (datetime): Latest publication date to cover.
+        shard_days (int): Length of each window in days.
+        workers (int): Maximum number of requests in flight.
+        on_item (callable, optional): Called with every item after it is written.
+        chunk_size (int, optional): Summaries per listing chunk of a split export.
+    
+    Returns:
+        int: Number of items written.
+    
+    Raises:
+        ExportError: If a page cannot be fetched. The previous output file is left untouched.
+    """
+    windows = date_windows(start, end, shard_days)
+    print(f"Fetching {len(windows)} windows of {shard_days} days with {workers} workers")
+    progress = ExportProgress(label)
+    
+    with tempfile.TemporaryDirectory(prefix='blogger-export-') as spool_dir:
+        async def fetch_window(client, index, window_start, window_end):
+            window_params = dict(params)
+            # The outermost windows are open-ended, so scheduled posts and posts imported
+            # with dates before the blog was created are not lost
+            if index < len(windows) - 1:
+                window_params['startDate'] = _rfc3339(window_start)
+            if index > 0:
+                window_params['endDate'] = _rfc3339(window_end)
+            items = []
+            async for data in aiter_list_pages(client, url, window_params):
+                page_items = data.get('items', [])
+                items.extend(page_items)
+                progress.update(len(page_items))
+            items.sort(key=_item_sort_key, reverse=True)
+            with open(os.path.join(spool_dir, f'{index}.jsonl'), 'w', encoding='utf-8') as f:
+                for item in items:
+                    f.write(json.dumps(item))
+                    f.write('\n')
         
-        # Save the raw response
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        async def fetch_all():
+            async with AsyncBloggerClient(concurrency=workers) as client:
+                await asyncio.gather(*[
+                    fetch_window(client, index, window_start, window_end)
+                    for index, (window_start, window_end) in enumerate(windows)
+                ])
+        
+        asyncio.run(fetch_all())
+        progress.finish()
+        
+        seen = set()
+        with open_export_writer(output_path, output_format, kind=kind, chunk_size=chunk_size) as writer:
+            for index in range(len(windows)):
+                with open(os.path.join(spool_dir, f'{index}.jsonl'), 'r', encoding='utf-8') as f:
+                    for line in f:
+                        item = json.loads(line)
+                        # Windows share their boundary instant, so an item can show up twice
+                        if item.get('id') in seen:
+                            continue
+                        seen.add(item.get('id'))
+                        writer.write(item)
+                        if on_item:
+                            on_item(item)
+    return writer.count
+
+
+def fetch_changed_posts(url: str, params: Dict[str, Any], last_updated: str,
+                        known_ids: Optional[set] = None, page_size: int = 50) -> List[Dict[str, Any]]:
+    """
+    Fetch the posts updated since a watermark.
+    Posts are listed newest-updated first, so paging stops at the first older post.
+    
+    Args:
+        url (str): The posts list endpoint URL.
+        params (dict): Query parameters applied to every page.
+        last_updated (str): RFC 3339 watermark; posts updated after it are returned.
+        known_ids (set, optional): IDs already exported. Known posts updated exactly at the
+                                   watermark are the ones that set it, and are skipped.
+        page_size (int): Number of posts requested per page; small, since few posts usually change.
+    
+    Returns:
+        list: The changed posts, newest first.
+    
+    Raises:
+        ExportError: If a page cannot be fetched.
+    """
+    watermark = parse_timestamp(last_updated)
+    params = dict(params)
+    params['orderBy'] = 'updated'
+    
+    known_ids = known_ids or set()
+    changed = []
+    progress = ExportProgress('changed posts')
+    for data in iter_list_pages(url, params, page_size=page_size):
+        items = data.get('items', [])
+        done = False
+        for item in items:
+            updated = parse_timestamp(item['updated'])
+            if updated < watermark:
+                done = True
+                break
+            if updated == watermark and item.get('id') in known_ids:
+                continue
+            changed.append(item)
+        progress.update(len(changed) - progress.items)
+        if done:
+            break
+    progress.finish()
+    return changed
+
+
+def export_posts(config: BloggerConfig, output_path: Optional[str] = None,
+                 fields: Optional[str] = None, output_format: Optional[str] = None,
+                 incremental: bool = False, statuses: Optional[List[str]] = None,
+                 shard_days: Optional[int] = None, workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None) -> bool:
+    """
+    Export all posts from a blog via the Blogger API and save them to a JSON file.
+    Every page of results is followed and streamed to the file as it arrives.
+    With shard_days, the blog's lifetime is split into date windows fetched concurrently.
+    
+    In incremental mode a state file is kept next to the output. When the output and its
+    state exist, only posts updated since the last run are fetched and merged in place.
+    Deleted posts are not detected; run a full export to drop them.
+    
+    Args:
+        config (BloggerConfig): Configuration object with Blogger settings.
+        output_path (str, optional): Path to save the posts JSON file.
+                                    If not provided, it will use a default path.
+        fields (str, optional): Field projection, a FIELD_PRESETS name or a raw fields expression.
+                                Defaults to the full post resources.
+        output_format (str, optional): 'json' for a postList object, 'jsonl' for one post per line
+                                       or 'split' for a directory with one file per post.
+                                       Defaults to the format matching the file extension.
+        incremental (bool): Whether to export only posts changed since the previous run.
+        statuses (list, optional): Post statuses to export ('live', 'draft', 'scheduled').
+                                   Defaults to the API default (live posts).
+        shard_days (int, optional): Length of the date windows for a sharded export.
+                                    If not provided, posts are fetched as one page chain.
+        workers (int, optional): Number of windows fetched concurrently.
+                                 Defaults to the concurrency from the config.
+        chunk_size (int, optional): Summaries per listing chunk of a split export.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    blog_id = config.blog_id
+    base_url = config.base_url
+    
+    if not blog_id:
+        print("\nError: BLOG_ID is not configured.")
+        return False
+    
+    output_path = _resolve_output_path(output_path, "posts" if output_format == 'split' else "posts.json")
+    output_format = detect_format(output_path, output_format)
+    if incremental and output_format == 'split':
+        print("\nError: Incremental export is not supported for split output.")
+        return False
+    
+    params = projection_params(fields)
+    if statuses:
+        params['status'] = statuses
+    if incremental and 'fields' in params and not all(f in params['fields'] for f in ('id', 'updated')):
+        print("\nError: Incremental export needs the 'id' and 'updated' fields in the projection.")
+        return False
+    
+    url = f'{base_url}/blogs/{blog_id}/posts'
+    state = ExportState.load(output_path) if incremental else None
+    # Split output keeps its indexes inside the output directory
+    index_labels = output_format != 'split' and ('fields' not in params or 'labels' in params['fields'])
+    index_dates = output_format != 'split' and ('fields' not in params or 'published' in params['fields'])
+    
+    if state is not None and state.last_updated and os.path.exists(output_path):
+        print(f"\nUpdating posts from blog ID: {blog_id} changed since {state.last_updated}")
+        print(f"Output will be merged into: {output_path} ({output_format})")
+        try:
+            changed = fetch_changed_posts(url, params, state.last_updated, state.ids)
+        except ExportError as e:
+            print(f"Failed to export posts: {e}")
+            return False
         
-        post_count = len(data.get('items', []))
-        print(f"Successfully exported {post_count} posts to {output_path}")
+        if changed:
+            counts = merge_export(output_path, output_format, 'blogger#postList', changed, state.ids)
+            for item in changed:
+                state.observe(item)
+            state.save()
+            print(f"Merged {counts['added']} new and {counts['updated']} updated posts "
+                  f"into {output_path} ({counts['total']} posts in total)")
+            if index_labels:
+                LabelIndex.build(read_export_items(output_path, output_format)).save(label_index_path(output_path))
+            if index_dates:
+                DateIndex.build(read_export_items(output_path, output_format)).save(date_index_path(output_path))
+        else:
+            print(f"No posts changed since {state.last_updated}")
         return True
-    else:
-        print("Failed to export posts")
+    
+    print(f"\nExporting posts from blog ID: {blog_id}")
+    print(f"Output will be saved to: {output_path} ({output_format})")
+    
+    state = ExportState(ExportState.path_for(output_path)) if incremental else None
+    labels = LabelIndex() if index_labels else None
+    dates = DateIndex() if index_dates else None
+    
+    def on_item(item):
+        if state:
+            state.observe(item)
+        if labels is not None:
+            labels.add(item)
+        if dates is not None:
+            dates.add(item)
+    
+    try:
+        if shard_days:
+            # The blog's lifetime bounds the windows
+            blog = get_request(f'{base_url}/blogs/{blog_id}', return_json=True)
+            if not isinstance(blog, dict) or not blog.get('published'):
+                print("Failed to export posts: could not retrieve the blog's publication date")
+                return False
+            start = parse_timestamp(blog['published'])
+            end = datetime.now(timezone.utc) + timedelta(days=1)
+            post_count = sharded_list_export(url, params, output_path, output_format, 'blogger#postList', 'posts',
+                                             start, end, shard_days, workers or config.concurrency,
+                                             on_item=on_item, chunk_size=chunk_size)
+        else:
+            post_count = stream_list_export(url, params, output_path, output_format, 'blogger#postList', 'posts',
+                                            on_item=on_item, chunk_size=chunk_size)
+    except ExportError as e:
+        print(f"Failed to export posts: {e}")
         return False
+    
+    if state:
+        state.save()
+        print(f"Saved export state to {state.path}")
+    if labels is not None:
+        labels.save(label_index_path(output_path))
+        print(f"Saved label index ({len(labels.names)} labels) to {label_index_path(output_path)}")
+    if dates is not None:
+        dates.save(date_index_path(output_path))
+        print(f"Saved date index ({dates.count} posts) to {date_index_path(output_path)}")
+    print(f"Successfully exported {post_count} posts to {output_path}")
+    return True
 
 
-def export_pages(config: BloggerConfig, output_path: Optional[str] = None) -> bool:
+def export_pages(config: BloggerConfig, output_path: Optional[str] = None,
+                 fields: Optional[str] = None, output_format: Optional[str] = None,
+                 chunk_size: Optional[int] = None) -> bool:
     """
     Export all pages from a blog via the Blogger API and save them to a JSON file.
+    Every page of results is followed and streamed to the file as it arrives.
     
     Args:
         config (BloggerConfig): Configuration object with Blogger settings.
         output_path (str, optional): Path to save the pages JSON file.
                                     If not provided, it will use a default path.
+        fields (str, optional): Field projection, a FIELD_PRESETS name or a raw fields expression.
+                                Defaults to the full page resources.
+        output_format (str, optional): 'json' for a pageList object, 'jsonl' for one page per line
+                                       or 'split' for a directory with one file per page.
+                                       Defaults to the format matching the file extension.
+        chunk_size (int, optional): Summaries per listing chunk of a split export.
     
     Returns:
         bool: True if successful, False otherwise.
@@ -85,43 +521,175 @@ def export_pages(config: BloggerConfig, output_path: Optional[str] = None) -> bo
         print("\nError: BLOG_ID is not configured.")
         return False
     
-    # Set default output path if not provided
-    if output_path is None:
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        output_path = os.path.join(base_dir, "data", "pages.json")
-    
-    # Create directory if it doesn't exist
-    dir_path = os.path.dirname(output_path)
-    if dir_path:  # Only try to create directory if the path is not empty
-        os.makedirs(dir_path, exist_ok=True)
-    else:
-        # Use current directory if no directory specified
-        output_path = os.path.join(os.getcwd(), os.path.basename(output_path))
-        print(f"No directory specified, using current directory: {os.getcwd()}")
+    output_path = _resolve_output_path(output_path, "pages" if output_format == 'split' else "pages.json")
+    output_format = detect_format(output_path, output_format)
     
     print(f"\nExporting pages from blog ID: {blog_id}")
+    print(f"Output will be saved to: {output_path} ({output_format})")
+    
+    try:
+        page_count = stream_list_export(f'{base_url}/blogs/{blog_id}/pages', projection_params(fields),
+                                        output_path, output_format, 'blogger#pageList', 'pages',
+                                        chunk_size=chunk_size)
+    except ExportError as e:
+        print(f"Failed to export pages: {e}")
+        return False
+    
+    print(f"Successfully exported {page_count} pages to {output_path}")
+    return True
+
+
+def fetch_post_comments(base_url: str, blog_id: str, post_ids: List[str], concurrency: int,
+                        on_post: Callable[[str, List[Dict[str, Any]]], None],
+                        progress: Optional[ExportProgress] = None) -> None:
+    """
+    Fetch the comments of several posts concurrently, following their page tokens.
+    
+    Args:
+        base_url (str): The API base URL.
+        blog_id (str): ID of the blog.
+        post_ids (list): IDs of the posts whose comments are fetched.
+        concurrency (int): Maximum number of requests in flight.
+        on_post (callable): Called with (post_id, comments) once all comments of a post are fetched.
+                            It runs on the calling thread, so calls never interleave.
+        progress (ExportProgress, optional): Updated with every fetched page of comments.
+    
+    Raises:
+        ExportError: If a request fails.
+    """
+    async def fetch_one(client, post_id):
+        comments = []
+        async for data in aiter_list_pages(client, f'{base_url}/blogs/{blog_id}/posts/{post_id}/comments'):
+            page_items = data.get('items', [])
+            comments.extend(page_items)
+            if progress is not None:
+                progress.update(len(page_items))
+        on_post(post_id, comments)
+    
+    async def fetch_all():
+        async with AsyncBloggerClient(concurrency=concurrency) as client:
+            await asyncio.gather(*[fetch_one(client, post_id) for post_id in post_ids])
+    
+    asyncio.run(fetch_all())
+
+
+def export_comments(config: BloggerConfig, output_path: Optional[str] = None,
+                    concurrency: Optional[int] = None, statuses: Optional[List[str]] = None) -> bool:
+    """
+    Export the comments of every post via the Blogger API to a JSON Lines file.
+    Post IDs are listed first; then each post's comments are fetched, following their page
+    tokens, with a bounded number of requests in flight. Every line holds one post:
+    {"postId": ..., "comments": [...]}.
+    
+    Args:
+        config (BloggerConfig): Configuration object with Blogger settings.
+        output_path (str, optional): Path to save the comments JSONL file.
+                                    If not provided, it will use a default path.
+        concurrency (int, optional): Maximum number of requests in flight.
+                                     Defaults to the concurrency from the config.
+        statuses (list, optional): Statuses of the posts whose comments are exported.
+    
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    blog_id = config.blog_id
+    base_url = config.base_url
+    
+    if not blog_id:
+        print("\nError: BLOG_ID is not configured.")
+        return False
+    
+    output_path = _resolve_output_path(output_path, "comments.jsonl")
+    concurrency = concurrency or config.concurrency
+    
+    print(f"\nExporting comments from blog ID: {blog_id}")
     print(f"Output will be saved to: {output_path}")
     
-    # Get all pages from the blog
-    response = get_request(f'{base_url}/blogs/{blog_id}/pages', params={'maxResults': 500})
+    # List the post IDs without their bodies
+    params = projection_params('ids-only')
+    if statuses:
+        params['status'] = statuses
+    post_ids = []
+    try:
+        for data in iter_list_pages(f'{base_url}/blogs/{blog_id}/posts', params):
+            post_ids.extend(item['id'] for item in data.get('items', []))
+    except ExportError as e:
+        print(f"Failed to export comments: {e}")
+        return False
     
-    if response and response.status_code == 200:
-        # Process and save the response
-        data = response.json()
-        
-        # Save the raw response
+    print(f"Fetching comments of {len(post_ids)} posts ({concurrency} requests at a time)")
+    progress = ExportProgress('comments')
+    
+    try:
+        with JsonLinesWriter(output_path) as writer:
+            fetch_post_comments(base_url, blog_id, post_ids, concurrency,
+                                lambda post_id, comments: writer.write({'postId': post_id, 'comments': comments}),
+                                progress)
+    except ExportError as e:
+        print(f"Failed to export comments: {e}")
+        return False
+    
+    progress.finish()
+    print(f"Successfully exported {progress.items} comments of {writer.count} posts to {output_path}")
+    return True
+
+
+def fetch_posts(config: BloggerConfig, post_ids: List[str], output_path: Optional[str] = None,
+                concurrency: Optional[int] = None) -> bool:
+    """
+    Fetch several posts by ID concurrently via the Blogger API.
+    
+    Args:
+        config (BloggerConfig): Configuration object with Blogger settings.
+        post_ids (list): IDs of the posts to fetch.
+        output_path (str, optional): Path to save the posts JSON file.
+                                    If not provided, it will just display the titles.
+        concurrency (int, optional): Maximum number of requests in flight.
+                                     Defaults to the concurrency from the config.
+    
+    Returns:
+        bool: True if every post was fetched, False otherwise.
+    """
+    blog_id = config.blog_id
+    base_url = config.base_url
+    
+    if not blog_id:
+        print("\nError: BLOG_ID is not configured.")
+        return False
+    
+    concurrency = concurrency or config.concurrency
+    print(f"\nFetching {len(post_ids)} posts from blog ID: {blog_id} ({concurrency} at a time)")
+    
+    async def fetch_all():
+        async with AsyncBloggerClient(concurrency=concurrency) as client:
+            return await asyncio.gather(*[
+                client.get(f'{base_url}/blogs/{blog_id}/posts/{post_id}') for post_id in post_ids
+            ])
+    
+    responses = asyncio.run(fetch_all())
+    
+    posts = []
+    for post_id, response in zip(post_ids, responses):
+        if response and response.status_code == 200:
+            posts.append(response.json())
+        else:
+            print(f"Failed to fetch post {post_id}")
+    
+    if output_path:
+        dir_path = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(dir_path, exist_ok=True)
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        
-        page_count = len(data.get('items', []))
-        print(f"Successfully exported {page_count} pages to {output_path}")
-        return True
+            json.dump({'kind': 'blogger#postList', 'items': posts}, f, indent=2)
+        print(f"Saved {len(posts)} posts to {output_path}")
     else:
-        print("Failed to export pages")
-        return False
+        for post in posts:
+            print(f"{post.get('id')}: {post.get('title', 'No title')}")
+    
+    return len(posts) == len(post_ids)
 
 
-def search_posts(config: BloggerConfig, search_query: str, max_results: int = 10) -> bool:
+def search_posts(config: BloggerConfig, search_query: str, max_results: int = 10,
+                 fields: Optional[str] = 'listing') -> bool:
     """
     Search for posts within a blog using the Blogger API.
     
@@ -129,6 +697,8 @@ def search_posts(config: BloggerConfig, search_query: str, max_results: int = 10
         config (BloggerConfig): Configuration object with Blogger settings.
         search_query (str): The search query to look for in blog posts.
         max_results (int, optional): Maximum number of results to return. Default is 10.
+        fields (str, optional): Field projection, a FIELD_PRESETS name or a raw fields expression.
+                                Defaults to 'listing', which covers everything that is displayed.
     
     Returns:
         bool: True if successful, False otherwise.
@@ -144,10 +714,9 @@ def search_posts(config: BloggerConfig, search_query: str, max_results: int = 10
     print(f"Search query: '{search_query}'")
     
     # Search for posts
-    response = get_request(
-        f'{base_url}/blogs/{blog_id}/posts/search',
-        params={'q': search_query, 'maxResults': max_results}
-    )
+    params = {'q': search_query, 'maxResults': max_results}
+    params.update(projection_params(fields))
+    response = get_request(f'{base_url}/blogs/{blog_id}/posts/search', params=params)
     
     if response and response.status_code == 200:
         data = response.json()
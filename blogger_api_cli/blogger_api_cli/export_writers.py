@@ -0,0 +1,326 @@
+"""
+Streaming writers for exported Blogger resources.
+Items are written to the output file as they arrive, so memory use stays flat no matter
+how many posts or pages are exported. Output is written to a temporary file first and
+moved into place on close, so a failed export never leaves a truncated file behind.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from blogger_api_cli.entities import numeric_id, post_url
+from blogger_api_cli.date_index import DateIndex
+from blogger_api_cli.label_index import LabelIndex
+
+
+EXPORT_FORMATS = ('json', 'jsonl', 'split')
+
+
+def detect_format(output_path: str, output_format: Optional[str] = None) -> str:
+    """
+    Pick the export format, falling back to the output file extension.
+
+    Args:
+        output_path (str): Path of the output file.
+        output_format (str, optional): Explicitly requested format.
+
+    Returns:
+        str: One of EXPORT_FORMATS.
+    """
+    if output_format:
+        return output_format
+    if output_path.endswith(('/', os.sep)) or os.path.isdir(output_path):
+        return 'split'
+    return 'jsonl' if output_path.lower().endswith(('.jsonl', '.ndjson')) else 'json'
+
+
+class _AtomicFileWriter:
+    """Base class writing to a temporary file that replaces the target on commit."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        dir_path = os.path.dirname(os.path.abspath(path))
+        os.makedirs(dir_path, exist_ok=True)
+        self._tmp_path = f'{path}.part'
+        self._file = open(self._tmp_path, 'w', encoding='utf-8', newline='\n')
+
+    def write(self, item: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def _finish(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Finish the output and move it into place."""
+        if self._file is None:
+            return
+        self._finish()
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard the output, leaving any previous file at the target path untouched."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class JsonLinesWriter(_AtomicFileWriter):
+    """Writes one JSON object per line."""
+
+    def __init__(self, path: str, ensure_ascii: bool = True):
+        super().__init__(path)
+        self.ensure_ascii = ensure_ascii
+
+    def write(self, item: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(item, ensure_ascii=self.ensure_ascii))
+        self._file.write('\n')
+        self.count += 1
+
+
+class JsonArrayWriter(_AtomicFileWriter):
+    """
+    Streams items into a JSON array, formatted exactly like json.dump(..., indent=2).
+    With a kind, the array is wrapped like an API list response: {"kind": ..., "items": [...]}.
+    """
+
+    def __init__(self, path: str, kind: Optional[str] = None, ensure_ascii: bool = True):
+        super().__init__(path)
+        self.kind = kind
+        self.ensure_ascii = ensure_ascii
+        self._prefix = '    ' if kind else '  '
+        if kind:
+            self._file.write('{\n  "kind": ' + json.dumps(kind) + ',\n  "items": [')
+        else:
+            self._file.write('[')
+
+    def write(self, item: Dict[str, Any]) -> None:
+        self.write_json(json.dumps(item, indent=2, ensure_ascii=self.ensure_ascii))
+
+    def write_json(self, text: str) -> None:
+        """Write an item already serialized with json.dumps(item, indent=2)."""
+        self._file.write(',\n' if self.count else '\n')
+        self._file.write('\n'.join(self._prefix + line for line in text.split('\n')))
+        self.count += 1
+
+    def _finish(self) -> None:
+        closing = ']'
+        if self.count:
+            closing = '\n' + self._prefix[:-2] + ']'
+        if self.kind:
+            closing += '\n}'
+        self._file.write(closing)
+
+
+class SplitWriter:
+    """
+    Writes an export as a directory a static site can fetch piece by piece:
+
+        items/<id>.json     one file per post or page
+        index-<n>.json      listing chunks of chunk_size summaries, in export order
+        labels.json         label index (see label_index.LabelIndex)
+        dates.json          year/month archive and published-date index (see date_index.DateIndex)
+        manifest.json       counts, chunk boundaries and content hashes
+
+    Summaries carry the item file name and its SHA-256, so clients can tell which items
+    changed, and refer to labels by their ID in labels.json. Files whose content did not
+    change are not rewritten, and items or chunks left over from a previous export are
+    removed on close; the manifest is written last.
+    """
+
+    DEFAULT_CHUNK_SIZE = 20
+    SUMMARY_FIELDS = ('id', 'title', 'published', 'updated', 'status', 'draft')
+
+    def __init__(self, path: str, kind: Optional[str] = None, chunk_size: Optional[int] = None,
+                 ensure_ascii: bool = True):
+        """
+        Args:
+            path (str): The output directory.
+            kind (str, optional): API list kind recorded in the manifest, e.g. 'blogger#postList'.
+            chunk_size (int, optional): Summaries per listing chunk. Defaults to DEFAULT_CHUNK_SIZE.
+            ensure_ascii (bool): Whether non-ASCII characters are escaped in the JSON files.
+        """
+        self.path = path
+        self.kind = kind
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        self.ensure_ascii = ensure_ascii
+        self.count = 0
+        self._items_dir = os.path.join(path, 'items')
+        os.makedirs(self._items_dir, exist_ok=True)
+        self._item_files = set()
+        self._summaries = []
+        self._chunks = []
+        self.labels = LabelIndex()
+        self.dates = DateIndex()
+        self._closed = False
+
+    def _dumps(self, data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=self.ensure_ascii, separators=(',', ':')).encode('utf-8')
+
+    def _write_file(self, rel_path: str, data: bytes) -> str:
+        """Write a file unless it already holds the same bytes; returns its SHA-256."""
+        path = os.path.join(self.path, rel_path)
+        try:
+            if os.path.getsize(path) == len(data):
+                with open(path, 'rb') as f:
+                    if f.read() == data:
+                        return hashlib.sha256(data).hexdigest()
+        except OSError:
+            pass
+        with open(f'{path}.part', 'wb') as f:
+            f.write(data)
+        os.replace(f'{path}.part', path)
+        return hashlib.sha256(data).hexdigest()
+
+    def write(self, item: Dict[str, Any]) -> None:
+        file_name = f'{numeric_id(item)}.json'
+        digest = self._write_file(os.path.join('items', file_name), self._dumps(item))
+        self._item_files.add(file_name)
+
+        summary = {field: item.get(field) for field in self.SUMMARY_FIELDS if field in item}
+        summary['url'] = post_url(item)
+        summary['labelIds'] = self.labels.add(item)
+        self.dates.add(item)
+        summary['file'] = f'items/{file_name}'
+        summary['sha256'] = digest
+        self._summaries.append(summary)
+        self.count += 1
+        if len(self._summaries) >= self.chunk_size:
+            self._flush_chunk()
+
+    def write_json(self, text: str) -> None:
+        """Write an item already serialized as JSON."""
+        self.write(json.loads(text))
+
+    def _flush_chunk(self) -> None:
+        number = len(self._chunks) + 1
+        file_name = f'index-{number}.json'
+        digest = self._write_file(file_name, self._dumps({'page': number, 'items': self._summaries}))
+        first, last = self._summaries[0], self._summaries[-1]
+        self._chunks.append({
+            'file': file_name,
+            'count': len(self._summaries),
+            'first': {'id': first.get('id'), 'published': first.get('published')},
+            'last': {'id': last.get('id'), 'published': last.get('published')},
+            'sha256': digest,
+        })
+        self._summaries = []
+
+    def _remove_stale(self) -> List[str]:
+        chunk_files = {chunk['file'] for chunk in self._chunks}
+        stale = [os.path.join('items', name) for name in os.listdir(self._items_dir)
+                 if name.endswith('.json') and name not in self._item_files]
+        stale += [name for name in os.listdir(self.path)
+                  if name.startswith('index-') and name.endswith('.json') and name not in chunk_files]
+        if not self.labels.names and os.path.exists(os.path.join(self.path, 'labels.json')):
+            stale.append('labels.json')
+        if not self.dates.count and os.path.exists(os.path.join(self.path, 'dates.json')):
+            stale.append('dates.json')
+        for rel_path in stale:
+            os.remove(os.path.join(self.path, rel_path))
+        return stale
+
+    def close(self) -> None:
+        """Write the last chunk and the manifest, and remove stale files."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._summaries:
+            self._flush_chunk()
+        self._remove_stale()
+        manifest = {
+            'kind': self.kind,
+            'count': self.count,
+            'chunkSize': self.chunk_size,
+            'chunks': self._chunks,
+        }
+        if self.labels.names:
+            digest = self._write_file('labels.json', self.labels.dumps(self.ensure_ascii).encode('utf-8'))
+            manifest['labels'] = {'file': 'labels.json', 'count': len(self.labels.names), 'sha256': digest}
+        if self.dates.count:
+            digest = self._write_file('dates.json', self.dates.dumps(self.ensure_ascii).encode('utf-8'))
+            manifest['dates'] = {'file': 'dates.json', 'count': self.dates.count, 'sha256': digest}
+        self._write_file('manifest.json', json.dumps(manifest, ensure_ascii=self.ensure_ascii,
+                                                     indent=2).encode('utf-8'))
+
+    def abort(self) -> None:
+        """Leave the previous manifest in place; items written so far are kept."""
+        self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def open_export_writer(output_path: str, output_format: str, kind: Optional[str] = None,
+                       chunk_size: Optional[int] = None):
+    """
+    Create a streaming writer for an export.
+
+    Args:
+        output_path (str): Path of the output file, or the output directory for 'split'.
+        output_format (str): One of EXPORT_FORMATS.
+        kind (str, optional): API list kind used to wrap JSON output, e.g. 'blogger#postList'.
+        chunk_size (int, optional): Summaries per listing chunk of a split export.
+
+    Returns:
+        A JsonArrayWriter, JsonLinesWriter or SplitWriter.
+    """
+    if output_format == 'jsonl':
+        return JsonLinesWriter(output_path)
+    if output_format == 'json':
+        return JsonArrayWriter(output_path, kind=kind)
+    if output_format == 'split':
+        return SplitWriter(output_path, kind=kind, chunk_size=chunk_size)
+    raise ValueError(f"Unknown export format: {output_format}. Expected one of {', '.join(EXPORT_FORMATS)}")
+
+
+class ExportProgress:
+    """Reports pages fetched, items written and throughput while an export runs."""
+
+    def __init__(self, label: str = 'items'):
+        self.label = label
+        self.pages = 0
+        self.items = 0
+        self._start = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+    @property
+    def rate(self) -> float:
+        elapsed = self.elapsed
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+    def update(self, items: int, pages: int = 1) -> None:
+        """Record a fetched page and print the running totals."""
+        self.pages += pages
+        self.items += items
+        print(f"Page {self.pages}: {self.items} {self.label} so far ({self.rate:.1f} {self.label}/s)")
+
+    def finish(self) -> None:
+        """Print the final totals."""
+        print(f"Fetched {self.items} {self.label} in {self.pages} pages "
+              f"({self.elapsed:.1f}s, {self.rate:.1f} {self.label}/s)")
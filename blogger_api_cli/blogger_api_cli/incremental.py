@@ -0,0 +1,134 @@
+"""
+Incremental (delta) export support.
+A small state file next to an export records the newest 'updated' timestamp and the IDs
+already exported. Later runs fetch only the items changed since that watermark and merge
+them into the existing export file in place.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+from blogger_api_cli.entities import parse_timestamp
+from blogger_api_cli.export_writers import open_export_writer
+
+
+class ExportState:
+    """The watermark of an export: newest 'updated' timestamp and the known item IDs."""
+
+    def __init__(self, path: str, last_updated: Optional[str] = None, ids: Optional[List[str]] = None):
+        self.path = path
+        self.last_updated = last_updated
+        self.ids = set(ids or [])
+
+    @staticmethod
+    def path_for(output_path: str) -> str:
+        """
+        Returns:
+            str: The state file path belonging to an export file.
+        """
+        return f'{output_path}.state.json'
+
+    @classmethod
+    def load(cls, output_path: str) -> Optional['ExportState']:
+        """
+        Load the state stored next to an export file.
+
+        Returns:
+            ExportState or None: The state, or None if there is no usable state file.
+        """
+        path = cls.path_for(output_path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return cls(path, data.get('last_updated'), data.get('ids'))
+
+    def observe(self, item: Dict[str, Any]) -> None:
+        """Advance the watermark with an exported item."""
+        if item.get('id'):
+            self.ids.add(item['id'])
+        updated = item.get('updated')
+        if updated and (self.last_updated is None or
+                        parse_timestamp(updated) > parse_timestamp(self.last_updated)):
+            self.last_updated = updated
+
+    def save(self) -> None:
+        """Write the state file atomically."""
+        tmp_path = f'{self.path}.part'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'last_updated': self.last_updated, 'ids': sorted(self.ids)}, f)
+        os.replace(tmp_path, self.path)
+
+
+def _read_split_items(path: str) -> Iterator[Dict[str, Any]]:
+    with open(os.path.join(path, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    for chunk in manifest['chunks']:
+        with open(os.path.join(path, chunk['file']), 'r', encoding='utf-8') as f:
+            summaries = json.load(f)['items']
+        for summary in summaries:
+            with open(os.path.join(path, summary['file']), 'r', encoding='utf-8') as f:
+                yield json.load(f)
+
+
+def read_export_items(path: str, output_format: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read the items of an existing export file.
+    JSON Lines files are streamed; JSON files have to be loaded as a whole. Split exports
+    are read item by item in the order of their listing chunks.
+
+    Args:
+        path (str): Path of the export file, or the directory of a split export.
+        output_format (str): 'json', 'jsonl' or 'split'.
+
+    Yields:
+        dict: Each exported item.
+    """
+    if output_format == 'split':
+        yield from _read_split_items(path)
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        if output_format == 'jsonl':
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            data = json.load(f)
+            items = data.get('items', []) if isinstance(data, dict) else data
+            for item in items:
+                yield item
+
+
+def merge_export(path: str, output_format: str, kind: str, changed: List[Dict[str, Any]],
+                 known_ids: set) -> Dict[str, int]:
+    """
+    Merge changed items into an existing export file.
+    Updated items replace their previous version in place; new items are written first,
+    keeping newest-first ordering.
+
+    Args:
+        path (str): Path of the export file.
+        output_format (str): 'json' or 'jsonl'.
+        kind (str): API list kind wrapping JSON output, e.g. 'blogger#postList'.
+        changed (list): Items fetched since the watermark, newest first.
+        known_ids (set): IDs already present in the export.
+
+    Returns:
+        dict: Counts of 'added', 'updated' and 'total' items.
+    """
+    updates = {item['id']: item for item in changed if item.get('id') in known_ids}
+    seen = set()
+    added = 0
+
+    with open_export_writer(path, output_format, kind=kind) as writer:
+        for item in changed:
+            if item.get('id') not in known_ids and item.get('id') not in seen:
+                writer.write(item)
+                seen.add(item.get('id'))
+                added += 1
+        for item in read_export_items(path, output_format):
+            writer.write(updates.get(item.get('id'), item))
+
+    return {'added': added, 'updated': len(updates), 'total': writer.count}
@@ -0,0 +1,136 @@
+"""
+Label index of exported posts.
+Maps every label to the sorted IDs of the posts carrying it, with counts, and gives each label
+a small integer ID so listings can refer to labels without repeating their names.
+The index is written next to an export, so tag filtering is a lookup instead of a scan of
+every post.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from blogger_api_cli.entities import numeric_id, post_labels
+
+
+INDEX_VERSION = 1
+
+
+def label_index_path(output_path: str) -> str:
+    """
+    Returns:
+        str: The label index path belonging to an export file, e.g. posts.json -> posts.labels.json.
+    """
+    return f'{os.path.splitext(output_path)[0]}.labels.json'
+
+
+def _post_sort_key(post_id: str):
+    digits = numeric_id({'id': post_id})
+    return (0, int(digits), post_id) if digits.isdigit() else (1, 0, post_id)
+
+
+class LabelIndex:
+    """
+    Label -> post IDs index. Label IDs are assigned in the order labels are first seen,
+    so they are known while an export is still streaming.
+    """
+
+    def __init__(self):
+        self.names = []
+        self._ids = {}
+        self._posts = []
+
+    def label_id(self, name: str) -> int:
+        """
+        Returns:
+            int: The ID of a label, assigned on first use.
+        """
+        label_id = self._ids.get(name)
+        if label_id is None:
+            label_id = len(self.names)
+            self._ids[name] = label_id
+            self.names.append(name)
+            self._posts.append(set())
+        return label_id
+
+    def add(self, post: Dict[str, Any]) -> List[int]:
+        """
+        Record the labels of a post.
+
+        Args:
+            post (dict): An API post or an XML-converted post.
+
+        Returns:
+            list: The IDs of the post's labels, in the post's label order.
+        """
+        label_ids = []
+        for name in post_labels(post):
+            label_id = self.label_id(name)
+            if label_id not in label_ids:
+                label_ids.append(label_id)
+            if post.get('id'):
+                self._posts[label_id].add(post['id'])
+        return label_ids
+
+    @classmethod
+    def build(cls, posts: Iterable[Dict[str, Any]]) -> 'LabelIndex':
+        index = cls()
+        for post in posts:
+            index.add(post)
+        return index
+
+    def posts_with(self, name: str) -> List[str]:
+        """
+        Returns:
+            list: Sorted IDs of the posts carrying a label.
+        """
+        label_id = self._ids.get(name)
+        return sorted(self._posts[label_id], key=_post_sort_key) if label_id is not None else []
+
+    def posts_with_all(self, names: Iterable[str]) -> List[str]:
+        """
+        Returns:
+            list: Sorted IDs of the posts carrying every one of the labels.
+        """
+        sets = [self._posts[self._ids[name]] if name in self._ids else set() for name in names]
+        if not sets:
+            return []
+        return sorted(set.intersection(*sets), key=_post_sort_key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': INDEX_VERSION,
+            'count': len(self.names),
+            'labels': [
+                {'id': label_id, 'name': name, 'count': len(self._posts[label_id]),
+                 'posts': sorted(self._posts[label_id], key=_post_sort_key)}
+                for label_id, name in enumerate(self.names)
+            ],
+        }
+
+    def dumps(self, ensure_ascii: bool = True) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=ensure_ascii, separators=(',', ':'))
+
+    def save(self, path: str, ensure_ascii: bool = True) -> None:
+        """Write the index to a JSON file atomically."""
+        tmp_path = f'{path}.part'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.dumps(ensure_ascii))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['LabelIndex']:
+        """
+        Returns:
+            LabelIndex or None: The index stored at path, or None if there is none.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        index = cls()
+        for label in sorted(data.get('labels', []), key=lambda label: label['id']):
+            index.label_id(label['name'])
+            index._posts[label['id']].update(label['posts'])
+        return index
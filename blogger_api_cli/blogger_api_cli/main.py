@@ -1,8 +1,13 @@
 import os
 import sys
 import argparse
+import multiprocessing
 
+from blogger_api_cli.api import BloggerTransport, set_default_transport
+from blogger_api_cli.cache import ResponseCache
+from blogger_api_cli.export_writers import EXPORT_FORMATS
 from blogger_api_cli.config import BloggerConfig
+from blogger_api_cli.request_log import RequestLogger, LOG_LEVELS, LOG_FORMATS
 from blogger_api_cli.test_config import TestConfig
 
 
@@ -16,6 +21,50 @@ def is_running_as_executable():
     return getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
 
 
+def positive_int(value):
+    """
+    Argument type for options that must be a whole number of at least 1.
+    
+    Args:
+        value (str): The command line value.
+    
+    Returns:
+        int: The parsed value.
+    
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_int(value):
+    """
+    Argument type for options that must be a whole number of at least 0.
+    
+    Args:
+        value (str): The command line value.
+    
+    Returns:
+        int: The parsed value.
+    
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a non-negative integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
+
+
 def parse_arguments():
     """
     Parse command line arguments for the Blogger CLI tool.
@@ -34,9 +83,26 @@ Examples:
   {cmd_prefix} -p                              # Run permission test
   {cmd_prefix} -x -f path/to/blog-export.xml --include-drafts  # Convert XML to JSON
   {cmd_prefix} -x -f path/to/blog-export.xml -pj posts.json --gj pages.json
+  {cmd_prefix} -x -f path/to/blog-export.xml -cj comments.jsonl  # Also extract comments grouped by post
+  {cmd_prefix} -x -f path/to/blog-export.xml --format split -pj site/posts -gj site/pages  # One file per post for the SPA
+  {cmd_prefix} -x -f path/to/takeout.zip  # Convert the feed straight from a Takeout archive
+  {cmd_prefix} -x -f path/to/blog-export.xml -j 0  # Convert entries with one worker process per CPU
   {cmd_prefix} --export-posts -o my-posts.json  # Export posts via API
   {cmd_prefix} --export-pages -o my-pages.json  # Export pages via API
+  {cmd_prefix} --export-posts -o my-posts.jsonl  # Export posts as JSON Lines
+  {cmd_prefix} --export-posts -o my-posts.jsonl --incremental  # Merge only posts changed since the last run
+  {cmd_prefix} --export-posts -o my-posts.json --shard-days 90 --workers 8  # Fetch date windows in parallel
+  {cmd_prefix} --export-posts --fields listing -o index.json  # Export titles/URLs/dates without bodies
+  {cmd_prefix} --export-comments -o comments.jsonl --concurrency 8  # Export comments per post
+  {cmd_prefix} --export-sqlite -o blog.db  # Export posts, pages, labels and comments to SQLite
+  {cmd_prefix} --import-sqlite -pj posts.json -gj pages.json -cj comments.jsonl -o blog.db  # Load a converted backup into SQLite
+  {cmd_prefix} --fetch-posts 123 456 789 --concurrency 8  # Fetch posts by ID concurrently
   {cmd_prefix} --search "query" --max-results 20  # Search for posts
+  {cmd_prefix} --build-index -pj my-posts.json  # Build the offline search index from exported posts
+  {cmd_prefix} --search "query" --offline  # Search the offline index without calling the API
+  {cmd_prefix} --precompute -pj my-posts.json -j 0  # Precompute excerpts, plain text, reading time and images
+  {cmd_prefix} --archive -pj my-posts.json  # Show post counts per year and month from the date index
+  {cmd_prefix} --archive --since 2024-03 --until 2024-06  # List exported posts published in a date range
   {cmd_prefix} --get-blog -o blog-info.json  # Get blog info using ID/URL from config.json
         """
     
@@ -53,7 +119,21 @@ Examples:
     mode_group.add_argument('-x', '--xml-to-json', action='store_true', help='Convert XML blog backup entries to JSON\'s')
     mode_group.add_argument('--export-posts', action='store_true', help='Export posts via Blogger API')
     mode_group.add_argument('--export-pages', action='store_true', help='Export pages via Blogger API')
+    mode_group.add_argument('--export-comments', action='store_true', help='Export the comments of every post via Blogger API')
+    mode_group.add_argument('--export-sqlite', action='store_true',
+                            help='Export posts, pages, labels and comments via Blogger API into a SQLite database')
+    mode_group.add_argument('--import-sqlite', action='store_true',
+                            help='Load posts, pages and comments converted with -x (read from --posts-json, '
+                                 '--pages-json and --comments-json) into a SQLite database')
+    mode_group.add_argument('--fetch-posts', nargs='+', metavar='POST_ID', help='Fetch several posts by ID concurrently')
     mode_group.add_argument('--search', metavar='QUERY', help='Search for posts in the blog')
+    mode_group.add_argument('--build-index', action='store_true',
+                            help='Build the offline search index from exported posts (read from --posts-json)')
+    mode_group.add_argument('--precompute', action='store_true',
+                            help='Precompute excerpts, plain text, reading time and images of exported posts '
+                                 '(read from --posts-json)')
+    mode_group.add_argument('--archive', action='store_true',
+                            help='Show the archive of exported posts from their date index (read from --posts-json)')
     mode_group.add_argument('--get-blog', action='store_true', help='Retrieve blog information using ID/URL from config.json')
     
     # TestConfig parameters
@@ -66,17 +146,66 @@ Examples:
     parser.add_argument('-t', '--test-content', default='This is test content', help='Content for test posts/pages')
     
     # File path parameters
-    parser.add_argument('-f', '--xml-file', help='Path to the XML blog backup file (required for XML to JSON conversion)')
-    parser.add_argument('--posts-json', '-pj', default=None, help='Path to save posts JSON')
-    parser.add_argument('--pages-json', '-gj', default=None, help='Path to save pages JSON')
+    parser.add_argument('-f', '--xml-file', help='Path to the XML blog backup file, or the Takeout .zip/.tgz/.gz/.bz2/.xz containing it '
+                             '(required for XML to JSON conversion)')
+    parser.add_argument('--posts-json', '-pj', default=None,
+                        help='Path to save posts JSON (or to read exported posts from for --build-index)')
+    parser.add_argument('--pages-json', '-gj', default=None,
+                        help='Path to save pages JSON (or to read converted pages from for --import-sqlite)')
+    parser.add_argument('--comments-json', '-cj', default=None,
+                        help='For XML to JSON: also extract comments, one line of comments per post, to this path '
+                             '(for --import-sqlite: the comments to load)')
     parser.add_argument('--config-file', '-cf', default=None, help='Path to the config file')
     parser.add_argument('-o', '--output', help='Path to save the exported data')
     
     # Export and search parameters
     parser.add_argument('--max-results', type=int, default=10, help='Maximum number of results to return for search')
+    parser.add_argument('--since', default=None,
+                        help='With --archive: list posts published from this date (YYYY, YYYY-MM or YYYY-MM-DD)')
+    parser.add_argument('--until', default=None,
+                        help='With --archive: list posts published up to this date, inclusive')
+    parser.add_argument('--offline', action='store_true',
+                        help='For --search: rank posts from the local index built by --build-index instead of calling the API')
+    parser.add_argument('--index-file', default=None,
+                        help='Path of the offline search index (default: data/search-index.json)')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default=None, dest='output_format',
+                        help='Export file format: json (a list object), jsonl (one item per line) or split '
+                             '(a directory with one file per item, listing chunks and a manifest) '
+                             '(default: jsonl for .jsonl/.ndjson outputs, split for directories, json otherwise)')
+    parser.add_argument('--chunk-size', type=positive_int, default=None,
+                        help='For split output: number of item summaries per listing chunk (default: 20)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='For --export-posts: fetch only posts changed since the previous export and merge them '
+                             'into the output (state is kept in <output>.state.json)')
+    parser.add_argument('--status', nargs='+', choices=['live', 'draft', 'scheduled'], default=None,
+                        help='Post statuses to export (default: live; drafts and scheduled posts require OAuth)')
+    parser.add_argument('--fields', default=None,
+                        help='Partial response for listing commands: ids-only, listing, full, or a raw fields '
+                             'expression such as "items(id,title)" (default: full for exports, listing for search)')
+    parser.add_argument('--concurrency', '--workers', type=positive_int, default=None,
+                        help='Maximum number of API requests in flight for concurrent commands (default: concurrency from config)')
+    parser.add_argument('--no-comments', action='store_true',
+                        help='For --export-sqlite: do not export the comments of every post')
+    parser.add_argument('--shard-days', type=positive_int, default=None,
+                        help='For --export-posts: split the blog\'s lifetime into windows of this many days '
+                             'and fetch them concurrently')
+    
+    # Output options
+    parser.add_argument('--log-level', choices=LOG_LEVELS, default=None,
+                        help='How much of each API request/response to print (default: full, or log_level from config)')
+    parser.add_argument('--log-format', choices=LOG_FORMATS, default=None,
+                        help='Print request logs as text or as JSON Lines (default: text, or log_format from config)')
+    
+    # Response cache options
+    parser.add_argument('--no-cache', action='store_true', help='Do not use or update the on-disk response cache')
+    parser.add_argument('--cache-dir', default=None,
+                        help='Directory of the on-disk response cache (default: cache_dir from config, or ~/.cache/blogger_api_cli)')
     
     # XML to JSON specific options
     parser.add_argument('--include-drafts', '-d', action='store_true', help='Include draft posts and pages in the JSON output')
+    parser.add_argument('-j', '--jobs', type=non_negative_int, default=1,
+                        help='Worker processes converting XML entries or precomputing content '
+                             '(default: 1, 0 for one per CPU)')
     
     return parser.parse_args()
 
@@ -86,6 +215,9 @@ def main():
     Main entry point for the Blogger CLI application.
     Parses command line arguments and executes the appropriate function.
     """
+    # In a frozen executable, worker processes of -j start this program again; this turns
+    # them into workers before any argument is parsed
+    multiprocessing.freeze_support()
     args = parse_arguments()
     
     # Create config objects
@@ -100,10 +232,41 @@ def main():
         test_content=args.test_content
     )
     
+    # Share a single pooled connection across all API calls of this run
+    logger = RequestLogger(level=args.log_level or config.log_level,
+                           log_format=args.log_format or config.log_format)
+    cache = None
+    if config.cache_enabled and not args.no_cache:
+        cache = ResponseCache(cache_dir=args.cache_dir or config.cache_dir or None,
+                              max_bytes=config.cache_max_bytes)
+    transport = BloggerTransport.from_config(config, logger=logger, cache=cache)
+    set_default_transport(transport)
+    try:
+        run_command(args, config, test_config)
+    finally:
+        if transport.stats.requests:
+            logger.log_stats(transport.stats)
+            if cache is not None:
+                logger.log_cache_stats(cache)
+        transport.close()
+        set_default_transport(None)
+
+
+def run_command(args, config, test_config):
+    """
+    Execute the function selected by the parsed command line arguments.
+    
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+        config (BloggerConfig): Configuration object with Blogger settings.
+        test_config (TestConfig): Configuration with test-specific IDs.
+    """
     # Default file paths relative to the script
     base_dir = os.path.dirname(os.path.dirname(__file__))
     default_posts_json = os.path.join(base_dir, "data", "posts.json")
     default_pages_json = os.path.join(base_dir, "data", "pages.json")
+    default_index_file = os.path.join(base_dir, "data", "search-index.json")
+    index_file = args.index_file if args.index_file else default_index_file
     
     # Execute the appropriate function based on the command
     if args.blogger:
@@ -122,29 +285,90 @@ def main():
             print("Use -f or --xml-file to specify the path to the XML blog backup file.")
             sys.exit(1)
             
+        if args.output_format == 'jsonl':
+            print("Error: XML to JSON conversion writes json or split output, not jsonl.")
+            sys.exit(1)
+            
         from blogger_api_cli.xml_to_json import xml_entries_to_json
         xml_path = args.xml_file
+        output_format = args.output_format or 'json'
+        if output_format == 'split':
+            # Directories instead of single files
+            default_posts_json = os.path.join(base_dir, "data", "posts")
+            default_pages_json = os.path.join(base_dir, "data", "pages")
         posts_json = args.posts_json if args.posts_json else default_posts_json
         pages_json = args.pages_json if args.pages_json else default_pages_json
         print(f"Converting XML blog backup from {xml_path} to JSON...")
         if args.include_drafts:
             print("Including draft posts and pages in the output")
-        xml_entries_to_json(xml_path, posts_json, pages_json, include_drafts=args.include_drafts)
+        xml_entries_to_json(xml_path, posts_json, pages_json, include_drafts=args.include_drafts, jobs=args.jobs,
+                            comments_json_path=args.comments_json, output_format=output_format,
+                            chunk_size=args.chunk_size)
     
     elif args.export_posts:
         from blogger_api_cli.export_search import export_posts
         print("Exporting posts via Blogger API...")
-        export_posts(config, output_path=args.output)
+        export_posts(config, output_path=args.output, fields=args.fields, output_format=args.output_format,
+                     incremental=args.incremental, statuses=args.status,
+                     shard_days=args.shard_days, workers=args.concurrency, chunk_size=args.chunk_size)
     
     elif args.export_pages:
         from blogger_api_cli.export_search import export_pages
         print("Exporting pages via Blogger API...")
-        export_pages(config, output_path=args.output)
+        export_pages(config, output_path=args.output, fields=args.fields, output_format=args.output_format,
+                     chunk_size=args.chunk_size)
+    
+    elif args.export_comments:
+        from blogger_api_cli.export_search import export_comments
+        print("Exporting comments via Blogger API...")
+        export_comments(config, output_path=args.output, concurrency=args.concurrency, statuses=args.status)
+    
+    elif args.export_sqlite:
+        from blogger_api_cli.sqlite_export import export_sqlite
+        print("Exporting blog to SQLite via Blogger API...")
+        export_sqlite(config, output_path=args.output, statuses=args.status,
+                      include_comments=not args.no_comments, concurrency=args.concurrency)
+    
+    elif args.import_sqlite:
+        from blogger_api_cli.sqlite_export import import_converted
+        posts_json = args.posts_json if args.posts_json else default_posts_json
+        # The pages are optional; the default file is only read if a conversion wrote it
+        pages_json = args.pages_json
+        if not pages_json and os.path.exists(default_pages_json):
+            pages_json = default_pages_json
+        print(f"Loading converted backup from {posts_json} into SQLite...")
+        import_converted(posts_json, pages_path=pages_json, comments_path=args.comments_json, output_path=args.output)
+    
+    elif args.fetch_posts:
+        from blogger_api_cli.export_search import fetch_posts
+        print("Fetching posts via Blogger API...")
+        fetch_posts(config, args.fetch_posts, output_path=args.output, concurrency=args.concurrency)
+    
+    elif args.search and args.offline:
+        from blogger_api_cli.search_index import search_offline
+        search_offline(index_file, args.search, max_results=args.max_results)
     
     elif args.search:
         from blogger_api_cli.export_search import search_posts
         print(f"Searching for posts with query: {args.search}...")
-        search_posts(config, args.search, max_results=args.max_results)
+        search_posts(config, args.search, max_results=args.max_results, fields=args.fields or 'listing')
+    
+    elif args.build_index:
+        from blogger_api_cli.search_index import build_search_index
+        posts_json = args.posts_json if args.posts_json else default_posts_json
+        print(f"Building offline search index from {posts_json}...")
+        build_search_index(posts_json, index_file)
+    
+    elif args.precompute:
+        from blogger_api_cli.precompute import precompute_content
+        posts_json = args.posts_json if args.posts_json else default_posts_json
+        print(f"Precomputing content of posts from {posts_json}...")
+        precompute_content(posts_json, output_path=args.output, jobs=args.jobs)
+    
+    elif args.archive:
+        from blogger_api_cli.date_index import show_archive
+        posts_json = args.posts_json if args.posts_json else default_posts_json
+        show_archive(posts_json, since=args.since, until=args.until)
     
     elif args.get_blog:
         from blogger_api_cli.export_search import get_blog_info
@@ -0,0 +1,228 @@
+"""
+Content precomputation for exported posts.
+Parses the HTML content of every post once and records what consumers would otherwise derive
+from it themselves: an excerpt, the plain text, the word count and reading time, the first
+image and the list of images. The results are written as JSON Lines next to the export,
+keyed by post id and content hash, so later runs only parse the posts whose content changed.
+"""
+
+import hashlib
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterator, List, Optional
+
+from blogger_api_cli.export_writers import detect_format
+from blogger_api_cli.incremental import read_export_items
+
+
+# Matches the length BlogPostCard.vue truncates post content to
+EXCERPT_LENGTH = 150
+WORDS_PER_MINUTE = 200
+# Posts handed to the worker pool at a time; bounds the content held in memory
+BATCH_SIZE = 500
+
+
+class _ContentExtractor(HTMLParser):
+    """Collects the visible text and the image URLs of an HTML fragment."""
+
+    SKIP_TAGS = {'script', 'style', 'noscript'}
+    BLOCK_TAGS = {'p', 'div', 'br', 'li', 'ul', 'ol', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                  'tr', 'td', 'th', 'table', 'blockquote', 'pre', 'section', 'article'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.images = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append(' ')
+        elif tag == 'img':
+            src = dict(attrs).get('src')
+            if src and src not in self.images:
+                self.images.append(src)
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append(' ')
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+    @property
+    def text(self) -> str:
+        return ' '.join(''.join(self.parts).split())
+
+
+def html_to_text(html: Optional[str]) -> str:
+    """
+    Extract the visible text of an HTML fragment, with whitespace collapsed.
+
+    Args:
+        html (str, optional): The HTML content.
+
+    Returns:
+        str: Plain text.
+    """
+    if not html:
+        return ''
+    extractor = _ContentExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.text
+
+
+def make_excerpt(text: str, length: int = EXCERPT_LENGTH) -> str:
+    """
+    Returns:
+        str: The text cut to at most length characters at a word boundary, with an ellipsis.
+    """
+    if len(text) <= length:
+        return text
+    cut = text[:length + 1]
+    if ' ' in cut:
+        cut = cut.rsplit(' ', 1)[0]
+    return cut[:length].rstrip(' ,.;:') + '…'
+
+
+def content_hash(html: Optional[str]) -> str:
+    """
+    Returns:
+        str: SHA-256 of a post's content, the key precomputed results are reused by.
+    """
+    return hashlib.sha256((html or '').encode('utf-8')).hexdigest()
+
+
+def analyze_content(html: Optional[str]) -> Dict[str, Any]:
+    """
+    Parse a post's HTML content once and derive everything the consumers need from it.
+
+    Args:
+        html (str, optional): The HTML content.
+
+    Returns:
+        dict: excerpt, text, words, readingMinutes, firstImage and images.
+    """
+    extractor = _ContentExtractor()
+    if html:
+        extractor.feed(html)
+        extractor.close()
+    text = extractor.text
+    words = len(text.split())
+    return {
+        'excerpt': make_excerpt(text),
+        'text': text,
+        'words': words,
+        'readingMinutes': math.ceil(words / WORDS_PER_MINUTE),
+        'firstImage': extractor.images[0] if extractor.images else None,
+        'images': extractor.images,
+    }
+
+
+def content_path(posts_path: str) -> str:
+    """
+    Returns:
+        str: The precomputed content path of a posts export, e.g. posts.json -> posts.content.jsonl;
+             split exports keep it inside their directory.
+    """
+    if os.path.isdir(posts_path):
+        return os.path.join(posts_path, 'content.jsonl')
+    return f'{os.path.splitext(posts_path)[0]}.content.jsonl'
+
+
+def iter_content(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yields:
+        dict: Each record of a precomputed content file; nothing if the file does not exist.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_content(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Returns:
+        dict: Post id -> precomputed record, empty if the file does not exist.
+    """
+    return {record['id']: record for record in iter_content(path)}
+
+
+def _analyze_batch(contents: List[Optional[str]], pool: Optional[ProcessPoolExecutor],
+                   jobs: int) -> List[Dict[str, Any]]:
+    if pool is None:
+        return [analyze_content(html) for html in contents]
+    return list(pool.map(analyze_content, contents, chunksize=max(1, len(contents) // (jobs * 4))))
+
+
+def precompute_content(posts_path: str, output_path: Optional[str] = None, jobs: int = 1) -> bool:
+    """
+    Precompute excerpts, plain text, reading time and images of exported posts.
+    Records whose content hash matches the previous output are reused without parsing.
+
+    Args:
+        posts_path (str): Output of --export-posts (any format) or the posts file/directory of -x.
+        output_path (str, optional): Path of the JSON Lines output. Defaults to content_path(posts_path).
+        jobs (int): Number of worker processes; 1 parses in this process, 0 uses every CPU (default: 1)
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    if not os.path.exists(posts_path):
+        print(f"File not found: {posts_path}")
+        return False
+
+    output_path = output_path or content_path(posts_path)
+    previous = {record['hash']: record for record in iter_content(output_path) if 'hash' in record}
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+    start = time.perf_counter()
+    reused = parsed = 0
+
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        with open(f'{output_path}.part', 'w', encoding='utf-8') as out:
+            batch = []
+
+            def flush():
+                nonlocal reused, parsed
+                missing = [post.get('content') for post, _, record in batch if record is None]
+                results = iter(_analyze_batch(missing, pool, jobs))
+                for post, digest, record in batch:
+                    if record is None:
+                        record = next(results)
+                        parsed += 1
+                    else:
+                        reused += 1
+                    fields = {key: value for key, value in record.items() if key not in ('id', 'hash')}
+                    record = {'id': post.get('id'), 'hash': digest, **fields}
+                    out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                batch.clear()
+
+            for post in read_export_items(posts_path, detect_format(posts_path)):
+                digest = content_hash(post.get('content'))
+                batch.append((post, digest, previous.get(digest)))
+                if len(batch) >= BATCH_SIZE:
+                    flush()
+            flush()
+        os.replace(f'{output_path}.part', output_path)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    elapsed = time.perf_counter() - start
+    print(f"Precomputed content of {reused + parsed} posts ({parsed} parsed, {reused} unchanged) in {elapsed:.1f}s")
+    print(f"Content saved to: {output_path}")
+    return True
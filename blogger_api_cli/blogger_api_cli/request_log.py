@@ -0,0 +1,190 @@
+"""
+Request logging for Blogger API calls.
+This module decides how much of each request and response is written to the output,
+either as human readable text or as JSON Lines for machine consumption.
+Response bodies are only serialized at the 'full' level. Logs go to stderr by default, so they
+never mix with the results and JSON a command prints to stdout.
+"""
+
+import json
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, TextIO
+
+import requests
+
+
+LOG_LEVELS = ('silent', 'summary', 'headers', 'full')
+LOG_FORMATS = ('text', 'jsonl')
+
+
+class RequestLogger:
+    """
+    Writes request/response information at a configurable level of detail.
+
+    Levels:
+        silent: nothing is written.
+        summary: one line per request with the status code and timing.
+        headers: request parameters and response headers, without bodies.
+        full: everything, including pretty-printed request and response bodies.
+    """
+
+    def __init__(self, level: str = 'full', log_format: str = 'text', stream: Optional[TextIO] = None):
+        """
+        Args:
+            level (str): One of LOG_LEVELS.
+            log_format (str): One of LOG_FORMATS.
+            stream (file, optional): Where to write. Defaults to the current sys.stderr.
+        """
+        if level not in LOG_LEVELS:
+            raise ValueError(f"Unknown log level: {level}. Expected one of {', '.join(LOG_LEVELS)}")
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"Unknown log format: {log_format}. Expected one of {', '.join(LOG_FORMATS)}")
+        self.level = level
+        self.log_format = log_format
+        self._stream = stream
+        self._rank = LOG_LEVELS.index(level)
+        # Requests may be logged from several worker threads at once
+        self._lock = threading.Lock()
+
+    @property
+    def stream(self) -> TextIO:
+        return self._stream if self._stream is not None else sys.stderr
+
+    @property
+    def wants_bodies(self) -> bool:
+        """True if response bodies are written, i.e. worth decoding."""
+        return self._rank >= LOG_LEVELS.index('full')
+
+    def _enabled(self, level: str) -> bool:
+        return self._rank >= LOG_LEVELS.index(level)
+
+    def _write_text(self, *lines: str) -> None:
+        text = '\n'.join(lines)
+        with self._lock:
+            print(text, file=self.stream)
+
+    def _write_record(self, event: str, **fields: Any) -> None:
+        record = {'ts': round(time.time(), 3), 'event': event}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        with self._lock:
+            self.stream.write(line)
+
+    @staticmethod
+    def _redact(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Return a copy of the query parameters with the API key hidden."""
+        redacted = dict(params or {})
+        if 'key' in redacted:
+            redacted['key'] = '***'
+        return redacted
+
+    @staticmethod
+    def outcome(method: str, status_code: int) -> str:
+        """
+        Describe the result of a request the way the CLI reports it.
+
+        Returns:
+            str: A SUCCESS/FAILURE message.
+        """
+        if status_code == 200:
+            return "SUCCESS: The request was successful."
+        if status_code in [401, 403] and method != 'GET':
+            return ("FAILURE (Expected for API Key only): This indicates an authentication/authorization issue. "
+                    "API keys are typically for read-only access. Write operations usually require OAuth 2.0.")
+        return "FAILURE: Unexpected status code. Review the error details above."
+
+    def log_request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                    data: Optional[Dict[str, Any]] = None) -> None:
+        """Log an outgoing request before it is sent."""
+        if self.log_format == 'jsonl' or not self._enabled('headers'):
+            return
+        lines = [f"\n--- Testing {method} request ---", f"URL: {url}", f"Params: {self._redact(params)}"]
+        if data and self.wants_bodies:
+            lines.append(f"Body: {json.dumps(data, indent=2)}")
+        self._write_text(*lines)
+
+    def log_response(self, method: str, url: str, params: Optional[Dict[str, Any]],
+                     response: requests.Response, elapsed: float,
+                     json_response: Optional[Any] = None) -> None:
+        """
+        Log a received response.
+
+        Args:
+            method (str): HTTP method of the request.
+            url (str): The requested URL.
+            params (dict, optional): Query parameters of the request.
+            response (requests.Response): The received response.
+            elapsed (float): Seconds spent on the request, including retries.
+            json_response (optional): The decoded body; only used at the 'full' level.
+        """
+        if not self._enabled('summary'):
+            return
+        elapsed_ms = round(elapsed * 1000, 1)
+
+        if self.log_format == 'jsonl':
+            fields = {'method': method, 'url': url, 'params': self._redact(params),
+                      'status': response.status_code, 'elapsed_ms': elapsed_ms}
+            if self._enabled('headers'):
+                fields['headers'] = dict(response.headers)
+            if self.wants_bodies:
+                fields['body'] = json_response if json_response is not None else response.text
+            self._write_record('response', **fields)
+            return
+
+        if not self._enabled('headers'):
+            self._write_text(f"{method} {url} -> {response.status_code} ({elapsed_ms} ms)")
+            return
+
+        lines = [f"Status Code: {response.status_code}"]
+        if self.wants_bodies:
+            if json_response is not None:
+                lines.append(f"Response Body: {json.dumps(json_response, indent=2)}")
+            else:
+                lines.append(f"Response Body (raw): {response.text}")
+        else:
+            lines.extend(f"{name}: {value}" for name, value in response.headers.items())
+        lines.append(self.outcome(method, response.status_code))
+        lines.append("-" * 30)
+        self._write_text(*lines)
+
+    def log_retry(self, reason: str, delay: float, attempt: int, max_retries: int) -> None:
+        """Log a retry scheduled by the transport."""
+        if not self._enabled('summary'):
+            return
+        if self.log_format == 'jsonl':
+            self._write_record('retry', reason=reason, delay=round(delay, 3),
+                               attempt=attempt, max_retries=max_retries)
+        else:
+            self._write_text(f"{reason}; retrying in {delay:.1f}s (attempt {attempt}/{max_retries})")
+
+    def log_error(self, method: str, url: str, error: Exception) -> None:
+        """Log a request that failed without a response."""
+        if not self._enabled('summary'):
+            return
+        if self.log_format == 'jsonl':
+            self._write_record('error', method=method, url=url, error=str(error))
+        else:
+            self._write_text(f"An error occurred during the request: {error}", "-" * 30)
+
+    def log_stats(self, stats) -> None:
+        """Log the throttling counters of a transport."""
+        if not self._enabled('summary'):
+            return
+        if self.log_format == 'jsonl':
+            self._write_record('stats', requests=stats.requests, retries=stats.retries,
+                               backoff_time=round(stats.backoff_time, 3),
+                               rate_limit_waits=stats.rate_limit_waits,
+                               rate_limit_time=round(stats.rate_limit_time, 3))
+        else:
+            self._write_text(f"\nAPI usage: {stats.summary()}")
+
+    def log_cache_stats(self, cache) -> None:
+        """Log the hit/miss counters of a response cache."""
+        if not self._enabled('summary'):
+            return
+        if self.log_format == 'jsonl':
+            self._write_record('cache', hits=cache.hits, misses=cache.misses, bytes_saved=cache.bytes_saved)
+        else:
+            self._write_text(f"Response cache: {cache.summary()}")
@@ -0,0 +1,261 @@
+"""
+Offline full-text search over exported posts.
+Builds an inverted index with BM25 scoring from the output of --export-posts or the
+posts file written by the XML to JSON conversion, saves it to disk, and answers
+queries from it without touching the API.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from blogger_api_cli.entities import post_url
+from blogger_api_cli.export_writers import detect_format
+from blogger_api_cli.incremental import read_export_items
+from blogger_api_cli.precompute import content_hash, content_path, html_to_text, load_content
+
+
+INDEX_VERSION = 1
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+# Titles count as much as this many repetitions of their words in the body
+TITLE_WEIGHT = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Returns:
+        list: The tokens in order of appearance.
+    """
+    return TOKEN_RE.findall(text.lower())
+
+
+class SearchIndex:
+    """
+    An inverted index over posts scored with Okapi BM25.
+    Postings are stored per term as a flat [doc, term frequency, doc, term frequency, ...] list.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.docs = []
+        self.texts = []
+        self.lengths = []
+        self.postings = {}
+
+    @property
+    def average_length(self) -> float:
+        return sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+
+    def add_post(self, post: Dict[str, Any], text: Optional[str] = None) -> None:
+        """
+        Index a single post.
+
+        Args:
+            post (dict): The post.
+            text (str, optional): The plain text of its content, if already extracted.
+        """
+        title = post.get('title') or ''
+        if text is None:
+            text = html_to_text(post.get('content'))
+        tokens = tokenize(text) + tokenize(title) * TITLE_WEIGHT
+
+        doc = len(self.docs)
+        self.docs.append({
+            'id': post.get('id'),
+            'title': title,
+            'url': post_url(post),
+            'published': post.get('published'),
+        })
+        self.texts.append(text)
+        self.lengths.append(len(tokens))
+        for term, frequency in Counter(tokens).items():
+            self.postings.setdefault(term, []).extend((doc, frequency))
+
+    @classmethod
+    def build(cls, posts: Iterable[Dict[str, Any]]) -> 'SearchIndex':
+        """
+        Build an index from posts.
+
+        Returns:
+            SearchIndex: The populated index.
+        """
+        index = cls()
+        for post in posts:
+            index.add_post(post)
+        return index
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank posts against a query with BM25.
+
+        Args:
+            query (str): Free text query.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list: Result dicts with the post metadata, 'score' and 'snippet', best first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        total_docs = len(self.docs)
+        average_length = self.average_length or 1.0
+        scores = {}
+
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            doc_frequency = len(postings) // 2
+            idf = math.log(1 + (total_docs - doc_frequency + 0.5) / (doc_frequency + 0.5))
+            for i in range(0, len(postings), 2):
+                doc, frequency = postings[i], postings[i + 1]
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc] / average_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        results = []
+        for doc, score in best:
+            result = dict(self.docs[doc])
+            result['score'] = round(score, 4)
+            result['snippet'] = self.snippet(doc, terms)
+            results.append(result)
+        return results
+
+    def snippet(self, doc: int, terms: List[str], width: int = 160) -> str:
+        """
+        Cut a window of a post's text around the first query term it contains.
+
+        Returns:
+            str: The snippet, with '...' marking cut-off text.
+        """
+        text = self.texts[doc]
+        lowered = text.lower()
+        position = -1
+        for term in terms:
+            match = re.search(r'\b' + re.escape(term) + r'\b', lowered)
+            if match and (position < 0 or match.start() < position):
+                position = match.start()
+        start = max(0, position - width // 3) if position >= 0 else 0
+        end = min(len(text), start + width)
+        snippet = text[start:end].strip()
+        if start > 0:
+            snippet = '...' + snippet
+        if end < len(text):
+            snippet += '...'
+        return snippet
+
+    def save(self, path: str) -> None:
+        """Write the index to a JSON file."""
+        dir_path = os.path.dirname(os.path.abspath(path))
+        os.makedirs(dir_path, exist_ok=True)
+        data = {
+            'version': INDEX_VERSION,
+            'k1': self.k1,
+            'b': self.b,
+            'docs': self.docs,
+            'texts': self.texts,
+            'lengths': self.lengths,
+            'postings': self.postings,
+        }
+        tmp_path = f'{path}.part'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'SearchIndex':
+        """
+        Read an index written by save().
+
+        Raises:
+            ValueError: If the file was written by an incompatible version.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version: {data.get('version')}")
+        index = cls(k1=data['k1'], b=data['b'])
+        index.docs = data['docs']
+        index.texts = data['texts']
+        index.lengths = data['lengths']
+        index.postings = data['postings']
+        return index
+
+
+def build_search_index(posts_path: str, index_path: str) -> bool:
+    """
+    Build the offline search index from exported posts.
+    The plain text precomputed by --precompute is used for posts whose content did not change.
+
+    Args:
+        posts_path (str): Output of --export-posts (any format) or the posts file/directory of -x.
+        index_path (str): Path to save the index.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    if not os.path.exists(posts_path):
+        print(f"File not found: {posts_path}")
+        return False
+
+    start = time.perf_counter()
+    precomputed = load_content(content_path(posts_path))
+    index = SearchIndex()
+    for post in read_export_items(posts_path, detect_format(posts_path)):
+        record = precomputed.get(post.get('id'))
+        if record is not None and record.get('hash') == content_hash(post.get('content')):
+            index.add_post(post, text=record['text'])
+        else:
+            index.add_post(post)
+    index.save(index_path)
+    elapsed = time.perf_counter() - start
+    print(f"Indexed {len(index.docs)} posts ({len(index.postings)} terms) in {elapsed:.1f}s")
+    print(f"Search index saved to: {index_path}")
+    return True
+
+
+def search_offline(index_path: str, query: str, max_results: int = 10) -> bool:
+    """
+    Search posts using the offline index and print ranked results with snippets.
+
+    Args:
+        index_path (str): Path of an index built by build_search_index.
+        query (str): The search query.
+        max_results (int): Maximum number of results to print.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    if not os.path.exists(index_path):
+        print(f"Search index not found: {index_path}")
+        print("Build it first with --build-index.")
+        return False
+
+    start = time.perf_counter()
+    index = SearchIndex.load(index_path)
+    loaded = time.perf_counter()
+    results = index.search(query, limit=max_results)
+    searched = time.perf_counter()
+
+    print(f"\nSearch query: '{query}' ({len(index.docs)} posts indexed)")
+    print(f"Loaded index in {(loaded - start) * 1000:.0f} ms, searched in {(searched - loaded) * 1000:.1f} ms")
+
+    if not results:
+        print("No posts found matching the query.")
+        return True
+
+    print(f"Found {len(results)} posts matching the query:")
+    for i, result in enumerate(results, 1):
+        print(f"\n--- Result {i} (score {result['score']}) ---")
+        print(f"Title: {result.get('title') or 'No title'}")
+        print(f"URL: {result.get('url') or 'No URL'}")
+        print(f"Published: {result.get('published') or 'Unknown date'}")
+        print(f"Snippet: {result['snippet']}")
+    return True
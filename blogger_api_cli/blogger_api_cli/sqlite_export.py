@@ -0,0 +1,472 @@
+"""
+Export of a blog into a normalized SQLite database.
+Posts, pages, labels and comments get their own tables, with B-tree indexes on the
+columns queries filter by and an FTS5 full-text index on titles and content, so large
+archives can be queried without loading a JSON export into memory.
+Rows are upserted in batched transactions and rows whose 'updated' timestamp did not
+change are skipped, so re-exporting into the same database stays cheap.
+The database is filled either via the API (export_sqlite) or from the files an XML backup
+was converted to (import_converted).
+"""
+
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from blogger_api_cli.config import BloggerConfig
+from blogger_api_cli.entities import numeric_id, post_labels, post_url
+from blogger_api_cli.export_search import (ExportError, _resolve_output_path, fetch_post_comments,
+                                           iter_list_pages, projection_params)
+from blogger_api_cli.export_writers import ExportProgress, detect_format
+from blogger_api_cli.incremental import read_export_items
+from blogger_api_cli.precompute import html_to_text
+
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    content TEXT,
+    url TEXT,
+    status TEXT,
+    published TEXT,
+    updated TEXT,
+    author TEXT,
+    replies INTEGER
+);
+CREATE INDEX IF NOT EXISTS posts_published ON posts(published);
+CREATE INDEX IF NOT EXISTS posts_updated ON posts(updated);
+
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    content TEXT,
+    url TEXT,
+    status TEXT,
+    published TEXT,
+    updated TEXT,
+    author TEXT
+);
+CREATE INDEX IF NOT EXISTS pages_published ON pages(published);
+CREATE INDEX IF NOT EXISTS pages_updated ON pages(updated);
+
+CREATE TABLE IF NOT EXISTS labels (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS post_labels (
+    post_id TEXT NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    label_id INTEGER NOT NULL REFERENCES labels(id),
+    PRIMARY KEY (post_id, label_id)
+);
+CREATE INDEX IF NOT EXISTS post_labels_label ON post_labels(label_id, post_id);
+
+CREATE TABLE IF NOT EXISTS comments (
+    id TEXT PRIMARY KEY,
+    post_id TEXT NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    parent_id TEXT,
+    author TEXT,
+    content TEXT,
+    status TEXT,
+    published TEXT,
+    updated TEXT
+);
+CREATE INDEX IF NOT EXISTS comments_post ON comments(post_id, published);
+"""
+
+# Full-text indexes hold the plain text of titles and content, keyed by the rowid of the source row
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(title, content);
+CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(title, content);
+"""
+
+POST_COLUMNS = ('id', 'title', 'content', 'url', 'status', 'published', 'updated', 'author', 'replies')
+PAGE_COLUMNS = ('id', 'title', 'content', 'url', 'status', 'published', 'updated', 'author')
+COMMENT_COLUMNS = ('id', 'post_id', 'parent_id', 'author', 'content', 'status', 'published', 'updated')
+
+
+def _author_name(item: Dict[str, Any]) -> Optional[str]:
+    author = item.get('author')
+    if isinstance(author, dict):
+        return author.get('displayName') or author.get('name')
+    return None
+
+
+def _upsert_sql(table: str, columns: Iterable[str]) -> str:
+    columns = list(columns)
+    updates = ', '.join(f'{column} = excluded.{column}' for column in columns[1:])
+    return (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}")
+
+
+class BlogDatabase:
+    """
+    A SQLite database holding the posts, pages, labels and comments of a blog.
+    Can be used as a context manager; the connection is closed on exit.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Path of the database file; created if it does not exist.
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        self.conn.execute('PRAGMA synchronous = NORMAL')
+        self.fts_enabled = True
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            try:
+                self.conn.executescript(FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5
+                self.fts_enabled = False
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self._label_ids = dict(self.conn.execute('SELECT name, id FROM labels'))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _changed(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop the rows already stored with the same 'updated' timestamp."""
+        ids = [row['id'] for row in rows]
+        stored = dict(self.conn.execute(
+            f"SELECT id, updated FROM {table} WHERE id IN ({', '.join('?' for _ in ids)})", ids))
+        return [row for row in rows if row['id'] not in stored or stored[row['id']] != row['updated']]
+
+    def _batches(self, items: Iterable[Dict[str, Any]]) -> Iterable[List[Dict[str, Any]]]:
+        batch = []
+        for item in items:
+            if item.get('id'):
+                batch.append(item)
+            if len(batch) >= self.BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _label_id(self, name: str) -> int:
+        label_id = self._label_ids.get(name)
+        if label_id is None:
+            self.conn.execute('INSERT OR IGNORE INTO labels (name) VALUES (?)', (name,))
+            label_id = self.conn.execute('SELECT id FROM labels WHERE name = ?', (name,)).fetchone()[0]
+            self._label_ids[name] = label_id
+        return label_id
+
+    def _update_fts(self, table: str, rows: List[Dict[str, Any]]) -> None:
+        if not self.fts_enabled:
+            return
+        fts_table = f'{table}_fts'
+        for row in rows:
+            rowid = self.conn.execute(f'SELECT rowid FROM {table} WHERE id = ?', (row['id'],)).fetchone()[0]
+            self.conn.execute(f'DELETE FROM {fts_table} WHERE rowid = ?', (rowid,))
+            self.conn.execute(f'INSERT INTO {fts_table} (rowid, title, content) VALUES (?, ?, ?)',
+                              (rowid, row['title'] or '', html_to_text(row['content'])))
+
+    def upsert_posts(self, posts: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Insert or update posts with their labels, one transaction per batch.
+
+        Args:
+            posts (iterable): API post resources or XML-converted posts.
+
+        Returns:
+            dict: Counts of 'written' (new or changed) and 'unchanged' posts.
+        """
+        counts = {'written': 0, 'unchanged': 0}
+        sql = _upsert_sql('posts', POST_COLUMNS)
+        for batch in self._batches(posts):
+            rows = [{
+                'id': post['id'],
+                'title': post.get('title'),
+                'content': post.get('content'),
+                'url': post_url(post),
+                'status': post.get('status') or ('DRAFT' if post.get('draft') else 'LIVE'),
+                'published': post.get('published'),
+                'updated': post.get('updated'),
+                'author': _author_name(post),
+                'replies': int((post.get('replies') or {}).get('totalItems') or 0),
+                'labels': post_labels(post),
+            } for post in batch]
+            with self.conn:
+                changed = self._changed('posts', rows)
+                self.conn.executemany(sql, [tuple(row[c] for c in POST_COLUMNS) for row in changed])
+                for row in changed:
+                    self.conn.execute('DELETE FROM post_labels WHERE post_id = ?', (row['id'],))
+                    self.conn.executemany('INSERT OR IGNORE INTO post_labels (post_id, label_id) VALUES (?, ?)',
+                                          [(row['id'], self._label_id(name)) for name in row['labels']])
+                self._update_fts('posts', changed)
+            counts['written'] += len(changed)
+            counts['unchanged'] += len(rows) - len(changed)
+        return counts
+
+    def upsert_pages(self, pages: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Insert or update pages, one transaction per batch.
+
+        Returns:
+            dict: Counts of 'written' (new or changed) and 'unchanged' pages.
+        """
+        counts = {'written': 0, 'unchanged': 0}
+        sql = _upsert_sql('pages', PAGE_COLUMNS)
+        for batch in self._batches(pages):
+            rows = [{
+                'id': page['id'],
+                'title': page.get('title'),
+                'content': page.get('content'),
+                'url': post_url(page),
+                'status': page.get('status') or ('DRAFT' if page.get('draft') else 'LIVE'),
+                'published': page.get('published'),
+                'updated': page.get('updated'),
+                'author': _author_name(page),
+            } for page in batch]
+            with self.conn:
+                changed = self._changed('pages', rows)
+                self.conn.executemany(sql, [tuple(row[c] for c in PAGE_COLUMNS) for row in changed])
+                self._update_fts('pages', changed)
+            counts['written'] += len(changed)
+            counts['unchanged'] += len(rows) - len(changed)
+        return counts
+
+    def upsert_comments(self, post_id: str, comments: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update the comments of a post.
+
+        Returns:
+            int: The number of comments written.
+        """
+        sql = _upsert_sql('comments', COMMENT_COLUMNS)
+        written = 0
+        for batch in self._batches(comments):
+            rows = [{
+                'id': comment['id'],
+                'post_id': post_id,
+                'parent_id': (comment.get('inReplyTo') or {}).get('id'),
+                'author': _author_name(comment),
+                'content': comment.get('content'),
+                'status': comment.get('status'),
+                'published': comment.get('published'),
+                'updated': comment.get('updated'),
+            } for comment in batch]
+            with self.conn:
+                changed = self._changed('comments', rows)
+                self.conn.executemany(sql, [tuple(row[c] for c in COMMENT_COLUMNS) for row in changed])
+            written += len(changed)
+        return written
+
+    def prune(self, table: str, keep_ids: Iterable[str], statuses: Iterable[str] = ('LIVE',)) -> int:
+        """
+        Delete the rows of a table whose IDs are not in keep_ids, e.g. posts deleted from the blog.
+        Pruning posts also removes, in the same transaction, the comments and label links of
+        posts that no longer exist and labels no post carries any more.
+
+        Args:
+            table (str): 'posts' or 'pages'.
+            keep_ids (iterable): IDs of the rows that still exist.
+            statuses (iterable): Only rows with these statuses are candidates, so rows with
+                                 statuses that were not exported this time are kept.
+
+        Returns:
+            int: The number of deleted rows.
+        """
+        with self.conn:
+            self.conn.execute('CREATE TEMP TABLE IF NOT EXISTS keep_ids (id TEXT PRIMARY KEY)')
+            self.conn.execute('DELETE FROM keep_ids')
+            self.conn.executemany('INSERT OR IGNORE INTO keep_ids (id) VALUES (?)', ((i,) for i in keep_ids))
+            statuses = [status.upper() for status in statuses]
+            stale = [row[0] for row in self.conn.execute(
+                f"SELECT rowid FROM {table} WHERE id NOT IN (SELECT id FROM keep_ids) "
+                f"AND status IN ({', '.join('?' for _ in statuses)})", statuses)]
+            if self.fts_enabled and table in ('posts', 'pages'):
+                self.conn.executemany(f'DELETE FROM {table}_fts WHERE rowid = ?', ((rowid,) for rowid in stale))
+            self.conn.executemany(f'DELETE FROM {table} WHERE rowid = ?', ((rowid,) for rowid in stale))
+            if table == 'posts':
+                self.conn.execute('DELETE FROM comments WHERE post_id NOT IN (SELECT id FROM posts)')
+                self.conn.execute('DELETE FROM post_labels WHERE post_id NOT IN (SELECT id FROM posts)')
+                self.conn.execute('DELETE FROM labels WHERE id NOT IN (SELECT label_id FROM post_labels)')
+        if table == 'posts':
+            self._label_ids = dict(self.conn.execute('SELECT name, id FROM labels'))
+        return len(stale)
+
+
+def _iter_items(url: str, params: Dict[str, Any], seen_ids: List[str],
+                progress: ExportProgress) -> Iterable[Dict[str, Any]]:
+    """Yield every item of a listing endpoint, recording the IDs and the progress."""
+    for data in iter_list_pages(url, params):
+        items = data.get('items', [])
+        seen_ids.extend(item['id'] for item in items)
+        progress.update(len(items))
+        yield from items
+
+
+def export_sqlite(config: BloggerConfig, output_path: Optional[str] = None,
+                  statuses: Optional[List[str]] = None, include_comments: bool = True,
+                  concurrency: Optional[int] = None) -> bool:
+    """
+    Export posts, pages, labels and comments via the Blogger API into a SQLite database.
+    An existing database is updated in place: unchanged rows are skipped and posts or pages
+    of the exported statuses that no longer exist are removed.
+
+    Args:
+        config (BloggerConfig): Configuration object with Blogger settings.
+        output_path (str, optional): Path of the database file.
+                                    If not provided, it will use a default path.
+        statuses (list, optional): Post statuses to export, e.g. ['live', 'draft'].
+        include_comments (bool): Whether to export the comments of every post.
+        concurrency (int, optional): Maximum number of comment requests in flight.
+                                     Defaults to the concurrency from the config.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    blog_id = config.blog_id
+    base_url = config.base_url
+
+    if not blog_id:
+        print("\nError: BLOG_ID is not configured.")
+        return False
+
+    output_path = _resolve_output_path(output_path, "blog.db")
+    concurrency = concurrency or config.concurrency
+
+    print(f"\nExporting blog ID {blog_id} to SQLite")
+    print(f"Output will be saved to: {output_path}")
+
+    post_params = projection_params(None)
+    if statuses:
+        post_params['status'] = statuses
+
+    with BlogDatabase(output_path) as db:
+        if not db.fts_enabled:
+            print("Warning: this SQLite build has no FTS5 support; the full-text index is skipped.")
+
+        post_ids = []
+        page_ids = []
+
+        try:
+            progress = ExportProgress('posts')
+            post_counts = db.upsert_posts(_iter_items(f'{base_url}/blogs/{blog_id}/posts', post_params,
+                                                      post_ids, progress))
+            progress.finish()
+            removed_posts = db.prune('posts', post_ids, statuses or ['live'])
+
+            progress = ExportProgress('pages')
+            page_counts = db.upsert_pages(_iter_items(f'{base_url}/blogs/{blog_id}/pages', projection_params(None),
+                                                      page_ids, progress))
+            progress.finish()
+            removed_pages = db.prune('pages', page_ids)
+
+            comment_count = 0
+            if include_comments:
+                print(f"Fetching comments of {len(post_ids)} posts ({concurrency} requests at a time)")
+                progress = ExportProgress('comments')
+                written = []
+                fetch_post_comments(base_url, blog_id, post_ids, concurrency,
+                                    lambda post_id, comments: written.append(db.upsert_comments(post_id, comments)),
+                                    progress)
+                progress.finish()
+                comment_count = sum(written)
+        except ExportError as e:
+            print(f"Failed to export to SQLite: {e}")
+            return False
+
+    print(f"Posts: {post_counts['written']} written, {post_counts['unchanged']} unchanged, {removed_posts} removed")
+    print(f"Pages: {page_counts['written']} written, {page_counts['unchanged']} unchanged, {removed_pages} removed")
+    if include_comments:
+        print(f"Comments: {comment_count} written")
+    print(f"Successfully exported the blog to {output_path}")
+    return True
+
+
+def _with_numeric_id(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the Atom id of an XML-converted entry with its numeric ID, as the API returns it."""
+    return {**item, 'id': numeric_id(item)}
+
+
+def _iter_converted(path: str, ids: List[str], statuses: set) -> Iterator[Dict[str, Any]]:
+    """Yield the entries of a converted posts or pages file, recording their IDs and statuses."""
+    for item in read_export_items(path, detect_format(path)):
+        item = _with_numeric_id(item)
+        ids.append(item['id'])
+        statuses.add('DRAFT' if item.get('draft') else 'LIVE')
+        yield item
+
+
+def import_converted(posts_path: str, pages_path: Optional[str] = None, comments_path: Optional[str] = None,
+                     output_path: Optional[str] = None) -> bool:
+    """
+    Load the posts, pages and comments converted from an XML backup (see xml_to_json) into
+    a SQLite database with the same tables as export_sqlite. Atom ids are stored as the
+    numeric IDs the API uses, so both sources can fill the same database.
+    An existing database is updated in place: unchanged rows are skipped and posts or pages
+    that are no longer in the converted files are removed.
+
+    Args:
+        posts_path (str): Posts written by xml_entries_to_json, a JSON file or a split directory.
+        pages_path (str, optional): Pages written by xml_entries_to_json.
+        comments_path (str, optional): Comments JSON Lines written by xml_entries_to_json.
+        output_path (str, optional): Path of the database file.
+                                    If not provided, it will use a default path.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    for path in (posts_path, pages_path, comments_path):
+        if path and not os.path.exists(path):
+            print(f"File not found: {path}")
+            return False
+
+    output_path = _resolve_output_path(output_path, "blog.db")
+    print(f"Output will be saved to: {output_path}")
+
+    with BlogDatabase(output_path) as db:
+        if not db.fts_enabled:
+            print("Warning: this SQLite build has no FTS5 support; the full-text index is skipped.")
+
+        post_ids, post_statuses = [], set()
+        post_counts = db.upsert_posts(_iter_converted(posts_path, post_ids, post_statuses))
+        # Drafts are only in the files when the backup was converted with --include-drafts
+        removed_posts = db.prune('posts', post_ids, post_statuses or ['LIVE'])
+
+        page_counts = removed_pages = None
+        if pages_path:
+            page_ids, page_statuses = [], set()
+            page_counts = db.upsert_pages(_iter_converted(pages_path, page_ids, page_statuses))
+            removed_pages = db.prune('pages', page_ids, page_statuses or ['LIVE'])
+
+        comment_count = skipped = 0
+        if comments_path:
+            known_posts = set(post_ids)
+            with open(comments_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    post_id = numeric_id({'id': record.get('postId')})
+                    if post_id not in known_posts:
+                        # Comments on drafts that were not converted
+                        skipped += len(record['comments'])
+                        continue
+                    comment_count += db.upsert_comments(post_id, map(_with_numeric_id, record['comments']))
+
+    print(f"Posts: {post_counts['written']} written, {post_counts['unchanged']} unchanged, {removed_posts} removed")
+    if page_counts is not None:
+        print(f"Pages: {page_counts['written']} written, {page_counts['unchanged']} unchanged, {removed_pages} removed")
+    if comments_path:
+        print(f"Comments: {comment_count} written" + (f", {skipped} on posts not in {posts_path} skipped" if skipped else ""))
+    print(f"Successfully loaded the converted backup into {output_path}")
+    return True
@@ -1,108 +1,433 @@
 import xml.etree.ElementTree as ET
 import os
 import json
+import re
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
-def xml_entries_to_json(xml_path, posts_json_path, pages_json_path, include_drafts=False):
+from blogger_api_cli.backup_archive import READ_ERRORS, open_backup
+from blogger_api_cli.date_index import DateIndex, date_index_path
+from blogger_api_cli.entities import post_labels
+from blogger_api_cli.export_writers import JsonArrayWriter, SplitWriter
+from blogger_api_cli.label_index import LabelIndex, label_index_path
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+APP = '{http://purl.org/atom/app#}'
+THR = '{http://purl.org/syndication/thread/1.0}'
+ns = {'atom': 'http://www.w3.org/2005/Atom'}
+
+
+def entry_to_obj(entry, include_drafts=False, include_comments=False):
+    """
+    Converts a single <entry> element into the JSON object written to the output files.
+
+    Args:
+        entry (xml.etree.ElementTree.Element): The <entry> element
+        include_drafts (bool): Whether draft entries are kept
+        include_comments (bool): Whether comment entries are kept
+
+    Returns:
+        tuple: (kind, entry_obj) where kind is 'post', 'page' or 'comment', or None if the entry
+               is skipped (a draft without include_drafts, settings, template...)
+               Comments carry the id of the post they belong to in 'postId'.
+    """
+    # Check if entry is a draft
+    is_draft = False
+    app_control = entry.find(f'{APP}control')
+    if app_control is not None:
+        app_draft = app_control.find(f'{APP}draft')
+        if app_draft is not None and app_draft.text and app_draft.text.strip().lower() == 'yes':
+            is_draft = True
+            if not include_drafts:
+                return None
+
+    entry_obj = {}
+    # Basic fields with string handling
+    for tag in ['id', 'title', 'content', 'published', 'updated']:
+        el = entry.find(f'atom:{tag}', ns)
+        if el is not None and el.text is not None:
+            value = el.text
+            if tag == 'id':
+                value = value.replace('\n', '').replace('\r', '').strip()
+            else:
+                value = value.replace('\r\n', '\n').replace('\r', '\n')
+            entry_obj[tag] = value
+        else:
+            entry_obj[tag] = None
+    # Categories: check all for kind#post or kind#page
+    categories = entry.findall('atom:category', ns)
+    terms = [cat.attrib.get('term', '') for cat in categories]
+    # Exclude kind#post and kind#page from categories
+    non_kind_categories = [
+        cat.attrib for cat in categories
+        if not (cat.attrib.get('term', '').startswith('http://schemas.google.com/blogger/2008/kind#'))
+    ]
+    entry_obj['categories'] = non_kind_categories
+    # category_term removed as requested
+    # Links
+    entry_obj['links'] = [
+        {k: v for k, v in link.attrib.items()}
+        for link in entry.findall('atom:link', ns)
+    ]
+    # Author
+    author = entry.find('atom:author', ns)
+    if author is not None:
+        entry_obj['author'] = {child.tag.split('}')[-1]: child.text for child in author}
+    else:
+        entry_obj['author'] = None
+    # Add draft status to entry object
+    entry_obj['draft'] = is_draft
+
+    if any('kind#post' in t for t in terms):
+        return 'post', entry_obj
+    if any('kind#page' in t for t in terms):
+        return 'page', entry_obj
+    if include_comments and any('kind#comment' in t for t in terms):
+        # thr:in-reply-to references the post entry by its id
+        in_reply_to = entry.find(f'{THR}in-reply-to')
+        ref = in_reply_to.attrib.get('ref') if in_reply_to is not None else None
+        entry_obj['postId'] = ref.strip() if ref else None
+        return 'comment', entry_obj
+    return None
+
+
+def iter_entries(source):
+    """
+    Streams the top-level <entry> elements of a Blogger backup feed.
+    Each entry is cleared after it has been handled, so memory use does not grow with the
+    size of the backup.
+
+    Args:
+        source (str or file): Path or binary file object of the XML backup
+
+    Yields:
+        xml.etree.ElementTree.Element: Each <entry> element, valid until the next one is requested
+    """
+    root = None
+    depth = 0
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        # Only direct children of <feed>; nested elements are handled with their entry
+        if depth == 1:
+            if elem.tag == f'{ATOM}entry':
+                yield elem
+            elem.clear()
+            root.remove(elem)
+
+
+class EntryFragmentReader:
+    """
+    Splits a Blogger backup feed into the raw bytes of its <entry> elements without parsing it.
+    Together with the <feed> start tag, which declares the namespace prefixes, each fragment
+    can be parsed on its own in a worker process.
+    This relies on entries never being nested and on '<entry' and '</entry>' not appearing
+    inside CDATA sections or comments, which holds for Blogger exports (content is escaped).
+    """
+
+    CHUNK_SIZE = 4 * 1024 * 1024
+    FEED_START_RE = re.compile(rb'<feed[\s>]')
+    ENTRY_START_RE = re.compile(rb'<entry[\s>]')
+    ENTRY_END = b'</entry>'
+
+    def __init__(self, source):
+        """
+        Args:
+            source (str or file): Path or binary file object of the XML backup
+        """
+        self._source = source
+        self.feed_tag = None
+
+    def _chunks(self):
+        if isinstance(self._source, (str, os.PathLike)):
+            with open(self._source, 'rb') as f:
+                yield from iter(lambda: f.read(self.CHUNK_SIZE), b'')
+        else:
+            yield from iter(lambda: self._source.read(self.CHUNK_SIZE), b'')
+
+    def __iter__(self):
+        buffer = b''
+        pos = 0
+        for chunk in self._chunks():
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            if self.feed_tag is None:
+                match = self.FEED_START_RE.search(buffer)
+                end = buffer.find(b'>', match.start()) if match else -1
+                if end < 0:
+                    continue
+                self.feed_tag = buffer[match.start():end + 1]
+                pos = end + 1
+            while True:
+                match = self.ENTRY_START_RE.search(buffer, pos)
+                if not match:
+                    # Keep a possible partial '<entry' at the end of the buffer
+                    pos = max(pos, len(buffer) - len(self.ENTRY_END))
+                    break
+                end = buffer.find(self.ENTRY_END, match.end())
+                if end < 0:
+                    pos = match.start()
+                    break
+                end += len(self.ENTRY_END)
+                yield buffer[match.start():end]
+                pos = end
+        if self.feed_tag is None:
+            raise ET.ParseError('No <feed> element found in the XML backup')
+
+
+def _convert_fragments(feed_tag, fragments, include_drafts, include_comments):
+    """
+    Converts a batch of raw <entry> fragments in a worker process.
+
+    Returns:
+        list: The _serialize result for each kept entry, None for skipped ones
+    """
+    results = []
+    for fragment in fragments:
+        entry = ET.fromstring(feed_tag + fragment + b'</feed>')[0]
+        result = entry_to_obj(entry, include_drafts, include_comments)
+        results.append(_serialize(*result) if result is not None else None)
+    return results
+
+
+def _iter_converted_parallel(source, include_drafts, include_comments, jobs, batch_size=200):
+    """
+    Yields the _serialize result for each kept entry, in file order.
+    The reader splits the backup into batches of raw entry fragments, a pool of worker processes
+    converts them, and results are consumed in submission order. Only a bounded number of
+    batches is in flight, so memory use does not grow with the size of the backup.
+    """
+    reader = EntryFragmentReader(source)
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        batch = []
+        for fragment in reader:
+            batch.append(fragment)
+            if len(batch) >= batch_size:
+                pending.append(pool.submit(_convert_fragments, reader.feed_tag, batch,
+                                           include_drafts, include_comments))
+                batch = []
+                if len(pending) >= jobs * 4:
+                    yield from filter(None, pending.popleft().result())
+        if batch:
+            pending.append(pool.submit(_convert_fragments, reader.feed_tag, batch,
+                                       include_drafts, include_comments))
+        while pending:
+            yield from filter(None, pending.popleft().result())
+
+
+def _iter_converted(source, include_drafts, include_comments):
+    """Yields the _serialize result for each kept entry, in file order."""
+    for entry in iter_entries(source):
+        result = entry_to_obj(entry, include_drafts, include_comments)
+        if result is not None:
+            yield _serialize(*result)
+
+
+def _serialize(kind, entry_obj):
+    """
+    Returns:
+        tuple: (kind, is_draft, post id of a comment, serialized JSON, summary). Posts and pages
+               are indented for the JSON array files, comments are kept on a single line.
+               The summary holds the fields the export indexes need; None for comments.
+    """
+    if kind == 'comment':
+        return kind, False, entry_obj['postId'], json.dumps(entry_obj, ensure_ascii=False), None
+    summary = {'id': entry_obj['id'], 'published': entry_obj['published'], 'labels': post_labels(entry_obj)}
+    return kind, entry_obj['draft'], None, json.dumps(entry_obj, indent=2, ensure_ascii=False), summary
+
+
+class _DraftSpool:
+    """Keeps draft entries in a temporary JSON Lines file until the published entries are written."""
+
+    def __init__(self):
+        self.count = 0
+        self._file = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+    def write_json(self, text):
+        # One serialized entry per line, itself encoded as a JSON string
+        self._file.write(json.dumps(text, ensure_ascii=False))
+        self._file.write('\n')
+        self.count += 1
+
+    def drain_into(self, writer):
+        self._file.seek(0)
+        for line in self._file:
+            writer.write_json(json.loads(line))
+        self._file.close()
+
+
+class _CommentSpool:
+    """
+    Collects comments in a temporary file while the backup is read, then writes them grouped
+    by post. Only the spool offsets of each post's comments are kept in memory.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._offsets = {}
+        self._file = tempfile.TemporaryFile('w+b')
+
+    def write_json(self, post_id, text):
+        self._offsets.setdefault(post_id, []).append(self._file.tell())
+        self._file.write(text.encode('utf-8'))
+        self._file.write(b'\n')
+        self.count += 1
+
+    def write_grouped(self, comments_path, index_path):
+        """
+        Write one {"postId": ..., "comments": [...]} line per post and the offset index.
+
+        Returns:
+            int: The number of posts with comments.
+        """
+        index = {}
+        dir_path = os.path.dirname(os.path.abspath(comments_path))
+        os.makedirs(dir_path, exist_ok=True)
+        with open(f'{comments_path}.part', 'wb') as out:
+            for post_id, offsets in self._offsets.items():
+                comments = []
+                for offset in offsets:
+                    self._file.seek(offset)
+                    comments.append(self._file.readline().rstrip(b'\n'))
+                line = (b'{"postId": ' + json.dumps(post_id, ensure_ascii=False).encode('utf-8') +
+                        b', "comments": [' + b', '.join(comments) + b']}\n')
+                index[post_id] = [out.tell(), len(line)]
+                out.write(line)
+        os.replace(f'{comments_path}.part', comments_path)
+        with open(f'{index_path}.part', 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(f'{index_path}.part', index_path)
+        self._file.close()
+        return len(index)
+
+
+def comments_index_path(comments_path):
+    """
+    Returns:
+        str: The offset index path belonging to a comments file.
+    """
+    return f'{comments_path}.index.json'
+
+
+def load_post_comments(comments_path, post_id, index=None):
+    """
+    Loads the comments of a single post from a comments file written by xml_entries_to_json,
+    reading only that post's byte range.
+
+    Args:
+        comments_path (str): Path of the comments JSON Lines file
+        post_id (str): Entry id of the post, as in the posts JSON 'id' field
+        index (dict, optional): The loaded offset index; read from the index file if not given
+
+    Returns:
+        list: The post's comments, or an empty list if it has none
+    """
+    if index is None:
+        with open(comments_index_path(comments_path), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    if post_id not in index:
+        return []
+    offset, length = index[post_id]
+    with open(comments_path, 'rb') as f:
+        f.seek(offset)
+        return json.loads(f.read(length))['comments']
+
+
+def xml_entries_to_json(xml_path, posts_json_path, pages_json_path, include_drafts=False, jobs=1,
+                        comments_json_path=None, output_format='json', chunk_size=None):
     """
     Extracts <entry> elements from the XML, splits them into posts and pages by <category term>,
     and writes two JSON files with arrays of objects.
-    
+    The backup is parsed incrementally and entries are written as they are read, so peak memory
+    stays bounded regardless of the size of the backup. Drafts are spooled to a temporary file
+    and written after the published entries.
+    With several jobs, entries are converted by a pool of worker processes; the output is
+    byte-identical to the serial conversion.
+    With a comments path, comment entries are also extracted and written as one
+    {"postId": ..., "comments": [...]} line per post, next to an offset index
+    (<comments>.index.json, post id -> [byte offset, length]) used by load_post_comments.
+    With the 'split' output format, the posts and pages paths are directories receiving one
+    file per entry, listing chunks and a manifest (see export_writers.SplitWriter).
+    A label index and a date index of the posts (see label_index.LabelIndex and
+    date_index.DateIndex) are written next to the posts JSON.
+
     Args:
-        xml_path (str): Path to the XML blog backup file
+        xml_path (str): Path to the XML blog backup file, optionally compressed or inside a
+                        Takeout archive (.zip, .gz, .bz2, .xz, .tgz; see backup_archive.open_backup)
         posts_json_path (str): Path to save posts JSON
         pages_json_path (str): Path to save pages JSON
         include_drafts (bool): Whether to include draft posts and pages (default: False)
+        jobs (int): Number of worker processes; 1 converts in this process, 0 uses every CPU (default: 1)
+        comments_json_path (str, optional): Path to save comments JSON Lines (default: comments are skipped)
+        output_format (str): 'json' for an array per file or 'split' for a directory per kind (default: 'json')
+        chunk_size (int, optional): Summaries per listing chunk of split output
     """
     if not os.path.exists(xml_path):
         print(f"File not found: {xml_path}")
         return
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-    ns = {'atom': 'http://www.w3.org/2005/Atom'}
-
-    posts = []
-    pages = []
-    draft_posts = []
-    draft_pages = []
-
-    for entry in root.findall('atom:entry', ns):
-        # Check if entry is a draft
-        is_draft = False
-        app_control = entry.find('{http://purl.org/atom/app#}control')
-        if app_control is not None:
-            app_draft = app_control.find('{http://purl.org/atom/app#}draft')
-            if app_draft is not None and app_draft.text and app_draft.text.strip().lower() == 'yes':
-                is_draft = True
-                if not include_drafts:
-                    continue
 
-        entry_obj = {}
-        # Basic fields with string handling
-        for tag in ['id', 'title', 'content', 'published', 'updated']:
-            el = entry.find(f'atom:{tag}', ns)
-            if el is not None and el.text is not None:
-                value = el.text
-                if tag == 'id':
-                    value = value.replace('\n', '').replace('\r', '').strip()
-                else:
-                    value = value.replace('\r\n', '\n').replace('\r', '\n')
-                entry_obj[tag] = value
+    include_comments = comments_json_path is not None
+    jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+    try:
+        with open_backup(xml_path) as source:
+            if jobs > 1:
+                converted = _iter_converted_parallel(source, include_drafts, include_comments, jobs)
             else:
-                entry_obj[tag] = None
-        # Categories: check all for kind#post or kind#page
-        categories = entry.findall('atom:category', ns)
-        terms = [cat.attrib.get('term', '') for cat in categories]
-        # Exclude kind#post and kind#page from categories
-        non_kind_categories = [
-            cat.attrib for cat in categories
-            if not (cat.attrib.get('term', '').startswith('http://schemas.google.com/blogger/2008/kind#'))
-        ]
-        entry_obj['categories'] = non_kind_categories
-        # category_term removed as requested
-        # Links
-        entry_obj['links'] = [
-            {k: v for k, v in link.attrib.items()}
-            for link in entry.findall('atom:link', ns)
-        ]
-        # Author
-        author = entry.find('atom:author', ns)
-        if author is not None:
-            entry_obj['author'] = {child.tag.split('}')[-1]: child.text for child in author}
-        else:
-            entry_obj['author'] = None
-        # Add draft status to entry object
-        entry_obj['draft'] = is_draft
-        
-        # Sort into posts/pages
-        if any('kind#post' in t for t in terms):
-            if is_draft and include_drafts:
-                draft_posts.append(entry_obj)
-            elif not is_draft:
-                posts.append(entry_obj)
-        elif any('kind#page' in t for t in terms):
-            if is_draft and include_drafts:
-                draft_pages.append(entry_obj)
-            elif not is_draft:
-                pages.append(entry_obj)
-
-    # Combine published and draft entries if include_drafts is True
-    if include_drafts:
-        total_posts = posts + draft_posts
-        total_pages = pages + draft_pages
-    else:
-        total_posts = posts
-        total_pages = pages
-
-    # Write JSON files
-    with open(posts_json_path, 'w', encoding='utf-8') as f:
-        json.dump(total_posts, f, ensure_ascii=False, indent=2)
-    with open(pages_json_path, 'w', encoding='utf-8') as f:
-        json.dump(total_pages, f, ensure_ascii=False, indent=2)
-    
+                converted = _iter_converted(source, include_drafts, include_comments)
+
+            if output_format == 'split':
+                posts = SplitWriter(posts_json_path, chunk_size=chunk_size, ensure_ascii=False)
+                pages = SplitWriter(pages_json_path, chunk_size=chunk_size, ensure_ascii=False)
+            else:
+                posts = JsonArrayWriter(posts_json_path, ensure_ascii=False)
+                pages = JsonArrayWriter(pages_json_path, ensure_ascii=False)
+
+            with posts, pages:
+                writers = {'post': posts, 'page': pages}
+                drafts = {'post': _DraftSpool(), 'page': _DraftSpool()}
+                comments = _CommentSpool()
+                # Split output keeps its indexes inside the posts directory
+                labels = LabelIndex() if output_format != 'split' else None
+                dates = DateIndex() if output_format != 'split' else None
+
+                for kind, is_draft, post_id, text, summary in converted:
+                    if kind == 'post' and labels is not None:
+                        labels.add(summary)
+                        dates.add(summary)
+                    if kind == 'comment':
+                        comments.write_json(post_id, text)
+                    elif is_draft:
+                        drafts[kind].write_json(text)
+                    else:
+                        writers[kind].write_json(text)
+
+                # Published entries come first, followed by the drafts
+                published_posts, published_pages = posts.count, pages.count
+                drafts['post'].drain_into(posts)
+                drafts['page'].drain_into(pages)
+    except (*READ_ERRORS, ET.ParseError) as e:
+        print(f"Failed to read {xml_path}: {e}")
+        return
+
     # Generate summary messages
     if include_drafts:
-        print(f"Wrote {len(posts)} published posts and {len(draft_posts)} draft posts to {posts_json_path}")
-        print(f"Wrote {len(pages)} published pages and {len(draft_pages)} draft pages to {pages_json_path}")
+        print(f"Wrote {published_posts} published posts and {drafts['post'].count} draft posts to {posts_json_path}")
+        print(f"Wrote {published_pages} published pages and {drafts['page'].count} draft pages to {pages_json_path}")
     else:
-        print(f"Wrote {len(posts)} published posts to {posts_json_path}")
-        print(f"Wrote {len(pages)} published pages to {pages_json_path}")
+        print(f"Wrote {published_posts} published posts to {posts_json_path}")
+        print(f"Wrote {published_pages} published pages to {pages_json_path}")
+    if labels is not None:
+        labels.save(label_index_path(posts_json_path), ensure_ascii=False)
+        print(f"Wrote label index ({len(labels.names)} labels) to {label_index_path(posts_json_path)}")
+        dates.save(date_index_path(posts_json_path), ensure_ascii=False)
+        print(f"Wrote date index ({dates.count} posts) to {date_index_path(posts_json_path)}")
+    if include_comments:
+        index_path = comments_index_path(comments_json_path)
+        commented_posts = comments.write_grouped(comments_json_path, index_path)
+        print(f"Wrote {comments.count} comments on {commented_posts} posts to {comments_json_path} (index: {index_path})")
@@ -0,0 +1,155 @@
+"""
+Shared fixtures: a local stub of the Blogger posts list endpoint and a transport pointed at it.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from blogger_api_cli.api import BloggerTransport, RetryPolicy, set_default_transport
+from blogger_api_cli.request_log import RequestLogger
+
+
+def _parse_date(value):
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+
+
+def make_posts(count, start, step):
+    """
+    Build post resources published newest first.
+
+    Args:
+        count (int): Number of posts.
+        start (datetime): Publication date of the newest post.
+        step (timedelta): Time between consecutive posts.
+
+    Returns:
+        list: Post dictionaries.
+    """
+    posts = []
+    for i in range(count):
+        published = (start - step * i).strftime('%Y-%m-%dT%H:%M:%SZ')
+        posts.append({
+            'kind': 'blogger#post',
+            'id': str(1000 + i),
+            'title': f'Post {i}',
+            'published': published,
+            'updated': published,
+        })
+    return posts
+
+
+class StubBlogger:
+    """
+    State of the stub server: the posts it lists, the requests it received, how many
+    were served at the same time and how many connections were opened.
+    """
+
+    def __init__(self):
+        self.posts = []
+        self.delay = 0.0
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    def list_posts(self, query):
+        """Answer a posts.list request: startDate/endDate filters, maxResults and offset page tokens."""
+        posts = self.posts
+        if 'startDate' in query:
+            start = _parse_date(query['startDate'])
+            posts = [post for post in posts if _parse_date(post['published']) >= start]
+        if 'endDate' in query:
+            end = _parse_date(query['endDate'])
+            posts = [post for post in posts if _parse_date(post['published']) <= end]
+        offset = int(query.get('pageToken', 0))
+        size = int(query.get('maxResults', 10))
+        data = {'kind': 'blogger#postList', 'items': posts[offset:offset + size]}
+        if offset + size < len(posts):
+            data['nextPageToken'] = str(offset + size)
+        return data
+
+    def connected(self):
+        with self._lock:
+            self.connections += 1
+
+    def enter(self, query):
+        with self._lock:
+            self.requests.append(query)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+
+def make_handler(stub):
+    """Build a request handler class serving the stub's posts."""
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            stub.connected()
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            stub.enter(query)
+            try:
+                if stub.delay:
+                    time.sleep(stub.delay)
+                if url.path.endswith('/posts'):
+                    status, data = 200, stub.list_posts(query)
+                else:
+                    status, data = 404, {'error': {'code': 404, 'message': 'Not Found'}}
+            finally:
+                stub.leave()
+            body = json.dumps(data).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+
+@pytest.fixture
+def stub_blogger(monkeypatch):
+    """
+    A running stub server and a silent transport shared by the API helpers.
+
+    Yields:
+        tuple: (StubBlogger, posts list URL)
+    """
+    monkeypatch.setenv('BLOGGER_API_KEY', 'test-key')
+    stub = StubBlogger()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(stub))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    transport = BloggerTransport(retry_policy=RetryPolicy(max_retries=0),
+                                 logger=RequestLogger(level='silent'))
+    # Talk to the stub directly, whatever proxy the environment configures
+    transport.session.trust_env = False
+    set_default_transport(transport)
+    try:
+        yield stub, f'http://127.0.0.1:{server.server_address[1]}/blogs/1/posts'
+    finally:
+        set_default_transport(None)
+        transport.close()
+        server.shutdown()
+        server.server_close()
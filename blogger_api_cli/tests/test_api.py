@@ -0,0 +1,230 @@
+"""
+Tests for the retry policy, the rate limiter and the transport's retry loop
+"""
+
+import random
+from email.utils import format_datetime
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from blogger_api_cli import api
+from blogger_api_cli.api import BloggerTransport, RateLimiter, RetryPolicy
+from blogger_api_cli.request_log import RequestLogger
+
+
+class FakeTime:
+    """Stands in for the time module of blogger_api_cli.api: a clock that only moves on sleep()"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A fake clock for blogger_api_cli.api"""
+    fake = FakeTime()
+    monkeypatch.setattr(api, 'time', fake)
+    return fake
+
+
+def make_response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = b'{}'
+    response._content_consumed = True
+    return response
+
+
+class TestRetryPolicy:
+    """Test class for RetryPolicy"""
+
+    @pytest.mark.parametrize('method, status, headers, error, expected', [
+        # Idempotent methods retry every retryable status and connection error
+        ('GET', 500, {}, None, True),
+        ('GET', 503, {}, None, True),
+        ('GET', 429, {}, None, True),
+        ('GET', 404, {}, None, False),
+        ('GET', 200, {}, None, False),
+        ('DELETE', 502, {}, None, True),
+        ('PUT', None, {}, requests.exceptions.ReadTimeout(), True),
+        ('GET', None, {}, requests.exceptions.ConnectionError(), True),
+        # POST and PATCH only when the server did not process the request
+        ('POST', 429, {}, None, True),
+        ('POST', 503, {'Retry-After': '5'}, None, True),
+        ('POST', 503, {}, None, False),
+        ('POST', 500, {}, None, False),
+        ('PATCH', 502, {}, None, False),
+        ('PATCH', 429, {}, None, True),
+        ('POST', None, {}, requests.exceptions.ConnectTimeout(), True),
+        ('POST', None, {}, requests.exceptions.ReadTimeout(), False),
+        ('PATCH', None, {}, requests.exceptions.ConnectionError(), False),
+        ('post', 429, {}, None, True),
+    ])
+    def test_should_retry(self, method, status, headers, error, expected):
+        """Test which failures are retried for each method"""
+        response = make_response(status, headers) if status is not None else None
+
+        assert RetryPolicy().should_retry(0, response, method=method, error=error) is expected
+
+    def test_gives_up_after_max_retries(self):
+        """Test that no attempt is made past max_retries"""
+        policy = RetryPolicy(max_retries=2)
+        response = make_response(503)
+
+        assert [policy.should_retry(attempt, response) for attempt in range(4)] == [True, True, False, False]
+
+    @pytest.mark.parametrize('value, expected', [
+        ('7', 7.0),
+        ('0.5', 0.5),
+        ('-3', 0.0),
+        ('120', 60.0),
+        ('soon', None),
+    ])
+    def test_retry_after_seconds(self, clock, value, expected):
+        """Test Retry-After given in seconds, capped at backoff_max"""
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=60.0)
+        random.seed(0)
+        jitter = random.uniform(0, 1.0)
+        random.seed(0)
+
+        delay = policy.delay(0, make_response(429, {'Retry-After': value}))
+
+        # An unparseable header falls back to the jittered backoff
+        assert delay == (expected if expected is not None else jitter)
+
+    def test_retry_after_http_date(self, clock):
+        """Test Retry-After given as an HTTP date, relative to the current time"""
+        clock.now = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+        retry_at = format_datetime(datetime(2025, 1, 1, 0, 0, 12, tzinfo=timezone.utc), usegmt=True)
+
+        assert RetryPolicy().delay(0, make_response(503, {'Retry-After': retry_at})) == 12.0
+
+    def test_full_jitter_bound(self):
+        """Test that backoff delays are drawn from [0, min(backoff_max, base * 2^attempt)]"""
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=10.0)
+        random.seed(1234)
+        delays = {attempt: [policy.delay(attempt) for _ in range(200)] for attempt in range(8)}
+
+        for attempt, values in delays.items():
+            bound = min(10.0, 0.5 * 2 ** attempt)
+            assert all(0 <= value <= bound for value in values)
+            # Full jitter spreads over the whole range instead of clustering at the bound
+            assert min(values) < bound * 0.1 and max(values) > bound * 0.9
+
+        random.seed(1234)
+        assert policy.delay(0) == delays[0][0]
+
+
+class TestRateLimiter:
+    """Test class for RateLimiter"""
+
+    def test_unlimited(self, clock):
+        """Test that a limiter without limits never waits"""
+        limiter = RateLimiter()
+
+        assert [limiter.reserve() for _ in range(100)] == [0.0] * 100
+
+    def test_burst_then_queue(self, clock):
+        """Test that a full bucket allows a burst and queues further requests at the rate"""
+        limiter = RateLimiter(requests_per_second=4)
+
+        delays = [limiter.reserve() for _ in range(7)]
+
+        assert delays == pytest.approx([0, 0, 0, 0, 0.25, 0.5, 0.75])
+
+    def test_refill(self, clock):
+        """Test that tokens refill at the rate, up to the capacity"""
+        limiter = RateLimiter(requests_per_second=2)
+        for _ in range(2):
+            limiter.reserve()
+
+        clock.advance(0.5)
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == pytest.approx(0.5)
+
+        # A long idle period does not bank more than one second of tokens
+        clock.advance(60)
+        assert [limiter.reserve() for _ in range(3)] == pytest.approx([0, 0, 0.5])
+
+    def test_per_minute_limit(self, clock):
+        """Test that the stricter of the per-second and per-minute buckets wins"""
+        limiter = RateLimiter(requests_per_second=10, requests_per_minute=3)
+
+        delays = [limiter.reserve() for _ in range(4)]
+        clock.advance(1)
+
+        assert delays == pytest.approx([0, 0, 0, 20])
+        assert limiter.reserve() == pytest.approx(39)
+
+
+class TestTransportRetries:
+    """Test class for the retry loop of BloggerTransport"""
+
+    def make_transport(self, responses, max_retries=3):
+        transport = BloggerTransport(retry_policy=RetryPolicy(max_retries=max_retries, backoff_max=0.0),
+                                     logger=RequestLogger(level='silent'))
+        transport.session.request = MagicMock(side_effect=responses)
+        return transport
+
+    def test_get_retried_until_success(self, clock):
+        """Test that a GET is retried after a 503"""
+        transport = self.make_transport([make_response(503, {'Retry-After': '0'}), make_response(200)])
+
+        response = transport.request('GET', 'https://example.com')
+
+        assert response.status_code == 200
+        assert transport.session.request.call_count == 2
+        assert transport.stats.retries == 1
+
+    def test_post_not_retried_after_server_error(self, clock):
+        """Test that a POST failing with 500 is returned instead of being sent again"""
+        transport = self.make_transport([make_response(500), make_response(200)])
+
+        response = transport.request('POST', 'https://example.com', data={'title': 'x'})
+
+        assert response.status_code == 500
+        assert transport.session.request.call_count == 1
+
+    def test_post_retried_after_connect_timeout(self, clock):
+        """Test that a POST that never reached the server is sent again"""
+        transport = self.make_transport([requests.exceptions.ConnectTimeout(), make_response(200)])
+
+        assert transport.request('POST', 'https://example.com').status_code == 200
+        assert transport.session.request.call_count == 2
+
+    def test_post_read_timeout_raised(self, clock):
+        """Test that a POST whose response timed out is not repeated"""
+        transport = self.make_transport([requests.exceptions.ReadTimeout(), make_response(200)])
+
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            transport.request('POST', 'https://example.com')
+        assert transport.session.request.call_count == 1
+
+    def test_last_response_returned_when_retries_run_out(self, clock):
+        """Test that the final failed response is returned after max_retries"""
+        transport = self.make_transport([make_response(502)] * 3, max_retries=2)
+
+        assert transport.request('GET', 'https://example.com').status_code == 502
+        assert transport.session.request.call_count == 3
+        assert transport.stats.retries == 2
@@ -0,0 +1,81 @@
+"""
+Tests for the asyncio client
+"""
+
+import asyncio
+
+import pytest
+
+from blogger_api_cli.async_api import AsyncBloggerClient, async_get_request
+
+
+async def fetch_many(client, url, count):
+    return await asyncio.gather(*[client.get(url, params={'maxResults': 1}) for _ in range(count)])
+
+
+class TestAsyncBloggerClient:
+    """Test class for AsyncBloggerClient"""
+
+    @pytest.mark.parametrize('concurrency', [1, 3])
+    def test_concurrency_bounds_requests_in_flight(self, stub_blogger, concurrency):
+        """Test that no more than `concurrency` requests reach the server at once"""
+        stub, url = stub_blogger
+        stub.delay = 0.05
+
+        async def run():
+            async with AsyncBloggerClient(concurrency=concurrency) as client:
+                return await fetch_many(client, url, 12)
+
+        responses = asyncio.run(run())
+
+        assert [response.status_code for response in responses] == [200] * 12
+        assert len(stub.requests) == 12
+        assert stub.max_in_flight == concurrency
+
+    def test_requests_run_concurrently(self, stub_blogger):
+        """Test that requests overlap instead of running one after another"""
+        stub, url = stub_blogger
+        stub.delay = 0.1
+
+        async def run():
+            async with AsyncBloggerClient(concurrency=4) as client:
+                loop = asyncio.get_running_loop()
+                start = loop.time()
+                await fetch_many(client, url, 8)
+                return loop.time() - start
+
+        elapsed = asyncio.run(run())
+
+        # Serially the 8 requests would take 0.8s; 4 at a time takes two rounds
+        assert elapsed < 0.6
+
+    def test_pool_grows_to_concurrency(self, stub_blogger):
+        """Test that a concurrency above the pool size reuses its connections"""
+        stub, url = stub_blogger
+        stub.delay = 0.05
+
+        async def run():
+            async with AsyncBloggerClient(concurrency=16) as client:
+                await fetch_many(client, url, 16)
+                await fetch_many(client, url, 16)
+
+        asyncio.run(run())
+
+        assert stub.max_in_flight == 16
+        # A pool of 10 would open 6 new connections for the second round
+        assert stub.connections == 16
+
+    def test_invalid_concurrency(self):
+        """Test that a concurrency below 1 is rejected"""
+        with pytest.raises(ValueError):
+            AsyncBloggerClient(concurrency=0)
+
+    def test_single_use_client(self, stub_blogger):
+        """Test the module-level helper without a client"""
+        stub, url = stub_blogger
+        stub.posts = [{'id': '1'}]
+
+        data = asyncio.run(async_get_request(url, return_json=True))
+
+        assert data['items'] == [{'id': '1'}]
+        assert stub.requests[0]['key'] == 'test-key'
@@ -0,0 +1,144 @@
+"""
+Tests for reading compressed and archived backups
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import tarfile
+import zipfile
+
+import pytest
+
+from blogger_api_cli.backup_archive import open_backup, pick_feed_member
+from blogger_api_cli.xml_to_json import xml_entries_to_json
+
+
+FEED = (b'<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        b'<entry><id>tag:blogger.com,1999:blog-1.post-1</id><title>Hello</title>'
+        b'<published>2024-01-01T00:00:00Z</published><updated>2024-01-01T00:00:00Z</updated>'
+        b'<category term="http://schemas.google.com/blogger/2008/kind#post"/></entry></feed>')
+OTHER = b'<?xml version="1.0"?><settings/>'
+
+
+def add_tar_member(archive, name, data):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    archive.addfile(info, io.BytesIO(data))
+
+
+def write_zip(path, members):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members:
+            archive.writestr(name, data)
+
+
+def write_tar(path, members):
+    with tarfile.open(path, 'w:gz') as archive:
+        for name, data in members:
+            add_tar_member(archive, name, data)
+
+
+class TestPickFeedMember:
+    """Test class for pick_feed_member"""
+
+    @pytest.mark.parametrize('members, expected', [
+        ([('Takeout/Blogger/Blogs/My blog/feed.atom', 10), ('Takeout/archive_browser.html', 99)],
+         'Takeout/Blogger/Blogs/My blog/feed.atom'),
+        ([('theme.xml', 500), ('Feed.XML', 10)], 'Feed.XML'),
+        ([('blog-01-01-2024.xml', 900), ('theme.xml', 500), ('notes.txt', 9999)], 'blog-01-01-2024.xml'),
+    ])
+    def test_prefers_feed_then_largest(self, members, expected):
+        """Test that a member called 'feed' wins, otherwise the largest XML/Atom member"""
+        assert pick_feed_member(members) == expected
+
+    def test_no_feed(self):
+        """Test that an archive without XML members is rejected"""
+        with pytest.raises(ValueError):
+            pick_feed_member([('index.html', 10)])
+
+
+class TestOpenBackup:
+    """Test class for open_backup"""
+
+    @pytest.mark.parametrize('name, opener', [
+        ('blog.xml.gz', gzip.open),
+        ('blog.xml.bz2', bz2.open),
+        ('blog.atom.xz', lzma.open),
+    ])
+    def test_compressed_feed(self, tmp_path, name, opener):
+        """Test that compressed feeds are decompressed as a stream"""
+        path = tmp_path / name
+        with opener(path, 'wb') as f:
+            f.write(FEED)
+
+        with open_backup(str(path)) as stream:
+            assert stream.read() == FEED
+
+    def test_zip(self, tmp_path, capsys):
+        """Test that the feed is read from a Takeout zip"""
+        path = tmp_path / 'takeout.zip'
+        write_zip(path, [('Takeout/Blogger/Blogs/b/theme.xml', OTHER * 10),
+                         ('Takeout/Blogger/Blogs/b/feed.atom', FEED)])
+
+        with open_backup(str(path)) as stream:
+            assert stream.read() == FEED
+        assert 'Reading Takeout/Blogger/Blogs/b/feed.atom' in capsys.readouterr().out
+
+    @pytest.mark.parametrize('members', [
+        [('b/theme.xml', OTHER), ('b/feed.atom', FEED), ('b/other.xml', OTHER)],
+        # Without a 'feed' member the largest one is picked in a second pass
+        [('b/theme.xml', OTHER), ('b/blog-2024.xml', FEED)],
+    ])
+    def test_tar(self, tmp_path, members):
+        """Test that the feed is read from a gzipped tar"""
+        path = tmp_path / 'takeout.tgz'
+        write_tar(path, members)
+
+        with open_backup(str(path)) as stream:
+            assert stream.read() == FEED
+
+    def test_archive_without_feed(self, tmp_path):
+        """Test that an archive without a feed raises ValueError"""
+        path = tmp_path / 'takeout.zip'
+        write_zip(path, [('index.html', b'<html/>')])
+
+        with pytest.raises(ValueError):
+            with open_backup(str(path)):
+                pass
+
+
+class TestCorruptBackup:
+    """Test class for converting damaged backups"""
+
+    @pytest.mark.parametrize('name', ['blog.xml.gz', 'blog.xml.bz2', 'blog.xml.xz', 'takeout.zip', 'takeout.tgz'])
+    def test_truncated_archive_reported(self, tmp_path, capsys, name):
+        """Test that a cut-off download prints an error instead of raising"""
+        path = tmp_path / name
+        content = b'Lorem ipsum dolor sit amet ' * 5000
+        feed = FEED.replace(b'</feed>', b'<entry><content>' + content + b'</content></entry></feed>')
+        if name.endswith('.zip'):
+            write_zip(path, [('feed.atom', feed)])
+        elif name.endswith('.tgz'):
+            write_tar(path, [('feed.atom', feed)])
+        else:
+            opener = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}[path.suffix]
+            with opener(path, 'wb') as f:
+                f.write(feed)
+        data = path.read_bytes()
+        path.write_bytes(data[:len(data) // 2])
+
+        xml_entries_to_json(str(path), str(tmp_path / 'posts.json'), str(tmp_path / 'pages.json'))
+
+        assert f'Failed to read {path}' in capsys.readouterr().out
+        assert not (tmp_path / 'posts.json').exists()
+
+    def test_corrupt_data_reported(self, tmp_path, capsys):
+        """Test that a file that is not gzip data prints an error instead of raising"""
+        path = tmp_path / 'blog.xml.gz'
+        path.write_bytes(b'not gzip at all')
+
+        xml_entries_to_json(str(path), str(tmp_path / 'posts.json'), str(tmp_path / 'pages.json'))
+
+        assert f'Failed to read {path}' in capsys.readouterr().out
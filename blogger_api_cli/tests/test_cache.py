@@ -0,0 +1,133 @@
+"""
+Tests for the on-disk response cache
+"""
+
+import os
+
+import requests
+
+from blogger_api_cli.cache import ResponseCache
+
+
+URL = 'https://www.googleapis.com/blogger/v3/blogs/1/posts'
+
+
+def make_response(status=200, etag='"v1"', body='{"items": []}'):
+    response = requests.Response()
+    response.status_code = status
+    if etag:
+        response.headers['ETag'] = etag
+    response.headers['Content-Type'] = 'application/json; charset=UTF-8'
+    response._content = body.encode('utf-8')
+    response.encoding = 'utf-8'
+    response.url = URL
+    return response
+
+
+def cached_pages(cache):
+    return sorted(entry['body'] for entry in
+                  (cache.get(URL, {'pageToken': page}) for page in 'abcd') if entry)
+
+
+class TestResponseCache:
+    """Test class for ResponseCache"""
+
+    def test_key_ignores_api_key_and_param_order(self, tmp_path):
+        """Test that the API key and the order of parameters do not change the cache key"""
+        cache = ResponseCache(str(tmp_path))
+
+        assert cache.make_key(URL, {'a': 1, 'b': 2, 'key': 'x'}) == cache.make_key(URL, {'b': 2, 'a': 1})
+        assert cache.make_key(URL, {'a': 1}) != cache.make_key(URL, {'a': 2})
+
+    def test_store_and_get(self, tmp_path):
+        """Test that a 200 response with an ETag is stored"""
+        cache = ResponseCache(str(tmp_path))
+
+        cache.store(URL, {'key': 'secret'}, make_response())
+
+        entry = cache.get(URL)
+        assert entry['etag'] == '"v1"'
+        assert entry['body'] == '{"items": []}'
+        assert entry['headers'] == {'Content-Type': 'application/json; charset=UTF-8'}
+        assert 'secret' not in (tmp_path / os.listdir(tmp_path)[0]).read_text()
+
+    def test_skips_uncacheable_responses(self, tmp_path):
+        """Test that responses without an ETag or with another status than 200 are not stored"""
+        cache = ResponseCache(str(tmp_path))
+
+        cache.store(URL, {'pageToken': 'a'}, make_response(etag=None))
+        cache.store(URL, {'pageToken': 'b'}, make_response(status=404))
+        cache.store(URL, {'pageToken': 'c'}, make_response(status=206))
+
+        assert os.listdir(tmp_path) == []
+
+    def test_revalidated_builds_200_response(self, tmp_path):
+        """Test that a 304 answer is turned into a 200 response with the cached body"""
+        cache = ResponseCache(str(tmp_path))
+        cache.store(URL, None, make_response(body='{"items": [{"id": "1"}]}'))
+        not_modified = make_response(status=304, etag='"v1"', body='')
+        not_modified.headers['Date'] = 'Wed, 01 Jan 2025 00:00:00 GMT'
+        del not_modified.headers['Content-Type']
+
+        response = cache.revalidated(URL, None, cache.get(URL), not_modified)
+
+        assert response.status_code == 200
+        assert response.json() == {'items': [{'id': '1'}]}
+        assert response.headers['ETag'] == '"v1"'
+        assert response.headers['Content-Type'] == 'application/json; charset=UTF-8'
+        assert response.headers['Date'] == 'Wed, 01 Jan 2025 00:00:00 GMT'
+        assert response.url == URL
+        assert cache.hits == 1
+        assert cache.bytes_saved == len('{"items": [{"id": "1"}]}')
+
+    def test_evicts_least_recently_used_to_low_water(self, tmp_path):
+        """Test that an overflowing store evicts the oldest entries until the cache is at 90% of its cap"""
+        probe = ResponseCache(str(tmp_path / 'probe'))
+        probe.store(URL, {'pageToken': 'a'}, make_response(body='a' * 1000))
+        size = os.path.getsize(os.path.join(probe.cache_dir, os.listdir(probe.cache_dir)[0]))
+        # Room for three entries; the low-water mark only leaves room for two
+        cache = ResponseCache(str(tmp_path / 'cache'), max_bytes=3 * size + 10)
+        for page in 'abc':
+            cache.store(URL, {'pageToken': page}, make_response(body=page * 1000))
+
+        cache.revalidated(URL, {'pageToken': 'a'}, cache.get(URL, {'pageToken': 'a'}), make_response(304))
+        assert cached_pages(cache) == ['a' * 1000, 'b' * 1000, 'c' * 1000]
+        cache.store(URL, {'pageToken': 'd'}, make_response(body='d' * 1000))
+
+        assert cached_pages(cache) == ['a' * 1000, 'd' * 1000]
+        assert cache._total_bytes == 2 * size <= cache.max_bytes * cache.LOW_WATER
+        assert len(os.listdir(cache.cache_dir)) == 2
+
+    def test_lru_order_loaded_from_disk(self, tmp_path):
+        """Test that a new cache instance orders existing entries by their modification time"""
+        cache = ResponseCache(str(tmp_path))
+        for page in 'abc':
+            cache.store(URL, {'pageToken': page}, make_response(body=page * 1000))
+        size = os.path.getsize(os.path.join(tmp_path, os.listdir(tmp_path)[0]))
+        for offset, page in enumerate('bca'):
+            os.utime(tmp_path / f"{cache.make_key(URL, {'pageToken': page})}.json", (1000 + offset, 1000 + offset))
+
+        reopened = ResponseCache(str(tmp_path), max_bytes=3 * size + 10)
+        reopened.store(URL, {'pageToken': 'd'}, make_response(body='d' * 1000))
+
+        assert cached_pages(reopened) == ['a' * 1000, 'd' * 1000]
+
+    def test_restore_replaces_entry_size(self, tmp_path):
+        """Test that storing the same request again does not count its old size twice"""
+        cache = ResponseCache(str(tmp_path))
+
+        cache.store(URL, None, make_response(body='x' * 1000))
+        cache.store(URL, None, make_response(etag='"v2"', body='y'))
+
+        assert cache._total_bytes == os.path.getsize(os.path.join(tmp_path, os.listdir(tmp_path)[0]))
+        assert cache.get(URL)['etag'] == '"v2"'
+
+    def test_clear(self, tmp_path):
+        """Test that clear removes every entry"""
+        cache = ResponseCache(str(tmp_path))
+        cache.store(URL, None, make_response())
+
+        cache.clear()
+
+        assert cache.get(URL) is None
+        assert cache._total_bytes == 0
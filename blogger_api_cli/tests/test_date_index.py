@@ -0,0 +1,122 @@
+"""
+Tests for the date index
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from blogger_api_cli.date_index import DateIndex, date_index_path, parse_date_bound, show_archive, to_epoch
+
+
+def epoch(*args):
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp())
+
+
+POSTS = [
+    {'id': '4', 'published': '2024-03-01T00:00:00Z'},
+    {'id': '1', 'published': '2023-12-31T23:59:59Z'},
+    # Local date is March 2024 even though it is already April in UTC
+    {'id': '5', 'published': '2024-03-31T20:00:00.000-07:00'},
+    {'id': '2', 'published': '2024-01-15T12:00:00.000+01:00'},
+    {'id': '3', 'published': '2024-01-15T12:00:00.000+01:00'},
+    {'id': '6', 'title': 'Draft without a date'},
+]
+
+
+class TestParseDateBound:
+    """Test class for parse_date_bound"""
+
+    @pytest.mark.parametrize('value, end, expected', [
+        ('2024', False, epoch(2024, 1, 1)),
+        ('2024', True, epoch(2025, 1, 1) - 1),
+        ('2024-02', False, epoch(2024, 2, 1)),
+        ('2024-02', True, epoch(2024, 3, 1) - 1),
+        ('2024-12', True, epoch(2025, 1, 1) - 1),
+        ('2024-02-29', True, epoch(2024, 3, 1) - 1),
+        ('2024-02-29T10:00:00Z', True, epoch(2024, 2, 29, 10)),
+        ('2024-02-29T10:00:00', False, epoch(2024, 2, 29, 10)),
+        ('2024-02-29T10:00:00-02:00', False, epoch(2024, 2, 29, 12)),
+    ])
+    def test_bounds(self, value, end, expected):
+        """Test that partial dates cover the whole period and naive timestamps are UTC"""
+        assert parse_date_bound(value, end=end) == expected
+
+    @pytest.mark.parametrize('value', ['yesterday', '2024-13', '2024-02-30', ''])
+    def test_invalid(self, value):
+        """Test that values that are not dates raise ValueError"""
+        with pytest.raises(ValueError):
+            parse_date_bound(value)
+
+    def test_to_epoch(self):
+        """Test that timestamps with an offset are converted to UTC seconds"""
+        assert to_epoch('2025-06-23T10:00:00.000-07:00') == epoch(2025, 6, 23, 17)
+
+
+class TestDateIndex:
+    """Test class for DateIndex"""
+
+    def test_between(self):
+        """Test that both ends of a range are inclusive and open ends are unbounded"""
+        index = DateIndex.build(POSTS)
+
+        assert index.count == 5
+        assert index.between() == ['1', '2', '3', '4', '5']
+        assert index.between(epoch(2024, 1, 15, 11), epoch(2024, 3, 1)) == ['2', '3', '4']
+        assert index.between(epoch(2024, 1, 15, 11) + 1, epoch(2024, 3, 1) - 1) == []
+        assert index.between(start=epoch(2024, 3, 1)) == ['4', '5']
+        assert index.between(end=epoch(2023, 12, 31, 23, 59, 59)) == ['1']
+        assert index.between(epoch(2030, 1, 1)) == []
+
+    def test_between_date_bounds(self):
+        """Test a query with bounds as given on the command line"""
+        index = DateIndex.build(POSTS)
+
+        assert index.between(parse_date_bound('2024-01'), parse_date_bound('2024-03', end=True)) == ['2', '3', '4']
+        assert index.between(parse_date_bound('2024')) == ['2', '3', '4', '5']
+
+    def test_archive(self):
+        """Test that archive buckets follow the local date of the published timestamp"""
+        archive = DateIndex.build(POSTS).archive()
+
+        assert archive == [
+            {'year': 2023, 'count': 1, 'months': [{'month': 12, 'count': 1, 'posts': ['1']}]},
+            {'year': 2024, 'count': 4, 'months': [
+                {'month': 1, 'count': 2, 'posts': ['2', '3']},
+                {'month': 3, 'count': 2, 'posts': ['4', '5']},
+            ]},
+        ]
+
+    def test_add_after_query(self):
+        """Test that posts added after a query are included in the next one"""
+        index = DateIndex.build(POSTS[:2])
+        assert index.between() == ['1', '4']
+
+        index.add({'id': '0', 'published': '2020-01-01T00:00:00Z'})
+
+        assert index.between() == ['0', '1', '4']
+
+    def test_save_load_round_trip(self, tmp_path):
+        """Test that a saved index loads back with the same archive and ranges"""
+        path = date_index_path(str(tmp_path / 'posts.json'))
+        index = DateIndex.build(POSTS)
+
+        index.save(path)
+        loaded = DateIndex.load(path)
+
+        assert path == str(tmp_path / 'posts.dates.json')
+        assert loaded.to_dict() == index.to_dict()
+        assert loaded.between(epoch(2024, 3, 1)) == ['4', '5']
+
+    def test_show_archive(self, tmp_path, capsys):
+        """Test the archive and range listings printed by the CLI"""
+        posts_path = str(tmp_path / 'posts.json')
+        DateIndex.build(POSTS).save(date_index_path(posts_path))
+
+        assert show_archive(posts_path)
+        assert capsys.readouterr().out.splitlines() == ['2024 (4)', '  2024-03 (2)', '  2024-01 (2)',
+                                                         '2023 (1)', '  2023-12 (1)']
+        assert show_archive(posts_path, since='2024-01', until='2024-01')
+        assert capsys.readouterr().out.splitlines()[1:] == ['2', '3']
+        assert not show_archive(posts_path, since='someday')
+        assert not show_archive(str(tmp_path / 'missing.json'))
@@ -0,0 +1,114 @@
+"""
+Tests for paginated and sharded list exports
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from blogger_api_cli.export_search import (ExportError, date_windows, iter_list_pages,
+                                           sharded_list_export, stream_list_export)
+from blogger_api_cli.incremental import read_export_items
+
+from conftest import make_posts
+
+
+NEWEST = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class TestIterListPages:
+    """Test class for iter_list_pages"""
+
+    def test_follows_page_tokens(self, stub_blogger):
+        """Test that every page is requested with the previous page's token"""
+        stub, url = stub_blogger
+        stub.posts = make_posts(25, NEWEST, timedelta(hours=1))
+
+        pages = list(iter_list_pages(url, {'status': 'LIVE'}, page_size=10))
+
+        assert [len(page['items']) for page in pages] == [10, 10, 5]
+        assert [item['id'] for page in pages for item in page['items']] == [post['id'] for post in stub.posts]
+        assert [request.get('pageToken') for request in stub.requests] == [None, '10', '20']
+        assert all(request['status'] == 'LIVE' and request['maxResults'] == '10' for request in stub.requests)
+
+    def test_projection_keeps_page_token(self, stub_blogger):
+        """Test that a fields projection still asks for nextPageToken"""
+        stub, url = stub_blogger
+        stub.posts = make_posts(3, NEWEST, timedelta(hours=1))
+
+        list(iter_list_pages(url, {'fields': 'items(id)'}, page_size=2))
+
+        assert stub.requests[0]['fields'] == 'nextPageToken,items(id)'
+        assert len(stub.requests) == 2
+
+    def test_failed_page_raises(self, stub_blogger):
+        """Test that a page that cannot be fetched raises ExportError"""
+        stub, url = stub_blogger
+
+        with pytest.raises(ExportError):
+            list(iter_list_pages(url.replace('/posts', '/missing')))
+
+
+class TestDateWindows:
+    """Test class for date_windows"""
+
+    def test_windows_cover_range_newest_first(self):
+        """Test that the windows are contiguous and the last one is clipped to the start"""
+        start = NEWEST - timedelta(days=25)
+
+        windows = date_windows(start, NEWEST, 10)
+
+        assert windows == [
+            (NEWEST - timedelta(days=10), NEWEST),
+            (NEWEST - timedelta(days=20), NEWEST - timedelta(days=10)),
+            (start, NEWEST - timedelta(days=20)),
+        ]
+
+    def test_rejects_non_positive_days(self):
+        """Test that a window length below one day is rejected"""
+        with pytest.raises(ValueError):
+            date_windows(NEWEST - timedelta(days=1), NEWEST, 0)
+
+
+class TestShardedListExport:
+    """Test class for sharded_list_export"""
+
+    @pytest.mark.parametrize('output_format', ['json', 'jsonl'])
+    def test_matches_sequential_export(self, stub_blogger, tmp_path, output_format):
+        """Test that a sharded export writes the same file as a sequential one"""
+        stub, url = stub_blogger
+        # Every 7 hours over about 200 days: every 24th post falls on a window boundary and
+        # some lie outside the covered range
+        stub.posts = make_posts(700, NEWEST + timedelta(hours=70), timedelta(hours=7))
+        sequential_path = tmp_path / f'sequential.{output_format}'
+        sharded_path = tmp_path / f'sharded.{output_format}'
+
+        sequential = stream_list_export(url, {}, str(sequential_path), output_format,
+                                        'blogger#postList', 'posts')
+        sharded = sharded_list_export(url, {}, str(sharded_path), output_format,
+                                      'blogger#postList', 'posts',
+                                      start=NEWEST - timedelta(days=180), end=NEWEST,
+                                      shard_days=7, workers=4)
+
+        assert sharded == sequential == 700
+        assert sharded_path.read_bytes() == sequential_path.read_bytes()
+
+    def test_windows_split_the_range(self, stub_blogger, tmp_path):
+        """Test that each window only asks for its own dates and the outer ones are open-ended"""
+        stub, url = stub_blogger
+        stub.posts = make_posts(50, NEWEST, timedelta(days=1))
+        output_path = tmp_path / 'posts.jsonl'
+
+        sharded_list_export(url, {}, str(output_path), 'jsonl', 'blogger#postList', 'posts',
+                            start=NEWEST - timedelta(days=30), end=NEWEST, shard_days=10, workers=2)
+
+        bounds = {(request.get('startDate'), request.get('endDate')) for request in stub.requests}
+        assert bounds == {
+            (None, '2023-12-12T00:00:00Z'),
+            ('2023-12-12T00:00:00Z', '2023-12-22T00:00:00Z'),
+            ('2023-12-22T00:00:00Z', None),
+        }
+        items = list(read_export_items(str(output_path), 'jsonl'))
+        assert [item['id'] for item in items] == [post['id'] for post in stub.posts]
+        assert len({json.dumps(item) for item in items}) == 50
@@ -0,0 +1,67 @@
+"""
+Tests for incremental export merging
+"""
+
+import json
+
+import pytest
+
+from blogger_api_cli.export_writers import open_export_writer
+from blogger_api_cli.incremental import merge_export, read_export_items
+
+
+def write_export(path, output_format, items):
+    with open_export_writer(str(path), output_format, kind='blogger#postList') as writer:
+        for item in items:
+            writer.write(item)
+
+
+class TestMergeExport:
+    """Test class for merge_export"""
+
+    @pytest.mark.parametrize('output_format', ['json', 'jsonl'])
+    def test_merges_changed_items(self, tmp_path, output_format):
+        """Test that new items come first and updated items replace theirs in place"""
+        path = tmp_path / f'posts.{output_format}'
+        write_export(path, output_format, [
+            {'id': '3', 'title': 'Third'},
+            {'id': '2', 'title': 'Second'},
+            {'id': '1', 'title': 'First'},
+        ])
+        changed = [
+            {'id': '5', 'title': 'Fifth'},
+            {'id': '2', 'title': 'Second, edited'},
+            {'id': '4', 'title': 'Fourth'},
+        ]
+
+        counts = merge_export(str(path), output_format, 'blogger#postList', changed, {'1', '2', '3'})
+
+        assert counts == {'added': 2, 'updated': 1, 'total': 5}
+        assert list(read_export_items(str(path), output_format)) == [
+            {'id': '5', 'title': 'Fifth'},
+            {'id': '4', 'title': 'Fourth'},
+            {'id': '3', 'title': 'Third'},
+            {'id': '2', 'title': 'Second, edited'},
+            {'id': '1', 'title': 'First'},
+        ]
+
+    def test_keeps_list_kind(self, tmp_path):
+        """Test that a merged JSON export keeps its list wrapper"""
+        path = tmp_path / 'posts.json'
+        write_export(path, 'json', [{'id': '1'}])
+
+        merge_export(str(path), 'json', 'blogger#postList', [{'id': '2'}], {'1'})
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        assert data['kind'] == 'blogger#postList'
+        assert [item['id'] for item in data['items']] == ['2', '1']
+
+    def test_duplicate_new_item_written_once(self, tmp_path):
+        """Test that a new item listed twice in the changes is added once"""
+        path = tmp_path / 'posts.jsonl'
+        write_export(path, 'jsonl', [{'id': '1'}])
+
+        counts = merge_export(str(path), 'jsonl', 'blogger#postList', [{'id': '2'}, {'id': '2'}], {'1'})
+
+        assert counts == {'added': 1, 'updated': 0, 'total': 2}
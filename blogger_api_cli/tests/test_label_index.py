@@ -0,0 +1,84 @@
+"""
+Tests for the label index
+"""
+
+import json
+
+from blogger_api_cli.label_index import LabelIndex, label_index_path
+
+
+POSTS = [
+    {'id': '10', 'labels': ['python', 'web']},
+    {'id': '2', 'labels': ['python', 'python']},
+    {'id': 'tag:blogger.com,1999:blog-1.post-3',
+     'categories': [{'term': 'web', 'scheme': 'http://www.blogger.com/atom/ns#'}, {'term': 'python'}]},
+    {'id': '4', 'labels': []},
+    {'id': '5'},
+]
+
+
+class TestLabelIndex:
+    """Test class for LabelIndex"""
+
+    def test_label_ids_in_first_seen_order(self):
+        """Test that labels get IDs in the order they are first seen, once per post"""
+        index = LabelIndex()
+
+        assert index.add(POSTS[0]) == [0, 1]
+        assert index.add(POSTS[1]) == [0]
+        assert index.add(POSTS[2]) == [1, 0]
+        assert index.names == ['python', 'web']
+
+    def test_posts_with(self):
+        """Test that a label lists each post carrying it once, in numeric ID order"""
+        index = LabelIndex.build(POSTS)
+
+        assert index.posts_with('python') == ['2', 'tag:blogger.com,1999:blog-1.post-3', '10']
+        assert index.posts_with('web') == ['tag:blogger.com,1999:blog-1.post-3', '10']
+        assert index.posts_with('missing') == []
+
+    def test_posts_with_all(self):
+        """Test that combining labels returns the posts carrying every one of them"""
+        index = LabelIndex.build(POSTS)
+
+        assert index.posts_with_all(['python', 'web']) == ['tag:blogger.com,1999:blog-1.post-3', '10']
+        assert index.posts_with_all(['python', 'missing']) == []
+        assert index.posts_with_all([]) == []
+
+    def test_to_dict_counts_posts_once(self):
+        """Test that a repeated label on one post is counted once"""
+        data = LabelIndex.build(POSTS).to_dict()
+
+        assert data['count'] == 2
+        assert data['labels'][0] == {'id': 0, 'name': 'python', 'count': 3,
+                                     'posts': ['2', 'tag:blogger.com,1999:blog-1.post-3', '10']}
+
+    def test_save_load_round_trip(self, tmp_path):
+        """Test that a saved index loads back with the same IDs and posts"""
+        path = label_index_path(str(tmp_path / 'posts.json'))
+        index = LabelIndex.build(POSTS + [{'id': '6', 'labels': ['café']}])
+
+        index.save(path, ensure_ascii=False)
+        loaded = LabelIndex.load(path)
+
+        assert path == str(tmp_path / 'posts.labels.json')
+        assert loaded.names == ['python', 'web', 'café']
+        assert loaded.to_dict() == index.to_dict()
+        assert loaded.posts_with('café') == ['6']
+        assert loaded.label_id('new') == 3
+
+    def test_load_missing_or_corrupt(self, tmp_path):
+        """Test that a missing or unreadable index loads as None"""
+        path = tmp_path / 'posts.labels.json'
+        assert LabelIndex.load(str(path)) is None
+
+        path.write_text('{"labels": [')
+
+        assert LabelIndex.load(str(path)) is None
+
+    def test_dumps_is_compact_json(self):
+        """Test the serialized form written next to exports"""
+        text = LabelIndex.build(POSTS[:1]).dumps()
+
+        assert ' ' not in text
+        assert json.loads(text)['version'] == 1
@@ -0,0 +1,45 @@
+"""
+Tests for command line argument parsing
+"""
+
+import pytest
+
+from blogger_api_cli.main import parse_arguments
+
+
+def parse(monkeypatch, *argv):
+    monkeypatch.setattr('sys.argv', ['blogger_api_cli', *argv])
+    return parse_arguments()
+
+
+class TestParseArguments:
+    """Test class for parse_arguments"""
+
+    @pytest.mark.parametrize('argv, name, expected', [
+        (['-x', '-j', '0'], 'jobs', 0),
+        (['-x', '-j', '4'], 'jobs', 4),
+        (['-x'], 'jobs', 1),
+        (['-x', '--chunk-size', '1'], 'chunk_size', 1),
+        (['-x'], 'chunk_size', None),
+        (['--export-posts', '--shard-days', '30', '--workers', '8'], 'shard_days', 30),
+        (['--export-posts', '--shard-days', '30', '--workers', '8'], 'concurrency', 8),
+    ])
+    def test_numeric_options(self, monkeypatch, argv, name, expected):
+        """Test the accepted values of the numeric options"""
+        assert getattr(parse(monkeypatch, *argv), name) == expected
+
+    @pytest.mark.parametrize('argv, message', [
+        (['-x', '-j', '-3'], 'must be at least 0, got -3'),
+        (['-x', '-j', 'many'], "invalid int value: 'many'"),
+        (['-x', '--chunk-size', '0'], 'must be at least 1, got 0'),
+        (['-x', '--chunk-size', '-5'], 'must be at least 1, got -5'),
+        (['--export-posts', '--shard-days', '0'], 'must be at least 1, got 0'),
+        (['--export-posts', '--concurrency', '-1'], 'must be at least 1, got -1'),
+    ])
+    def test_invalid_numbers_rejected(self, monkeypatch, capsys, argv, message):
+        """Test that out-of-range values are rejected by the parser instead of reaching the commands"""
+        with pytest.raises(SystemExit) as exc_info:
+            parse(monkeypatch, *argv)
+
+        assert exc_info.value.code == 2
+        assert message in capsys.readouterr().err
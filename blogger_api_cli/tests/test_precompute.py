@@ -0,0 +1,124 @@
+"""
+Tests for the content precomputation stage
+"""
+
+import json
+
+import pytest
+
+from blogger_api_cli.precompute import (EXCERPT_LENGTH, analyze_content, content_path, iter_content,
+                                        make_excerpt, precompute_content)
+
+
+def write_posts(path, count):
+    posts = [{
+        'id': str(i),
+        'title': f'Post {i}',
+        'content': (f'<p>Post {i} says <b>hello</b> world.</p><script>var x = 1;</script>'
+                    f'<img src="https://example.com/{i}.png"><p>' + 'word ' * (i * 40) + '</p>'),
+    } for i in range(count)]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(posts, f)
+
+
+class TestMakeExcerpt:
+    """Test class for make_excerpt"""
+
+    def test_matches_card_length(self):
+        """Test that the excerpt length is the 150 characters BlogPostCard.vue truncates to"""
+        assert EXCERPT_LENGTH == 150
+
+    def test_short_text_unchanged(self):
+        """Test that text of up to 150 characters is returned as is, like the card"""
+        text = 'a' * 150
+        assert make_excerpt(text) == text
+
+    def test_long_text_cut_at_word_boundary(self):
+        """Test that longer text is cut at a word within 150 characters and gets an ellipsis"""
+        text = ' '.join(['lorem'] * 40)
+
+        excerpt = make_excerpt(text)
+
+        assert excerpt.endswith('…')
+        assert len(excerpt) <= EXCERPT_LENGTH + 1
+        assert text.startswith(excerpt[:-1])
+        assert excerpt[:-1].split(' ')[-1] == 'lorem'
+
+    def test_trailing_punctuation_dropped(self):
+        """Test that punctuation before the cut is not left dangling"""
+        text = 'word, ' * 40
+
+        assert make_excerpt(text).endswith('word…')
+
+
+class TestAnalyzeContent:
+    """Test class for analyze_content"""
+
+    def test_extracts_text_images_and_reading_time(self):
+        """Test the fields derived from a post's HTML"""
+        html = ('<h1>Title</h1><p>Some&nbsp;<em>text</em> here</p><style>p {}</style>'
+                '<img src="a.png"><img src="b.png"><img src="a.png">' + '<p>word</p>' * 200)
+
+        result = analyze_content(html)
+
+        assert result['text'].startswith('Title Some text here word word')
+        assert result['words'] == 204
+        assert result['readingMinutes'] == 2
+        assert result['firstImage'] == 'a.png'
+        assert result['images'] == ['a.png', 'b.png']
+        assert result['excerpt'] == make_excerpt(result['text'])
+
+    def test_empty_content(self):
+        """Test a post without content"""
+        assert analyze_content(None) == {'excerpt': '', 'text': '', 'words': 0, 'readingMinutes': 0,
+                                         'firstImage': None, 'images': []}
+
+
+class TestPrecomputeContent:
+    """Test class for precompute_content"""
+
+    def test_content_path(self, tmp_path):
+        """Test where the output goes for file and split exports"""
+        assert content_path('out/posts.json') == 'out/posts.content.jsonl'
+        assert content_path(str(tmp_path)) == str(tmp_path / 'content.jsonl')
+
+    @pytest.mark.parametrize('jobs', [1, 2])
+    def test_writes_one_record_per_post(self, tmp_path, jobs):
+        """Test the records written by a serial and a parallel run"""
+        posts_path = tmp_path / 'posts.json'
+        write_posts(posts_path, 30)
+
+        assert precompute_content(str(posts_path), jobs=jobs)
+
+        records = list(iter_content(content_path(str(posts_path))))
+        assert [record['id'] for record in records] == [str(i) for i in range(30)]
+        assert records[0]['firstImage'] == 'https://example.com/0.png'
+        assert 'var x' not in records[0]['text']
+        assert records[5]['words'] == 5 + 200
+
+    def test_parallel_output_matches_serial(self, tmp_path):
+        """Test that -j 2 writes the same file as a serial run"""
+        posts_path = tmp_path / 'posts.json'
+        write_posts(posts_path, 30)
+
+        precompute_content(str(posts_path), output_path=str(tmp_path / 'serial.jsonl'), jobs=1)
+        precompute_content(str(posts_path), output_path=str(tmp_path / 'parallel.jsonl'), jobs=2)
+
+        assert (tmp_path / 'serial.jsonl').read_bytes() == (tmp_path / 'parallel.jsonl').read_bytes()
+
+    def test_unchanged_posts_reused(self, tmp_path, capsys):
+        """Test that a second run only parses posts whose content changed"""
+        posts_path = tmp_path / 'posts.json'
+        write_posts(posts_path, 30)
+        precompute_content(str(posts_path))
+        with open(posts_path, 'r', encoding='utf-8') as f:
+            posts = json.load(f)
+        posts[3]['content'] = '<p>Rewritten</p>'
+        with open(posts_path, 'w', encoding='utf-8') as f:
+            json.dump(posts, f)
+        capsys.readouterr()
+
+        precompute_content(str(posts_path))
+
+        assert '(1 parsed, 29 unchanged)' in capsys.readouterr().out
+        assert list(iter_content(content_path(str(posts_path))))[3]['text'] == 'Rewritten'
@@ -0,0 +1,45 @@
+"""
+Tests for request logging
+"""
+
+import json
+
+from blogger_api_cli.api import BloggerTransport, RetryPolicy, get_request
+from blogger_api_cli.request_log import RequestLogger
+
+
+class TestRequestLogger:
+    """Test class for RequestLogger"""
+
+    def test_logs_go_to_stderr(self, stub_blogger, capsys):
+        """Test that JSON Lines logs can be parsed from stderr while stdout stays clean"""
+        stub, url = stub_blogger
+        stub.posts = [{'id': '1'}]
+        transport = BloggerTransport(retry_policy=RetryPolicy(max_retries=0),
+                                     logger=RequestLogger(level='full', log_format='jsonl'))
+        transport.session.trust_env = False
+
+        with transport:
+            get_request(url, params={'maxResults': 1}, transport=transport)
+            get_request(url.replace('/posts', '/missing'), transport=transport)
+            transport.logger.log_stats(transport.stats)
+
+        captured = capsys.readouterr()
+        assert captured.out == ''
+        records = [json.loads(line) for line in captured.err.splitlines()]
+        assert [record['event'] for record in records] == ['response', 'response', 'stats']
+        assert [record['status'] for record in records[:2]] == [200, 404]
+        assert records[0]['params'] == {'key': '***', 'maxResults': 1}
+        assert records[0]['body']['items'] == [{'id': '1'}]
+        assert records[2]['requests'] == 2
+
+    def test_summary_text(self, capsys):
+        """Test that the summary level skips request details and reports errors on stderr"""
+        logger = RequestLogger(level='summary')
+
+        logger.log_request('GET', 'https://example.com/posts', {'key': 'secret'})
+        logger.log_error('GET', 'https://example.com/posts', OSError('unreachable'))
+
+        err = capsys.readouterr().err
+        assert 'secret' not in err
+        assert err.startswith('An error occurred during the request: unreachable')
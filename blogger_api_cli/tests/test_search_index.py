@@ -0,0 +1,136 @@
+"""
+Tests for the offline search index
+"""
+
+import json
+import math
+
+import pytest
+
+from blogger_api_cli.search_index import (TITLE_WEIGHT, SearchIndex, build_search_index, search_offline,
+                                          tokenize)
+
+
+POSTS = [
+    {'id': '1', 'title': 'Gardening notes', 'content': '<p>Tomatoes need sun. Python is a snake.</p>',
+     'url': 'https://example.com/1', 'published': '2024-01-01T00:00:00Z'},
+    {'id': '2', 'title': 'Python tips', 'content': '<p>Short notes on list comprehensions.</p>',
+     'url': 'https://example.com/2', 'published': '2024-02-01T00:00:00Z'},
+    {'id': '3', 'title': 'Travel', 'content': '<p>Trains, buses and ferries.</p>',
+     'url': 'https://example.com/3', 'published': '2024-03-01T00:00:00Z'},
+]
+
+
+class TestSearchIndex:
+    """Test class for SearchIndex"""
+
+    def test_tokenize(self):
+        """Test that tokens are lowercase words, including non-ASCII letters"""
+        assert tokenize('Café, CAFÉ and naïve-words_1!') == ['café', 'café', 'and', 'naïve', 'words_1']
+
+    def test_title_counts_three_times(self):
+        """Test that title words are weighted by TITLE_WEIGHT in term frequency and length"""
+        index = SearchIndex.build(POSTS[1:2])
+
+        assert TITLE_WEIGHT == 3
+        assert index.lengths == [5 + 2 * TITLE_WEIGHT]
+        assert index.postings['python'] == [0, TITLE_WEIGHT]
+        assert index.postings['notes'] == [0, 1]
+
+    def test_title_match_ranks_above_body_match(self):
+        """Test that a post with the query in its title outranks one mentioning it in the body"""
+        index = SearchIndex.build(POSTS)
+
+        results = index.search('python')
+
+        assert [result['id'] for result in results] == ['2', '1']
+        assert results[0]['score'] > results[1]['score'] > 0
+        assert results[0]['url'] == 'https://example.com/2'
+
+    def test_bm25_score(self):
+        """Test the score against the Okapi BM25 formula"""
+        index = SearchIndex.build(POSTS)
+        k1, b = index.k1, index.b
+        average_length = sum(index.lengths) / 3
+        idf = math.log(1 + (3 - 1 + 0.5) / (1 + 0.5))
+        frequency, length = 1, index.lengths[2]
+        expected = idf * frequency * (k1 + 1) / (frequency + k1 * (1 - b + b * length / average_length))
+
+        assert index.search('ferries')[0]['score'] == round(expected, 4)
+
+    def test_terms_add_up_and_limit(self):
+        """Test that scores of several query terms add up and results are capped at the limit"""
+        index = SearchIndex.build(POSTS)
+
+        both = index.search('notes python')
+        single = index.search('python')
+
+        assert [result['id'] for result in both] == ['2', '1']
+        assert both[0]['score'] > single[0]['score']
+        assert len(index.search('notes python', limit=1)) == 1
+        assert index.search('submarine') == []
+        assert index.search('') == []
+
+    def test_snippet(self):
+        """Test that the snippet is a window around the first matching term with ellipses"""
+        text = ' '.join(f'w{i}' for i in range(100)) + ' needle ' + ' '.join(f'x{i}' for i in range(100))
+        index = SearchIndex()
+        index.add_post({'id': '1', 'title': ''}, text=text)
+
+        snippet = index.snippet(0, ['needle'], width=60)
+
+        assert snippet.startswith('...') and snippet.endswith('...')
+        assert 'needle' in snippet
+        assert len(snippet) <= 60 + 6
+        assert index.snippet(0, ['absent'], width=20) == text[:20].strip() + '...'
+
+    def test_snippet_matches_whole_words(self):
+        """Test that a term inside a longer word is not taken as the match"""
+        index = SearchIndex()
+        index.add_post({'id': '1'}, text='snakes everywhere ' * 20 + 'a snake')
+
+        assert index.snippet(0, ['snake'], width=20) == '...ere a snake'
+
+    def test_save_load_round_trip(self, tmp_path):
+        """Test that an index read back from JSON answers queries the same way"""
+        path = tmp_path / 'index' / 'search.json'
+        index = SearchIndex.build(POSTS)
+
+        index.save(str(path))
+        loaded = SearchIndex.load(str(path))
+
+        assert json.loads(path.read_text(encoding='utf-8'))['version'] == 1
+        assert loaded.docs == index.docs
+        assert loaded.postings == index.postings
+        assert loaded.search('notes python') == index.search('notes python')
+
+    def test_load_rejects_other_versions(self, tmp_path):
+        """Test that an index written by an incompatible version is refused"""
+        path = tmp_path / 'search.json'
+        path.write_text('{"version": 99}')
+
+        with pytest.raises(ValueError):
+            SearchIndex.load(str(path))
+
+
+class TestOfflineSearch:
+    """Test class for build_search_index and search_offline"""
+
+    def test_build_and_search(self, tmp_path, capsys):
+        """Test building the index from an export and printing ranked results"""
+        posts_path = tmp_path / 'posts.json'
+        posts_path.write_text(json.dumps(POSTS))
+        index_path = str(tmp_path / 'search.json')
+
+        assert build_search_index(str(posts_path), index_path)
+        assert search_offline(index_path, 'python')
+
+        out = capsys.readouterr().out
+        assert 'Indexed 3 posts' in out
+        assert out.index('Title: Python tips') < out.index('Title: Gardening notes')
+
+    def test_missing_files(self, tmp_path, capsys):
+        """Test that missing exports and indexes are reported"""
+        assert not build_search_index(str(tmp_path / 'posts.json'), str(tmp_path / 'search.json'))
+        assert not search_offline(str(tmp_path / 'search.json'), 'python')
+        assert 'Build it first with --build-index.' in capsys.readouterr().out
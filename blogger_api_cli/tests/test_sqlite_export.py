@@ -0,0 +1,130 @@
+"""
+Tests for loading converted backups into SQLite
+"""
+
+import json
+import sqlite3
+
+from blogger_api_cli.sqlite_export import import_converted
+
+
+def converted_post(number, title, labels=(), draft=False):
+    return {
+        'id': f'tag:blogger.com,1999:blog-1.post-{number}',
+        'title': title,
+        'content': f'<p>{title} body</p>',
+        'published': f'2024-01-0{number}T10:00:00.000Z',
+        'updated': f'2024-01-0{number}T10:00:00.000Z',
+        'categories': [{'scheme': 'http://www.blogger.com/atom/ns#', 'term': label} for label in labels],
+        'links': [{'rel': 'alternate', 'href': f'https://example.blogspot.com/{number}.html'}],
+        'author': {'name': 'Author'},
+        'draft': draft,
+    }
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+class TestImportConverted:
+    """Test class for import_converted"""
+
+    def test_loads_posts_pages_and_comments(self, tmp_path):
+        """Test that converted entries are stored under their numeric IDs"""
+        write_json(tmp_path / 'posts.json', [
+            converted_post(1, 'Hello world', labels=['news', 'python']),
+            converted_post(2, 'Draft post', draft=True),
+        ])
+        write_json(tmp_path / 'pages.json', [{'id': 'tag:blogger.com,1999:blog-1.page-7', 'title': 'About',
+                                              'content': 'About me', 'updated': '2024-01-01T00:00:00Z'}])
+        comment = {'id': 'tag:blogger.com,1999:blog-1.post-1.comment-9', 'content': 'Nice',
+                   'author': {'name': 'Reader'}, 'updated': '2024-01-02T00:00:00Z'}
+        with open(tmp_path / 'comments.jsonl', 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'postId': 'tag:blogger.com,1999:blog-1.post-1', 'comments': [comment]}) + '\n')
+            f.write(json.dumps({'postId': 'tag:blogger.com,1999:blog-1.post-5', 'comments': [comment]}) + '\n')
+        db_path = tmp_path / 'blog.db'
+
+        assert import_converted(str(tmp_path / 'posts.json'), str(tmp_path / 'pages.json'),
+                                str(tmp_path / 'comments.jsonl'), str(db_path))
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute('SELECT id, status, url FROM posts ORDER BY id').fetchall() == [
+            ('1', 'LIVE', 'https://example.blogspot.com/1.html'),
+            ('2', 'DRAFT', 'https://example.blogspot.com/2.html'),
+        ]
+        assert conn.execute('SELECT id, title FROM pages').fetchall() == [('7', 'About')]
+        assert conn.execute('SELECT id, post_id, author FROM comments').fetchall() == [('9', '1', 'Reader')]
+        assert conn.execute('SELECT l.name FROM post_labels pl JOIN labels l ON l.id = pl.label_id '
+                            'WHERE pl.post_id = ? ORDER BY l.name', ('1',)).fetchall() == [('news',), ('python',)]
+        assert conn.execute("SELECT rowid FROM posts_fts WHERE posts_fts MATCH 'world'").fetchall() == \
+            conn.execute("SELECT rowid FROM posts WHERE id = '1'").fetchall()
+        conn.close()
+
+    def test_reimport_skips_unchanged_and_prunes_removed(self, tmp_path, capsys):
+        """Test that a second import only writes changes and drops posts gone from the backup"""
+        posts_path = tmp_path / 'posts.json'
+        db_path = tmp_path / 'blog.db'
+        write_json(posts_path, [converted_post(1, 'First'), converted_post(2, 'Second')])
+        import_converted(str(posts_path), output_path=str(db_path))
+        edited = converted_post(1, 'First, edited')
+        edited['updated'] = '2024-02-01T00:00:00.000Z'
+        write_json(posts_path, [edited])
+        capsys.readouterr()
+
+        import_converted(str(posts_path), output_path=str(db_path))
+
+        assert 'Posts: 1 written, 0 unchanged, 1 removed' in capsys.readouterr().out
+        conn = sqlite3.connect(db_path)
+        assert conn.execute('SELECT id, title FROM posts').fetchall() == [('1', 'First, edited')]
+        conn.close()
+
+    def test_reimport_removes_labels_and_comments_of_deleted_posts(self, tmp_path):
+        """Test that a deleted post leaves no label links, unused labels, comments or FTS rows behind"""
+        posts_path = tmp_path / 'posts.json'
+        comments_path = tmp_path / 'comments.jsonl'
+        db_path = tmp_path / 'blog.db'
+        write_json(posts_path, [converted_post(1, 'Kept', labels=['shared']),
+                                converted_post(2, 'Deleted', labels=['shared', 'only-deleted'])])
+        with open(comments_path, 'w', encoding='utf-8') as f:
+            for number in (1, 2):
+                comment = {'id': f'tag:blogger.com,1999:blog-1.post-{number}.comment-{number}0',
+                           'content': 'Nice', 'updated': '2024-01-02T00:00:00Z'}
+                f.write(json.dumps({'postId': f'tag:blogger.com,1999:blog-1.post-{number}',
+                                    'comments': [comment]}) + '\n')
+        import_converted(str(posts_path), comments_path=str(comments_path), output_path=str(db_path))
+        write_json(posts_path, [converted_post(1, 'Kept', labels=['shared'])])
+        with open(comments_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'postId': 'tag:blogger.com,1999:blog-1.post-1', 'comments': []}) + '\n')
+
+        assert import_converted(str(posts_path), comments_path=str(comments_path), output_path=str(db_path))
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute('SELECT name FROM labels').fetchall() == [('shared',)]
+        assert conn.execute('SELECT post_id FROM post_labels').fetchall() == [('1',)]
+        assert conn.execute('SELECT id, post_id FROM comments').fetchall() == [('10', '1')]
+        assert conn.execute("SELECT count(*) FROM posts_fts WHERE posts_fts MATCH 'deleted'").fetchone() == (0,)
+        assert conn.execute('SELECT count(*) FROM posts_fts').fetchone() == (1,)
+        conn.close()
+
+    def test_reimport_reuses_label_after_prune(self, tmp_path):
+        """Test that a label removed by pruning can be added again by a later import"""
+        posts_path = tmp_path / 'posts.json'
+        db_path = tmp_path / 'blog.db'
+        write_json(posts_path, [converted_post(1, 'First', labels=['news'])])
+        import_converted(str(posts_path), output_path=str(db_path))
+        write_json(posts_path, [converted_post(2, 'Second')])
+        import_converted(str(posts_path), output_path=str(db_path))
+        write_json(posts_path, [converted_post(2, 'Second'), converted_post(3, 'Third', labels=['news'])])
+
+        assert import_converted(str(posts_path), output_path=str(db_path))
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute('SELECT pl.post_id, l.name FROM post_labels pl '
+                            'JOIN labels l ON l.id = pl.label_id').fetchall() == [('3', 'news')]
+        conn.close()
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing input file is reported instead of creating a database"""
+        assert not import_converted(str(tmp_path / 'posts.json'), output_path=str(tmp_path / 'blog.db'))
+        assert not (tmp_path / 'blog.db').exists()
@@ -0,0 +1,114 @@
+"""
+Tests for the XML backup conversion
+"""
+
+import json
+import os
+
+import pytest
+
+from blogger_api_cli.xml_to_json import load_post_comments, xml_entries_to_json
+
+
+KIND = 'http://schemas.google.com/blogger/2008/kind#'
+
+
+def entry(entry_id, kind, title, published, content='', labels=(), draft=False, reply_to=None):
+    categories = [f'<category scheme="http://schemas.google.com/g/2005#kind" term="{KIND}{kind}"/>']
+    categories += [f'<category scheme="http://www.blogger.com/atom/ns#" term="{label}"/>' for label in labels]
+    control = '<app:control><app:draft>yes</app:draft></app:control>' if draft else ''
+    reply = f'<thr:in-reply-to ref="{reply_to}" type="text/html"/>' if reply_to else ''
+    return (f'<entry><id>{entry_id}</id><published>{published}</published><updated>{published}</updated>'
+            f'{"".join(categories)}<title type="text">{title}</title>'
+            f'<content type="html">{content}</content>'
+            f'<link rel="alternate" type="text/html" href="https://example.blogspot.com/{entry_id.rsplit("-", 1)[-1]}.html"/>'
+            f'<author><name>Author</name><email>noreply@blogger.com</email></author>'
+            f'{control}{reply}</entry>')
+
+
+def write_backup(path, posts=450):
+    entries = [entry('tag:blogger.com,1999:blog-1.settings.BLOG_NAME', 'settings', 'Settings', '2020-01-01T00:00:00.000Z')]
+    for i in range(posts):
+        post_id = f'tag:blogger.com,1999:blog-1.post-{i}'
+        published = f'2020-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:00:00.000-07:00'
+        entries.append(entry(post_id, 'post', f'Zażółć {i} &amp; more', published,
+                             content=f'&lt;p&gt;Body {i}&lt;/p&gt;', labels=[f'label{i % 5}'],
+                             draft=i % 17 == 0))
+        if i % 3 == 0:
+            entries.append(entry(f'tag:blogger.com,1999:blog-1.post-{i}.comment-{i}', 'comment',
+                                 f'Comment on {i}', published, content='Nice', reply_to=post_id))
+    for i in range(5):
+        entries.append(entry(f'tag:blogger.com,1999:blog-1.page-{i}', 'page', f'Page {i}',
+                             '2021-01-01T00:00:00.000Z', draft=i == 4))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>'
+                '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:app="http://purl.org/atom/app#" '
+                'xmlns:thr="http://purl.org/syndication/thread/1.0">')
+        f.write('\n'.join(entries))
+        f.write('</feed>')
+
+
+def convert(tmp_path, name, backup, jobs, output_format='json'):
+    out = tmp_path / name
+    out.mkdir()
+    xml_entries_to_json(str(backup), str(out / 'posts.json'), str(out / 'pages.json'),
+                        include_drafts=True, jobs=jobs, comments_json_path=str(out / 'comments.jsonl'),
+                        output_format=output_format, chunk_size=100)
+    return out
+
+
+def read_tree(root):
+    files = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as f:
+                files[os.path.relpath(path, root)] = f.read()
+    return files
+
+
+@pytest.fixture(scope='module')
+def backup(tmp_path_factory):
+    """A Blogger backup with posts, drafts, pages, comments and a settings entry"""
+    path = tmp_path_factory.mktemp('backup') / 'blog.xml'
+    write_backup(path)
+    return path
+
+
+class TestXmlEntriesToJson:
+    """Test class for xml_entries_to_json"""
+
+    @pytest.mark.parametrize('output_format', ['json', 'split'])
+    def test_parallel_output_matches_serial(self, tmp_path, backup, output_format):
+        """Test that converting with several jobs writes byte-identical files"""
+        serial = read_tree(convert(tmp_path, 'serial', backup, 1, output_format))
+        parallel = read_tree(convert(tmp_path, 'parallel', backup, 3, output_format))
+
+        assert len(serial) > 3
+        assert parallel.keys() == serial.keys()
+        for name in serial:
+            assert parallel[name] == serial[name], name
+
+    def test_entries_split_by_kind(self, tmp_path, backup):
+        """Test that posts and pages are separated, drafts come last and settings are skipped"""
+        out = convert(tmp_path, 'out', backup, 1)
+
+        with open(out / 'posts.json', 'r', encoding='utf-8') as f:
+            posts = json.load(f)
+        with open(out / 'pages.json', 'r', encoding='utf-8') as f:
+            pages = json.load(f)
+
+        assert len(posts) == 450
+        assert [post['draft'] for post in posts] == [False] * 423 + [True] * 27
+        assert posts[0]['id'] == 'tag:blogger.com,1999:blog-1.post-1'
+        assert posts[0]['title'] == 'Zażółć 1 & more'
+        assert [page['title'] for page in pages] == ['Page 0', 'Page 1', 'Page 2', 'Page 3', 'Page 4']
+
+    def test_comments_grouped_by_post(self, tmp_path, backup):
+        """Test that comments can be read back per post through the offset index"""
+        out = convert(tmp_path, 'out', backup, 2)
+
+        comments = load_post_comments(str(out / 'comments.jsonl'), 'tag:blogger.com,1999:blog-1.post-3')
+
+        assert [comment['title'] for comment in comments] == ['Comment on 3']
+        assert load_post_comments(str(out / 'comments.jsonl'), 'tag:blogger.com,1999:blog-1.post-4') == []
@@ -21,25 +21,38 @@ export const useBlogStore = defineStore('blog', () => {
   const error = ref<string | null>(null);
   const selectedTag = ref<string | null>(null);
 
+  // Label index: tag -> ids of the posts carrying it, rebuilt only when the posts change
+  const labelIndex = computed(() => {
+    const index = new Map<string, Set<number>>();
+    posts.value.forEach(post => {
+      post.tags.forEach(tag => {
+        const ids = index.get(tag);
+        if (ids) {
+          ids.add(post.id);
+        } else {
+          index.set(tag, new Set([post.id]));
+        }
+      });
+    });
+    return index;
+  });
+
+  const postsById = computed(() => new Map(posts.value.map(post => [post.id, post])));
+
   const filteredPosts = computed(() => {
     if (!selectedTag.value) return posts.value;
-    return posts.value.filter(post => post.tags.includes(selectedTag.value!));
+    const ids = labelIndex.value.get(selectedTag.value) ?? new Set<number>();
+    return Array.from(ids, id => postsById.value.get(id)!);
   });
 
-  const allTags = computed(() => {
-    const tagsSet = new Set<string>();
-    posts.value.forEach(post => {
-      post.tags.forEach(tag => tagsSet.add(tag));
-    });
-    return Array.from(tagsSet);
-  });
+  const allTags = computed(() => Array.from(labelIndex.value.keys()));
 
   function filterByTag(tag: string | null) {
     selectedTag.value = tag;
   }
 
   function getPostById(id: number): BlogPost | undefined {
-    return posts.value.find(post => post.id === id);
+    return postsById.value.get(id);
   }
 
   async function fetchPosts() {